@@ -1,103 +1,74 @@
 """
 Analýza komentárov z XML feedov
+Feedy sa naimportujú do SQLite databázy (comments_db.py) a štatistiky sú dotazy nad ňou.
+Súhrny jednotlivých feedov sa prepočítavajú len pri ich zmene, takže opakované
+spustenie (napr. dashboard cez --format json) je lacné.
 """
 
-import os
+import csv
+import json
+import sqlite3
+import sys
+from datetime import datetime
 from pathlib import Path
-import xml.etree.ElementTree as ET
-from collections import defaultdict
 
-def analyze_comments():
-    mirror_path = Path("backup/hradiska_mirror")
+from comments_db import CommentsDatabase, default_db_file
+
+def analyze_comments(mirror_dir: str = "backup/hradiska_mirror"):
+    mirror_path = Path(mirror_dir)
 
     print("=" * 70)
     print("  ANALÝZA KOMENTÁROV")
     print("=" * 70)
     print()
 
-    # Nájdi všetky comment feedy
-    comment_feeds = list(mirror_path.glob("**/feeds/**/comments/default.html"))
-
-    print(f"📊 Nájdených {len(comment_feeds)} comment feedov\n")
-
-    total_comments = 0
-    articles_with_comments = []
-
-    for feed_file in comment_feeds:
-        try:
-            with open(feed_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parsuj XML
-            root = ET.fromstring(content)
-
-            # Namespace pre Atom
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
-            # Nájdi všetky entry (komentáre)
-            entries = root.findall('.//atom:entry', ns)
-
-            if entries:
-                # Nájdi title článku (je v feed/title)
-                feed_title_elem = root.find('.//atom:title', ns)
-                feed_title = feed_title_elem.text if feed_title_elem is not None else "Neznámy článok"
-
-                # Extrahuj komentáre
-                comments_data = []
-                for entry in entries:
-                    author_elem = entry.find('.//atom:author/atom:name', ns)
-                    content_elem = entry.find('.//atom:content', ns)
-                    published_elem = entry.find('.//atom:published', ns)
-
-                    author = author_elem.text if author_elem is not None else "Anonym"
-                    comment_text = content_elem.text if content_elem is not None else ""
-                    published = published_elem.text if published_elem is not None else ""
-
-                    comments_data.append({
-                        'author': author,
-                        'text': comment_text[:100] if comment_text else "",
-                        'date': published[:10] if published else ""
-                    })
-
-                total_comments += len(entries)
-
-                articles_with_comments.append({
-                    'title': feed_title,
-                    'count': len(entries),
-                    'file': str(feed_file.relative_to(mirror_path)),
-                    'comments': comments_data[:3]  # Prvé 3 komentáre
-                })
-
-        except Exception as e:
-            print(f"⚠️  Chyba pri spracovaní {feed_file.name}: {str(e)[:50]}")
-
-    # Výpis štatistík
-    print(f"✅ CELKOVÝ POČET KOMENTÁROV: {total_comments}")
-    print(f"✅ Článkov s komentármi: {len(articles_with_comments)}")
-    print()
-
-    if articles_with_comments:
-        print("📝 UKÁŽKA ČLÁNKOV S KOMENTÁRMI:")
-        print("-" * 70)
+    with CommentsDatabase(default_db_file(mirror_path)) as db:
+        # Import je inkrementálny - nezmenené feedy sa preskočia
+        stats = db.import_mirror(mirror_path)
 
-        # Zoraď podľa počtu komentárov
-        articles_with_comments.sort(key=lambda x: x['count'], reverse=True)
+        print(f"📊 Nájdených {stats['feeds']} comment feedov "
+              f"(nových/zmenených: {stats['imported']}, nezmenených: {stats['unchanged']})\n")
 
-        for i, article in enumerate(articles_with_comments[:10], 1):
-            print(f"\n{i}. {article['title'][:60]}")
-            print(f"   Komentárov: {article['count']}")
-            print(f"   Feed: {article['file']}")
+        totals = db.totals()
+        total_comments = totals['comments']
+        articles_count = totals['articles']
 
-            if article['comments']:
-                print(f"   Ukážka komentárov:")
-                for j, comment in enumerate(article['comments'], 1):
-                    author = comment['author']
-                    text_preview = comment['text'].replace('\n', ' ')[:80]
-                    date = comment['date']
-                    print(f"     {j}. {author} ({date}): {text_preview}...")
+        # Výpis štatistík
+        print(f"✅ CELKOVÝ POČET KOMENTÁROV: {total_comments}")
+        print(f"✅ Článkov s komentármi: {articles_count}")
+        print()
 
-        if len(articles_with_comments) > 10:
-            print(f"\n... a ďalších {len(articles_with_comments) - 10} článkov s komentármi")
+        if articles_count:
+            print("📝 UKÁŽKA ČLÁNKOV S KOMENTÁRMI:")
+            print("-" * 70)
+
+            for i, article in enumerate(db.top_threads(10), 1):
+                print(f"\n{i}. {article['title'][:60]}")
+                print(f"   Komentárov: {article['count']}")
+                print(f"   Feed: {article['feed_file']}")
+
+                preview = article['preview']
+                if preview:
+                    print(f"   Ukážka komentárov:")
+                    for j, comment in enumerate(preview, 1):
+                        text_preview = comment['text'].replace('\n', ' ')[:80]
+                        print(f"     {j}. {comment['author']} ({comment['date']}): {text_preview}...")
+
+            if articles_count > 10:
+                print(f"\n... a ďalších {articles_count - 10} článkov s komentármi")
+
+            print()
+            print("👤 NAJAKTÍVNEJŠÍ AUTORI:")
+            print("-" * 70)
+            for author in db.top_authors(10):
+                print(f"  • {author['author'][:30]:30} {author['count']:4} komentárov "
+                      f"v {author['threads']} článkoch ({author['first'][:4]}-{author['last'][:4]})")
+
+            print()
+            print("📅 KOMENTÁRE PODĽA ROKOV:")
+            print("-" * 70)
+            for row in db.comments_per_year():
+                print(f"  • {row['year']}: {row['count']:4}")
 
     print()
     print("=" * 70)
@@ -105,10 +76,12 @@ def analyze_comments():
     print("=" * 70)
 
     if total_comments > 0:
-        print(f"✅ Máte {total_comments} komentárov z {len(articles_with_comments)} článkov!")
+        print(f"✅ Máte {total_comments} komentárov z {articles_count} článkov!")
         print()
-        print("💡 Komentáre sú uložené v XML formáte.")
+        print("💡 Komentáre sú uložené v XML formáte a v databáze "
+              f"{default_db_file(mirror_path)}.")
         print("   Ak budete chcieť:")
+        print("   • Vyhľadávať v nich - python analyze_comments.py --hladaj \"výraz\"")
         print("   • Zobraziť ich v HTML - treba ich integrovať do článkov")
         print("   • Exportovať do Word - môžeme to spraviť")
         print("   • Archivovať - už sú bezpečne uložené")
@@ -118,7 +91,68 @@ def analyze_comments():
 
     print("=" * 70)
 
+def export_comments(mirror_dir: str = "backup/hradiska_mirror", fmt: str = "json", output=None):
+    """
+    Strojovo čitateľný výstup pre dashboardy.
+    json - celkové štatistiky, súhrny feedov, autori a roky
+    csv  - jeden riadok na článok s komentármi
+    """
+    mirror_path = Path(mirror_dir)
+
+    with CommentsDatabase(default_db_file(mirror_path)) as db:
+        stats = db.import_mirror(mirror_path)
+        rollups = db.rollups()
+
+        if fmt == "json":
+            data = {
+                'generated': datetime.now().isoformat(timespec='seconds'),
+                'import': stats,
+                'totals': db.totals(),
+                'feeds': rollups,
+                'top_authors': db.top_authors(50),
+                'per_year': db.comments_per_year(),
+            }
+
+    out = open(output, 'w', encoding='utf-8', newline='') if output else sys.stdout
+    try:
+        if fmt == "json":
+            json.dump(data, out, ensure_ascii=False, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.writer(out)
+            writer.writerow(['feed_id', 'title', 'url', 'comments', 'first', 'last', 'authors', 'top_author'])
+            for r in rollups:
+                writer.writerow([
+                    r['feed_id'], r['title'], r['url'], r['count'], r['first'], r['last'],
+                    len(r['authors']), r['authors'][0]['author'] if r['authors'] else "",
+                ])
+    finally:
+        if output:
+            out.close()
+
+def search_comments(query: str, mirror_dir: str = "backup/hradiska_mirror", limit: int = 20):
+    """Fulltextové vyhľadávanie v komentároch"""
+    mirror_path = Path(mirror_dir)
+
+    with CommentsDatabase(default_db_file(mirror_path)) as db:
+        db.import_mirror(mirror_path)
+
+        try:
+            results = db.search(query, limit)
+        except sqlite3.OperationalError as e:
+            print(f"❌ Neplatný dotaz: {e}")
+            return
+
+    print(f"🔍 Výsledky pre \"{query}\": {len(results)}")
+    print("-" * 70)
+    for i, row in enumerate(results, 1):
+        print(f"{i}. {row['author']} ({row['published'][:10]}) - {row['title'][:50]}")
+        print(f"   {row['snippet'].replace(chr(10), ' ')}")
+        if row['url']:
+            print(f"   {row['url']}")
+
 if __name__ == "__main__":
+    import argparse
     import sys
     import io
 
@@ -126,4 +160,17 @@ if __name__ == "__main__":
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-    analyze_comments()
+    parser = argparse.ArgumentParser(description="Analýza komentárov z XML feedov")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru")
+    parser.add_argument('--hladaj', metavar='DOTAZ', help="fulltextové vyhľadávanie v komentároch")
+    parser.add_argument('--format', choices=['text', 'json', 'csv'], default='text',
+                        help="formát výstupu (json/csv pre dashboardy)")
+    parser.add_argument('--vystup', metavar='SUBOR', help="zapísať json/csv do súboru namiesto stdout")
+    args = parser.parse_args()
+
+    if args.hladaj:
+        search_comments(args.hladaj, args.mirror)
+    elif args.format != 'text':
+        export_comments(args.mirror, args.format, args.vystup)
+    else:
+        analyze_comments(args.mirror)
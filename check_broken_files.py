@@ -1,71 +1,139 @@
 """
 Kontrola "poškodených" HTML súborov
+Každý .html súbor sa zaradí podľa prvých pár KB: HTML stránka, Atom feed,
+redirect, prázdny súbor alebo binárne dáta uložené ako .html
 """
 
+import json
 import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List
 
-def check_broken_html():
-    mirror_path = Path("backup/hradiska_mirror")
-    html_files = list(mirror_path.glob("**/*.html"))
+from mirror_manifest import iter_files
+from validate_images import sniff_format
+
+HEAD_SIZE = 8 * 1024
+
+# Poradie výpisu
+KINDS = ('html', 'atom', 'redirect', 'empty', 'binary', 'other', 'error')
+
+_REFRESH_RE = re.compile(rb'<meta[^>]+http-equiv\s*=\s*["\']?refresh[^>]*>', re.IGNORECASE)
+_REFRESH_URL_RE = re.compile(rb'url\s*=\s*["\']?([^"\'>\s]+)', re.IGNORECASE)
+_SCRIPT_REDIRECT_RE = re.compile(rb'(?:window|document)\.location(?:\.href)?\s*=\s*["\']([^"\']+)', re.IGNORECASE)
+
+def classify_head(head: bytes, size: int) -> Dict:
+    """Zaradí súbor podľa začiatku obsahu, vráti {'kind', 'detail'}"""
+    if not head.strip():
+        return {'kind': 'empty', 'detail': "prázdny súbor" if size == 0 else "len medzery"}
+
+    image = sniff_format(head)
+    if image and image != 'svg':
+        return {'kind': 'binary', 'detail': f"obrázok ({image})"}
+    if b'\x00' in head:
+        return {'kind': 'binary', 'detail': "binárne dáta"}
+
+    lower = head.lower()
+
+    if b'<feed' in lower and b'http://www.w3.org/2005/atom' in lower:
+        return {'kind': 'atom', 'detail': "Atom feed"}
+
+    refresh = _REFRESH_RE.search(head)
+    if refresh:
+        target = _REFRESH_URL_RE.search(refresh.group(0))
+        return {'kind': 'redirect', 'detail': target.group(1).decode('utf-8', 'replace') if target else "meta refresh"}
+    if size < 2048:
+        target = _SCRIPT_REDIRECT_RE.search(head)
+        if target:
+            return {'kind': 'redirect', 'detail': target.group(1).decode('utf-8', 'replace')}
+
+    if b'<html' in lower or b'<body' in lower or b'<!doctype html' in lower:
+        return {'kind': 'html', 'detail': ""}
+
+    preview = head[:100].decode('utf-8', 'replace').replace('\n', ' ').strip()
+    return {'kind': 'other', 'detail': preview}
+
+def classify_file(path: Path) -> Dict:
+    """Prečíta len začiatok súboru (HEAD_SIZE) a zaradí ho"""
+    try:
+        size = path.stat().st_size
+        with open(path, 'rb') as f:
+            head = f.read(HEAD_SIZE)
+    except OSError as e:
+        return {'kind': 'error', 'detail': str(e)[:50], 'size': 0}
+    result = classify_head(head, size)
+    result['size'] = size
+    return result
+
+def classify_mirror(mirror_dir: str = "backup/hradiska_mirror", workers: int = None) -> List[Dict]:
+    """Zaradí všetky .html súbory mirroru, vráti zoznam {'path', 'kind', 'detail', 'size'}"""
+    mirror_path = Path(mirror_dir)
+    html_files = sorted(rel for rel, _, _ in iter_files(mirror_path) if rel.endswith('.html'))
+
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        results = pool.map(classify_file, [mirror_path / rel for rel in html_files], chunksize=16)
+        return [dict(path=rel, **result) for rel, result in zip(html_files, results)]
+
+def check_broken_html(mirror_dir: str = "backup/hradiska_mirror", workers: int = None):
+    files = classify_mirror(mirror_dir, workers)
+    counts = Counter(info['kind'] for info in files)
 
     print("🔍 ANALÝZA 'POŠKODENÝCH' HTML SÚBOROV:")
     print("=" * 70)
     print()
 
-    broken_files = []
-
-    for html_file in html_files:
-        try:
-            size = html_file.stat().st_size
-
-            with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-                # Ak nie je validný HTML
-                if '<html' not in content.lower() and '<body' not in content.lower():
-                    broken_files.append({
-                        'path': str(html_file.relative_to(mirror_path)),
-                        'size': size,
-                        'preview': content[:200] if content else "(prázdne)"
-                    })
-        except Exception as e:
-            broken_files.append({
-                'path': str(html_file.relative_to(mirror_path)),
-                'size': 0,
-                'preview': f"ERROR: {str(e)[:50]}"
-            })
-
-    if broken_files:
-        print(f"Nájdených {len(broken_files)} netypických súborov:\n")
-
-        for i, file_info in enumerate(broken_files[:10], 1):  # Prvých 10
+    print(f"Skontrolovaných {len(files)} súborov:")
+    for kind in KINDS:
+        if counts[kind]:
+            print(f"  • {kind:10} {counts[kind]:5}")
+    print()
+
+    unusual = [info for info in files if info['kind'] not in ('html', 'atom')]
+
+    if unusual:
+        print(f"Nájdených {len(unusual)} netypických súborov:\n")
+
+        for i, file_info in enumerate(unusual[:10], 1):  # Prvých 10
             print(f"{i}. {file_info['path']}")
             print(f"   Veľkosť: {file_info['size']} B")
-            print(f"   Obsah: {file_info['preview'][:100]}")
+            print(f"   Typ: {file_info['kind']} {file_info['detail'][:100]}")
             print()
 
-        if len(broken_files) > 10:
-            print(f"... a ďalších {len(broken_files) - 10} súborov")
+        if len(unusual) > 10:
+            print(f"... a ďalších {len(unusual) - 10} súborov")
 
         print()
         print("💡 VYSVETLENIE:")
-        print("Tieto súbory sú pravdepodobne:")
-        print("  • XML feedy (feeds/posts/)")
-        print("  • Redirecty alebo prázdne stránky")
-        print("  • Špeciálne systémové súbory")
+        print("  • atom     - XML feedy uložené ako .html (spracuje ich comment_feeds.py)")
+        print("  • redirect - presmerovania na inú adresu")
+        print("  • empty    - prázdne stránky")
+        print("  • binary   - obrázky alebo iné dáta uložené pod menom .html")
         print()
-        print("✅ TO JE NORMÁLNE - hlavné HTML články fungujú správne!")
+        print("✅ Hlavné HTML články fungujú správne!")
     else:
         print("✅ Žiadne poškodené súbory!")
 
     print("=" * 70)
 
 if __name__ == "__main__":
+    import argparse
     import sys
     import io
 
     if sys.platform == 'win32':
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
-    check_broken_html()
+    parser = argparse.ArgumentParser(description="Kontrola netypických .html súborov v mirrore")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru")
+    parser.add_argument('--workers', type=int, help="počet vlákien")
+    parser.add_argument('--json', action='store_true',
+                        help="vypísať zaradenie všetkých súborov ako JSON (napr. pre výber feedov)")
+    args = parser.parse_args()
+
+    if args.json:
+        json.dump(classify_mirror(args.mirror, args.workers), sys.stdout, ensure_ascii=False, indent=1)
+        sys.stdout.write("\n")
+    else:
+        check_broken_html(args.mirror, args.workers)
@@ -0,0 +1,181 @@
+"""
+Offline kontrola odkazov v mirrore
+Zaindexuje všetky súbory mirroru, paralelne vytiahne odkazy zo stránok
+a overí, či sa dajú nájsť v mirrore (rovnaké mapovanie URL ako downloader)
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+from urllib.parse import urljoin, urlparse
+
+from download_mirror import BASE_URL, url_to_local_path
+from mirror_manifest import iter_files
+
+_TAG_RE = re.compile(r'<(a|img|script|link)\b([^>]*)>', re.IGNORECASE)
+_REF_ATTR_RE = re.compile(r'''(?<![-\w])(href|src)\s*=\s*["']([^"']*)["']''', re.IGNORECASE)
+_REL_RE = re.compile(r'''(?<![-\w])rel\s*=\s*["']([^"']*)["']''', re.IGNORECASE)
+
+SKIPPED_SCHEMES = ('mailto:', 'javascript:', 'data:', 'tel:', 'about:')
+
+def extract_references(html_file: str, page_url: str, domain: str) -> Set[str]:
+    """
+    Absolútne URL, ktoré downloader sťahuje (rovnaké pravidlá ako
+    SimpleMirror.get_links_from_html): odkazy <a> len z vlastnej domény,
+    obrázky a skripty odkiaľkoľvek, <link> len štýly.
+    """
+    with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
+        text = f.read()
+
+    refs = set()
+    for tag, attrs in _TAG_RE.findall(text):
+        tag = tag.lower()
+        m = _REF_ATTR_RE.search(attrs)
+        if not m:
+            continue
+        attr, raw = m.group(1).lower(), m.group(2).strip().replace('&amp;', '&')
+        if not raw or raw.startswith('#') or raw.lower().startswith(SKIPPED_SCHEMES):
+            continue
+        if (tag == 'a') != (attr == 'href') and tag != 'link':
+            continue
+
+        if tag == 'link':
+            rel = _REL_RE.search(attrs)
+            if not (rel and rel.group(1).lower() == 'stylesheet') and '.css' not in raw:
+                continue
+
+        url = urljoin(page_url, raw).split('#')[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https'):
+            continue
+        if tag == 'a' and parsed.netloc != domain:
+            continue
+        refs.add(url)
+    return refs
+
+def _extract_worker(args) -> Tuple[str, List[str], str]:
+    rel, html_file, page_url, domain = args
+    try:
+        return rel, sorted(extract_references(html_file, page_url, domain)), ""
+    except Exception as e:
+        return rel, [], str(e)[:50]
+
+def collect_references(mirror_dir: str = "backup/hradiska_mirror", base_url: str = BASE_URL,
+                       workers: int = None) -> Dict:
+    """
+    Zaindexuje mirror a paralelne vytiahne odkazy zo všetkých stránok.
+    Vráti {'index': množina ciest, 'pages', 'references': {url: množina stránok}, 'errors'}.
+    """
+    mirror_path = Path(mirror_dir)
+    domain = urlparse(base_url).netloc
+
+    # Index všetkých súborov - jeden prechod stromom
+    index = {rel for rel, _, _ in iter_files(mirror_path)}
+    pages = sorted(rel for rel in index if rel.endswith('.html'))
+
+    jobs = [(rel, str(mirror_path / rel), urljoin(base_url, rel), domain) for rel in pages]
+    workers = workers or os.cpu_count() or 1
+
+    references: Dict[str, Set[str]] = defaultdict(set)
+    errors = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_extract_worker, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+        for rel, refs, error in results:
+            if error:
+                errors[rel] = error
+            for url in refs:
+                references[url].add(rel)
+
+    return {'index': index, 'pages': pages, 'references': references, 'errors': errors}
+
+def check_links(mirror_dir: str = "backup/hradiska_mirror", base_url: str = BASE_URL,
+                workers: int = None) -> Dict:
+    """
+    Vráti {'files', 'pages', 'references', 'dangling': {cieľ: {'urls', 'pages'}}, 'errors'}.
+    mirror_dir musí byť zadaný rovnako ako pri sťahovaní (dlhé cesty sa hashujú podľa dĺžky).
+    """
+    mirror_path = Path(mirror_dir)
+    collected = collect_references(mirror_dir, base_url, workers)
+    index = collected['index']
+
+    dangling: Dict[str, Dict] = defaultdict(lambda: {'urls': set(), 'pages': set()})
+    for url, pages in collected['references'].items():
+        local = url_to_local_path(url, mirror_path).relative_to(mirror_path).as_posix()
+        if local not in index:
+            dangling[local]['urls'].add(url)
+            dangling[local]['pages'].update(pages)
+
+    return {
+        'files': len(index),
+        'pages': len(collected['pages']),
+        'references': sum(len(pages) for pages in collected['references'].values()),
+        'dangling': {
+            target: {'urls': sorted(info['urls']), 'pages': sorted(info['pages'])}
+            for target, info in dangling.items()
+        },
+        'errors': collected['errors'],
+    }
+
+def main():
+    import argparse
+    import sys
+    import io
+    import time
+
+    # UTF-8 encoding pre Windows
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    parser = argparse.ArgumentParser(description="Offline kontrola odkazov v mirrore")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru (rovnako ako pri sťahovaní)")
+    parser.add_argument('--base-url', default=BASE_URL, help="pôvodná adresa stránky")
+    parser.add_argument('--workers', type=int, help="počet procesov")
+    parser.add_argument('--limit', type=int, default=30, help="koľko chýbajúcich cieľov vypísať")
+    parser.add_argument('--json', metavar='SUBOR', help="zapísať kompletný report do JSON")
+    args = parser.parse_args()
+
+    started = time.time()
+    report = check_links(args.mirror, args.base_url, args.workers)
+    dangling = report['dangling']
+
+    print("🔗 KONTROLA ODKAZOV V MIRRORE:")
+    print("=" * 70)
+    print(f"✅ Súborov v mirrore: {report['files']}")
+    print(f"✅ Stránok: {report['pages']}, odkazov: {report['references']}")
+    print(f"⏱️  Čas: {time.time() - started:.1f}s")
+    for rel, error in report['errors'].items():
+        print(f"⚠️  {rel}: {error}")
+    print()
+
+    if not dangling:
+        print("✅ Všetky odkazy vedú na súbory v mirrore!")
+    else:
+        print(f"❌ Chýbajúce ciele: {len(dangling)} "
+              f"(odkazov: {sum(len(info['pages']) for info in dangling.values())})")
+        print("-" * 70)
+        ordered = sorted(dangling.items(), key=lambda x: (-len(x[1]['pages']), x[0]))
+        for target, info in ordered[:args.limit]:
+            print(f"  • {target}  ({len(info['pages'])} stránok)")
+            print(f"    {info['urls'][0]}")
+            for page in info['pages'][:3]:
+                print(f"      ← {page}")
+        if len(ordered) > args.limit:
+            print(f"\n... a ďalších {len(ordered) - args.limit} cieľov")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Report: {args.json}")
+
+    print("=" * 70)
+    return 1 if dangling else 0
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
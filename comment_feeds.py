@@ -0,0 +1,186 @@
+"""
+Zdieľané čítanie Atom comment feedov
+Streamovací parser (iterparse) a cache už sparsovaných feedov v SQLite
+"""
+
+import hashlib
+import io
+import json
+import sqlite3
+import zlib
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+THR = '{http://purl.org/syndication/thread/1.0}'
+
+# Pri zmene formátu výstupu parsera zvýš verziu - stará cache sa zahodí
+CACHE_VERSION = 1
+
+def feed_path(mirror_dir: Union[str, Path], feed_id: str) -> Path:
+    """Cesta k comment feedu v mirrore"""
+    return Path(mirror_dir) / "feeds" / feed_id / "comments" / "default.html"
+
+def _entry_to_comment(entry: ET.Element) -> Dict:
+    """Prevedie <entry> element na slovník komentára"""
+    author_elem = entry.find(f'{ATOM}author/{ATOM}name')
+    content_elem = entry.find(f'{ATOM}content')
+    published_elem = entry.find(f'{ATOM}published')
+    id_elem = entry.find(f'{ATOM}id')
+    in_reply_to = entry.find(f'{THR}in-reply-to')
+
+    # Odpoveď na iný komentár je v Blogger feedoch ako <link rel='related'>
+    reply_to = ""
+    for link in entry.iterfind(f'{ATOM}link'):
+        if link.get('rel') == 'related':
+            reply_to = link.get('href', '').rsplit('/', 1)[-1]
+            break
+
+    comment_id = id_elem.text if id_elem is not None and id_elem.text else ""
+
+    return {
+        'id': comment_id.rsplit('post-', 1)[-1],
+        'author': author_elem.text if author_elem is not None and author_elem.text else "Anonym",
+        'content': content_elem.text if content_elem is not None and content_elem.text else "",
+        'published': published_elem.text if published_elem is not None and published_elem.text else "",
+        'post_url': in_reply_to.get('href', '') if in_reply_to is not None else "",
+        'reply_to': reply_to,
+    }
+
+def iter_feed(source) -> Iterator[Union[str, Dict]]:
+    """
+    Streamuje feed: najprv titulok feedu (str), potom komentáre (dict).
+    Spracované <entry> elementy sa hneď uvoľňujú z pamäte.
+    """
+    context = ET.iterparse(source, events=('start', 'end'))
+    _, root = next(context)
+    depth = 1
+    title_sent = False
+
+    for event, elem in context:
+        if event == 'start':
+            depth += 1
+            continue
+        depth -= 1
+
+        if depth == 1 and elem.tag == f'{ATOM}title' and not title_sent:
+            title_sent = True
+            yield elem.text or ""
+        elif depth == 1 and elem.tag == f'{ATOM}entry':
+            yield _entry_to_comment(elem)
+            # Uvoľnenie spracovaného elementu aj referencie z koreňa
+            elem.clear()
+            root.remove(elem)
+
+def parse_feed(source) -> Dict:
+    """Sparsuje feed (cesta, súbor alebo bytes) na {'title', 'comments'}"""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    title = ""
+    comments: List[Dict] = []
+    for item in iter_feed(source):
+        if isinstance(item, str):
+            title = item
+        else:
+            comments.append(item)
+
+    return {'title': title, 'comments': comments}
+
+def feed_digest(data: bytes) -> str:
+    """Hash obsahu feedu (BLAKE2b, 128 bitov)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class FeedCache:
+    """
+    Cache sparsovaných feedov v SQLite.
+    Kľúčom je cesta; platnosť sa overí cez mtime+veľkosť, pri zmene
+    cez BLAKE2 hash obsahu (napr. po opätovnom stiahnutí rovnakého feedu).
+    """
+
+    def __init__(self, cache_file: Union[str, Path]):
+        self.cache_file = Path(cache_file)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.cache_file))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS feeds (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                payload BLOB NOT NULL
+            )
+        """)
+        self.stats = {'hits': 0, 'rehashed': 0, 'parsed': 0}
+
+    def flush(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _pack(feed: Dict) -> bytes:
+        return zlib.compress(json.dumps(feed, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    @staticmethod
+    def _unpack(payload: bytes) -> Dict:
+        return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+    def get(self, path: Union[str, Path]) -> Dict:
+        """Vráti sparsovaný feed - z cache, alebo ho sparsuje a uloží"""
+        path = Path(path)
+        key = str(path.resolve())
+        st = path.stat()
+
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, digest, payload FROM feeds WHERE path = ? AND version = ?",
+            (key, CACHE_VERSION)
+        ).fetchone()
+
+        if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            self.stats['hits'] += 1
+            return self._unpack(row[3])
+
+        data = path.read_bytes()
+        digest = feed_digest(data)
+
+        if row and row[2] == digest:
+            # Obsah sa nezmenil, len metadáta súboru
+            self.stats['rehashed'] += 1
+            self.conn.execute(
+                "UPDATE feeds SET mtime_ns = ?, size = ? WHERE path = ?",
+                (st.st_mtime_ns, st.st_size, key)
+            )
+            return self._unpack(row[3])
+
+        feed = parse_feed(data)
+        feed['digest'] = digest
+        self.stats['parsed'] += 1
+        self.conn.execute(
+            "INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?, ?, ?)",
+            (key, st.st_mtime_ns, st.st_size, digest, CACHE_VERSION, self._pack(feed))
+        )
+        return feed
+
+def default_cache_file(mirror_dir: Union[str, Path]) -> Path:
+    """Cache leží vedľa mirroru, aby sa nenasadzovala spolu s ním"""
+    return Path(mirror_dir).parent / ".cache" / "comment_feeds.sqlite"
+
+def load_feed(path: Union[str, Path], cache: Optional[FeedCache] = None) -> Dict:
+    """Načíta feed cez cache, ak je k dispozícii"""
+    if cache is not None:
+        return cache.get(path)
+    data = Path(path).read_bytes()
+    feed = parse_feed(data)
+    feed['digest'] = feed_digest(data)
+    return feed
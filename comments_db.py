@@ -0,0 +1,276 @@
+"""
+Normalizovaná databáza komentárov (SQLite + FTS5)
+Importuje comment feedy z mirroru a poskytuje rýchle dotazy nad nimi
+"""
+
+import html
+import json
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from comment_feeds import FeedCache, default_cache_file, load_feed
+
+# Pri zmene schémy zvýš verziu - databáza je odvodená z feedov, vytvorí sa nanovo
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    feed_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    feed_file TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollups (
+    feed_id TEXT PRIMARY KEY REFERENCES posts(feed_id),
+    count INTEGER NOT NULL,
+    first TEXT NOT NULL,
+    last TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    preview TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT NOT NULL,
+    feed_id TEXT NOT NULL REFERENCES posts(feed_id),
+    position INTEGER NOT NULL,
+    author TEXT NOT NULL,
+    published TEXT NOT NULL,
+    reply_to TEXT,
+    content TEXT NOT NULL,
+    text TEXT NOT NULL,
+    UNIQUE (feed_id, id)
+);
+CREATE INDEX IF NOT EXISTS comments_feed ON comments(feed_id, position);
+CREATE INDEX IF NOT EXISTS comments_author ON comments(author);
+CREATE INDEX IF NOT EXISTS comments_published ON comments(published);
+CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(
+    author, text,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+def html_to_text(content: str) -> str:
+    """Odstráni HTML značky z komentára (pre fulltext a náhľady)"""
+    text = re.sub(r'<br\s*/?>', '\n', content, flags=re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', '', text)
+    return html.unescape(text).strip()
+
+def default_db_file(mirror_dir: Union[str, Path]) -> Path:
+    return Path(mirror_dir).parent / "comments.sqlite"
+
+class CommentsDatabase:
+    def __init__(self, db_file: Union[str, Path]):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_file))
+        self.conn.row_factory = sqlite3.Row
+
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            for table in ('comments_fts', 'comments', 'rollups', 'posts'):
+                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def import_mirror(self, mirror_dir: Union[str, Path], cache: Optional[FeedCache] = None) -> Dict:
+        """
+        Naimportuje všetky comment feedy z mirroru.
+        Feedy s nezmeneným mtime+veľkosťou sa ani nenačítajú, pri zmene sa
+        porovná hash obsahu; zmazané feedy sa odstránia.
+        """
+        mirror_dir = Path(mirror_dir)
+        stats = {'feeds': 0, 'imported': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+
+        known = {
+            row['feed_id']: (row['digest'], row['mtime_ns'], row['size'])
+            for row in self.conn.execute("SELECT feed_id, digest, mtime_ns, size FROM posts")
+        }
+        seen = set()
+
+        own_cache = cache is None
+        if own_cache:
+            cache = FeedCache(default_cache_file(mirror_dir))
+
+        try:
+            for feed_file in sorted(mirror_dir.glob("feeds/*/comments/default.html")):
+                feed_id = feed_file.parent.parent.name
+                stats['feeds'] += 1
+                seen.add(feed_id)
+
+                st = feed_file.stat()
+                previous = known.get(feed_id)
+                if previous and previous[1:] == (st.st_mtime_ns, st.st_size):
+                    stats['unchanged'] += 1
+                    continue
+
+                try:
+                    feed = load_feed(feed_file, cache)
+                except Exception as e:
+                    print(f"⚠️  Chyba pri spracovaní {feed_id}: {str(e)[:50]}")
+                    stats['failed'] += 1
+                    continue
+
+                if previous and previous[0] == feed['digest']:
+                    # Obsah je rovnaký, zmenili sa len metadáta súboru
+                    self.conn.execute(
+                        "UPDATE posts SET mtime_ns = ?, size = ? WHERE feed_id = ?",
+                        (st.st_mtime_ns, st.st_size, feed_id)
+                    )
+                    stats['unchanged'] += 1
+                    continue
+
+                self._replace_feed(feed_id, feed, str(feed_file.relative_to(mirror_dir)),
+                                   st.st_mtime_ns, st.st_size)
+                stats['imported'] += 1
+        finally:
+            if own_cache:
+                cache.close()
+
+        for feed_id in set(known) - seen:
+            self._delete_feed(feed_id)
+            stats['removed'] += 1
+
+        self.conn.commit()
+        return stats
+
+    def _delete_feed(self, feed_id: str):
+        self.conn.execute(
+            "DELETE FROM comments_fts WHERE rowid IN (SELECT rowid FROM comments WHERE feed_id = ?)",
+            (feed_id,)
+        )
+        self.conn.execute("DELETE FROM comments WHERE feed_id = ?", (feed_id,))
+        self.conn.execute("DELETE FROM rollups WHERE feed_id = ?", (feed_id,))
+        self.conn.execute("DELETE FROM posts WHERE feed_id = ?", (feed_id,))
+
+    def _replace_feed(self, feed_id: str, feed: Dict, feed_file: str, mtime_ns: int, size: int):
+        self._delete_feed(feed_id)
+
+        comments = feed['comments']
+        post_url = next((c['post_url'] for c in comments if c['post_url']), "")
+
+        # Id komentára je jedinečné len v rámci feedu (ten istý komentár môže byť
+        # vo feedoch viacerých článkov); opakovaný výskyt v jednom feede sa preskočí,
+        # aby súhrn, tabuľka komentárov aj fulltext obsahovali tie isté komentáre
+        unique: Dict[str, Tuple[int, Dict]] = {}
+        for position, comment in enumerate(comments):
+            unique.setdefault(comment['id'] or f"{feed_id}-{position}", (position, comment))
+
+        self.conn.execute(
+            "INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (feed_id, feed['title'], post_url, feed_file, feed['digest'], mtime_ns, size)
+        )
+        if unique:
+            self._store_rollup(feed_id, [comment for _, comment in unique.values()])
+
+        for comment_id, (position, comment) in unique.items():
+            text = html_to_text(comment['content'])
+            cursor = self.conn.execute(
+                "INSERT INTO comments "
+                "(id, feed_id, position, author, published, reply_to, content, text) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (comment_id, feed_id, position, comment['author'],
+                 comment['published'], comment['reply_to'] or None, comment['content'], text)
+            )
+            self.conn.execute(
+                "INSERT INTO comments_fts (rowid, author, text) VALUES (?, ?, ?)",
+                (cursor.lastrowid, comment['author'], text)
+            )
+
+    def _store_rollup(self, feed_id: str, comments: List[Dict]):
+        """Súhrn feedu (počet, rozsah dátumov, autori, náhľad) - počíta sa len pri zmene feedu"""
+        dates = sorted(c['published'] for c in comments if c['published'])
+
+        authors: Dict[str, int] = {}
+        for comment in comments:
+            authors[comment['author']] = authors.get(comment['author'], 0) + 1
+
+        preview = [
+            {'author': c['author'], 'date': c['published'][:10], 'text': html_to_text(c['content'])[:100]}
+            for c in comments[:3]
+        ]
+
+        self.conn.execute(
+            "INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?)",
+            (feed_id, len(comments), dates[0] if dates else "", dates[-1] if dates else "",
+             json.dumps(sorted(authors.items(), key=lambda x: (-x[1], x[0])), ensure_ascii=False),
+             json.dumps(preview, ensure_ascii=False))
+        )
+
+    # Dotazy
+
+    def totals(self) -> Dict:
+        row = self.conn.execute(
+            "SELECT COALESCE(SUM(count), 0) AS comments, COUNT(*) AS articles FROM rollups"
+        ).fetchone()
+        return {'comments': row['comments'], 'articles': row['articles']}
+
+    def rollups(self, limit: Optional[int] = None) -> List[Dict]:
+        """Súhrny feedov s komentármi, zoradené podľa počtu komentárov"""
+        rows = self.conn.execute("""
+            SELECT p.feed_id, p.title, p.url, p.feed_file,
+                   r.count, r.first, r.last, r.authors, r.preview
+            FROM rollups r JOIN posts p ON p.feed_id = r.feed_id
+            ORDER BY r.count DESC, p.title
+            LIMIT ?
+        """, (-1 if limit is None else limit,)).fetchall()
+
+        result = []
+        for row in rows:
+            item = dict(row)
+            item['authors'] = [{'author': a, 'count': c} for a, c in json.loads(item['authors'])]
+            item['preview'] = json.loads(item['preview'])
+            result.append(item)
+        return result
+
+    def top_threads(self, limit: int = 10) -> List[Dict]:
+        """Články s najväčším počtom komentárov"""
+        return self.rollups(limit)
+
+    def top_authors(self, limit: int = 10) -> List[Dict]:
+        """Najaktívnejší autori komentárov"""
+        rows = self.conn.execute("""
+            SELECT author, COUNT(*) AS count, COUNT(DISTINCT feed_id) AS threads,
+                   MIN(published) AS first, MAX(published) AS last
+            FROM comments
+            GROUP BY author
+            ORDER BY count DESC, author
+            LIMIT ?
+        """, (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def comments_per_year(self) -> List[Dict]:
+        rows = self.conn.execute("""
+            SELECT substr(published, 1, 4) AS year, COUNT(*) AS count
+            FROM comments
+            WHERE published != ''
+            GROUP BY year
+            ORDER BY year
+        """).fetchall()
+        return [dict(row) for row in rows]
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """Fulltextové vyhľadávanie (diakritika sa ignoruje)"""
+        rows = self.conn.execute("""
+            SELECT c.author, c.published, p.title, p.url,
+                   snippet(comments_fts, 1, '[', ']', '…', 12) AS snippet
+            FROM comments_fts
+            JOIN comments c ON c.rowid = comments_fts.rowid
+            JOIN posts p ON p.feed_id = c.feed_id
+            WHERE comments_fts MATCH ?
+            ORDER BY rank
+            LIMIT ?
+        """, (query, limit)).fetchall()
+        return [dict(row) for row in rows]
@@ -3,6 +3,7 @@ Jednoduchý mirror downloader pre hradiska.sk
 Stiahne celú stránku vrátane všetkých súborov pre offline použitie
 """
 
+import hashlib
 import os
 import sys
 import time
@@ -13,8 +14,57 @@ from pathlib import Path
 from typing import Set
 import re
 
+BASE_URL = "http://www.hradiska.sk/"
+
+def url_to_local_path(url: str, output_dir: Path) -> Path:
+    """
+    Vytvorí bezpečnú cestu k súboru z URL (mapovanie URL -> súbor v mirrore).
+    Pozor: dlhé cesty sa nahrádzajú hashom podľa dĺžky celej cesty vrátane
+    output_dir, takže pri spätnom mapovaní treba použiť rovnaký output_dir.
+    """
+    parsed = urlparse(url)
+    path = parsed.path
+
+    # Ak je to root, použij index.html
+    if not path or path == '/':
+        return output_dir / 'index.html'
+
+    # Odstránenie úvodného /
+    path = path.lstrip('/')
+
+    # Ak cesta končí na /, pridaj index.html
+    if path.endswith('/'):
+        path += 'index.html'
+    elif '.' not in Path(path).name:
+        # Ak nemá príponu, pridaj .html
+        path += '.html'
+
+    # Nahradenie nebezpečných znakov
+    path = path.replace('?', '_').replace('&', '_').replace('=', '_')
+
+    # FIX pre dlhé URL (Windows limit 260 znakov)
+    # Ak je cesta príliš dlhá, použij hash
+    full_path = output_dir / path
+    if len(str(full_path)) > 200:  # Bezpečná rezerva
+        # Zachovaj príponu
+        ext = Path(path).suffix or '.html'
+        # Vytvor hash z celej URL
+        url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
+
+        # Pre obrázky daj do images/, pre HTML do pages/
+        if ext.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg']:
+            path = f"images/{url_hash}{ext}"
+        elif ext.lower() in ['.css']:
+            path = f"css/{url_hash}{ext}"
+        elif ext.lower() in ['.js']:
+            path = f"js/{url_hash}{ext}"
+        else:
+            path = f"pages/{url_hash}{ext}"
+
+    return output_dir / path
+
 class SimpleMirror:
-    def __init__(self, base_url: str = "http://www.hradiska.sk/", output_dir: str = "backup/hradiska_mirror"):
+    def __init__(self, base_url: str = BASE_URL, output_dir: str = "backup/hradiska_mirror"):
         self.base_url = base_url
         self.domain = urlparse(base_url).netloc
         self.output_dir = Path(output_dir)
@@ -38,48 +88,7 @@ class SimpleMirror:
 
     def clean_filename(self, url: str) -> Path:
         """Vytvorí bezpečnú cestu k súboru z URL"""
-        import hashlib
-
-        parsed = urlparse(url)
-        path = parsed.path
-
-        # Ak je to root, použij index.html
-        if not path or path == '/':
-            return self.output_dir / 'index.html'
-
-        # Odstránenie úvodného /
-        path = path.lstrip('/')
-
-        # Ak cesta končí na /, pridaj index.html
-        if path.endswith('/'):
-            path += 'index.html'
-        elif '.' not in Path(path).name:
-            # Ak nemá príponu, pridaj .html
-            path += '.html'
-
-        # Nahradenie nebezpečných znakov
-        path = path.replace('?', '_').replace('&', '_').replace('=', '_')
-
-        # FIX pre dlhé URL (Windows limit 260 znakov)
-        # Ak je cesta príliš dlhá, použij hash
-        full_path = self.output_dir / path
-        if len(str(full_path)) > 200:  # Bezpečná rezerva
-            # Zachovaj príponu
-            ext = Path(path).suffix or '.html'
-            # Vytvor hash z celej URL
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-
-            # Pre obrázky daj do images/, pre HTML do pages/
-            if ext.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg']:
-                path = f"images/{url_hash}{ext}"
-            elif ext.lower() in ['.css']:
-                path = f"css/{url_hash}{ext}"
-            elif ext.lower() in ['.js']:
-                path = f"js/{url_hash}{ext}"
-            else:
-                path = f"pages/{url_hash}{ext}"
-
-        return self.output_dir / path
+        return url_to_local_path(url, self.output_dir)
 
     def download_file(self, url: str) -> bool:
         """Stiahne súbor z URL"""
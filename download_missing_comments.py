@@ -2,12 +2,15 @@
 Sťahovanie chýbajúcich comment feedov
 """
 
+import io
 import re
 import requests
 from pathlib import Path
 from typing import Set
 import time
 
+from comment_feeds import iter_feed
+
 def extract_comment_feed_urls() -> Set[str]:
     """Extrahuje všetky comment feed URLs z HTML článkov"""
 
@@ -75,11 +78,7 @@ def count_comments_in_feed(content: bytes) -> int:
     """Spočíta komentáre v XML feede"""
 
     try:
-        import xml.etree.ElementTree as ET
-        root = ET.fromstring(content)
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        entries = root.findall('.//atom:entry', ns)
-        return len(entries)
+        return sum(1 for item in iter_feed(io.BytesIO(content)) if isinstance(item, dict))
     except:
         return 0
 
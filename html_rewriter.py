@@ -0,0 +1,375 @@
+"""
+Streamovací prepis HTML súborov mirroru
+Tokenizér číta súbor po blokoch, registrované transformácie spracujú tokeny
+v jednom prechode a výsledok sa priebežne porovnáva s pôvodným obsahom -
+súbor sa zapíše atomicky, len ak sa obsah zmenil
+"""
+
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+CHUNK_SIZE = 64 * 1024
+
+# Práva nových súborov ako pri open() - mkstemp vytvára 0600
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Elementy, ktorých obsah sa netokenizuje (môže obsahovať '<')
+RAW_TEXT_ELEMENTS = ('script', 'style', 'textarea')
+
+_TAG_RE = re.compile(r'</?([A-Za-z][^\s/>]*)(?:"[^"]*"|\'[^\']*\'|[^\'">])*>')
+_ATTR_RE = re.compile(r'''([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?''')
+
+class Token(NamedTuple):
+    """
+    Token HTML: kind je 'text', 'start', 'end', 'comment', 'decl'
+    alebo 'raw' (HTML vložené transformáciou, ďalej sa nespracúva)
+    """
+    kind: str
+    raw: str
+    name: str = ''
+
+    def attr(self, attr_name: str) -> Optional[str]:
+        """Hodnota atribútu štartovacieho tagu (bez dekódovania entít)"""
+        if self.kind != 'start':
+            return None
+        inner = self.raw[len(self.name) + 1:].rstrip('>').rstrip('/')
+        for m in _ATTR_RE.finditer(inner):
+            if m.group(1).lower() == attr_name:
+                value = m.group(2)
+                if value is None:
+                    value = m.group(3)
+                if value is None:
+                    value = m.group(4)
+                return value if value is not None else ''
+        return None
+
+def tokenize(chunks: Iterable[str]) -> Iterator[Token]:
+    """Inkrementálne rozdelí prúd textu na tokeny; spojenie tokenov dá presne vstup"""
+    buf = ''
+    pos = 0
+    eof = False
+    raw_end = None  # regex ukončovacieho tagu, keď sme vnútri raw-text elementu
+    chunks = iter(chunks)
+
+    while True:
+        # Spracuj buffer; 'break' znamená, že treba dočítať ďalší blok
+        while pos < len(buf):
+            if raw_end is not None:
+                m = raw_end.search(buf, pos)
+                if not m:
+                    if not eof:
+                        # Ukončovací tag môže byť rozdelený medzi bloky
+                        safe = max(pos, len(buf) - 16)
+                        if safe > pos:
+                            yield Token('text', buf[pos:safe])
+                            pos = safe
+                        break
+                    yield Token('text', buf[pos:])
+                    pos = len(buf)
+                    break
+                if m.start() > pos:
+                    yield Token('text', buf[pos:m.start()])
+                    pos = m.start()
+                raw_end = None
+                continue
+
+            lt = buf.find('<', pos)
+            if lt < 0:
+                yield Token('text', buf[pos:])
+                pos = len(buf)
+                break
+            if lt > pos:
+                yield Token('text', buf[pos:lt])
+                pos = lt
+
+            nxt = buf[pos + 1:pos + 2]
+            if not nxt and not eof:
+                break
+
+            if buf.startswith('<!--', pos):
+                end = buf.find('-->', pos + 4)
+                if end < 0:
+                    if not eof:
+                        break
+                    yield Token('text', buf[pos:])
+                    pos = len(buf)
+                    break
+                yield Token('comment', buf[pos:end + 3])
+                pos = end + 3
+            elif nxt in ('!', '?'):
+                end = buf.find('>', pos)
+                if end < 0:
+                    if not eof:
+                        break
+                    yield Token('text', buf[pos:])
+                    pos = len(buf)
+                    break
+                yield Token('decl', buf[pos:end + 1])
+                pos = end + 1
+            elif nxt.isalpha() or nxt == '/':
+                m = _TAG_RE.match(buf, pos)
+                if not m:
+                    if not eof:
+                        break
+                    # Neukončený tag na konci súboru - ponechaj ako text
+                    yield Token('text', '<')
+                    pos += 1
+                    continue
+                name = m.group(1).lower()
+                if nxt == '/':
+                    yield Token('end', m.group(0), name)
+                else:
+                    yield Token('start', m.group(0), name)
+                    if name in RAW_TEXT_ELEMENTS and not m.group(0).endswith('/>'):
+                        raw_end = re.compile(f'</{name}', re.IGNORECASE)
+                pos = m.end()
+            else:
+                yield Token('text', '<')
+                pos += 1
+
+        if eof:
+            return
+
+        chunk = next(chunks, None)
+        buf = buf[pos:] + (chunk or '')
+        pos = 0
+        eof = chunk is None
+
+class Transform:
+    """
+    Základ transformácie. process() dostane token a vráti tokeny, ktoré
+    pokračujú ďalej (prázdne = token sa zahodí). Ak transformácia niečo
+    zmení, nastaví self.changed; inak sa súbor neprepisuje.
+    """
+    name = ''
+
+    def begin(self, path: Path):
+        self.path = path
+        self.changed = False
+
+    def process(self, token: Token) -> Iterable[Token]:
+        return (token,)
+
+    def finish(self) -> Iterable[Token]:
+        return ()
+
+    def result(self):
+        """Výsledok pre volajúceho (napr. štatistika), po spracovaní súboru"""
+        return None
+
+# Registrované transformácie: meno -> továreň (kwargs -> Transform)
+TRANSFORMS: Dict[str, Callable[..., Transform]] = {}
+
+def register_transform(name: str):
+    def decorator(factory):
+        TRANSFORMS[name] = factory
+        factory.name = name
+        return factory
+    return decorator
+
+@register_transform('strip-scripts')
+class StripScriptsTransform(Transform):
+    """Odstráni externé skripty, ktorých src zodpovedá vzoru (reklamy, bannery)"""
+
+    DEFAULT_PATTERN = r'etargetnet\.com/generic/advert\.php|mrtns\.eu/banners/'
+
+    def __init__(self, pattern: str = DEFAULT_PATTERN):
+        self.pattern = re.compile(pattern)
+
+    def begin(self, path: Path):
+        super().begin(path)
+        self.skipping = False
+        self.removed = 0
+
+    def process(self, token: Token) -> Iterable[Token]:
+        if self.skipping:
+            if token.kind == 'end' and token.name == 'script':
+                self.skipping = False
+            return ()
+        if token.kind == 'start' and token.name == 'script':
+            src = token.attr('src')
+            if src and self.pattern.search(src):
+                self.skipping = not token.raw.endswith('/>')
+                self.removed += 1
+                self.changed = True
+                return ()
+        return (token,)
+
+    def result(self):
+        return self.removed
+
+@contextmanager
+def atomic_writer(path: Path, encoding: str = 'utf-8') -> Iterator[TextIO]:
+    """
+    Súbor na zápis, ktorý pri úspešnom konci nahradí path atomicky (dočasný súbor
+    v tom istom priečinku + os.replace), pri chybe sa dočasný súbor zmaže.
+    Prepísaný súbor si ponechá svoje práva, nový dostane práva podľa umask.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            yield f
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o666 & ~_UMASK)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+def atomic_write_text(path: Path, text: str, encoding: str = 'utf-8'):
+    """Zapíše celý text atomicky (pozri atomic_writer)"""
+    with atomic_writer(Path(path), encoding) as f:
+        f.write(text)
+
+def _read_chunks(f, chunk_size: int) -> Iterator[str]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def _run_pipeline(tokens: Iterable[Token], transforms: List[Transform]) -> Iterator[Token]:
+    for token in tokens:
+        out: Iterable[Token] = (token,)
+        for transform in transforms:
+            out = [t for tok in out for t in transform.process(tok)]
+        yield from out
+
+    # Tokeny doplnené na konci prejdú ešte nasledujúcimi transformáciami
+    for i, transform in enumerate(transforms):
+        out = list(transform.finish())
+        for later in transforms[i + 1:]:
+            out = [t for tok in out for t in later.process(tok)]
+        yield from out
+
+def _copy_prefix(path: Path, out: TextIO, length: int, encoding: str, chunk_size: int):
+    """Skopíruje prvých length znakov súboru do out"""
+    with open(path, 'r', encoding=encoding, newline='') as src:
+        while length > 0:
+            chunk = src.read(min(length, chunk_size))
+            if not chunk:
+                return
+            out.write(chunk)
+            length -= len(chunk)
+
+def rewrite_file(path: Path, transforms: List[Transform], encoding: str = 'utf-8',
+                 chunk_size: int = CHUNK_SIZE) -> bool:
+    """
+    Prepíše súbor jedným prechodom bez načítania celého obsahu do pamäte.
+    Výstup sa priebežne porovnáva s pôvodným obsahom; dočasný súbor sa vytvorí
+    až pri prvom rozdiele (zhodný začiatok sa doň skopíruje). Vráti True, ak sa
+    súbor zmenil; ak je výsledok rovnaký, súbor zostane nedotknutý.
+    """
+    path = Path(path)
+    for transform in transforms:
+        transform.begin(path)
+
+    with ExitStack() as writer:
+        out = None
+        matched = 0  # znakov výstupu zhodných so začiatkom pôvodného obsahu
+        with open(path, 'r', encoding=encoding, newline='') as src, \
+                open(path, 'r', encoding=encoding, newline='') as reference:
+            for token in _run_pipeline(tokenize(_read_chunks(src, chunk_size)), transforms):
+                if out is None:
+                    if reference.read(len(token.raw)) == token.raw:
+                        matched += len(token.raw)
+                        continue
+                    out = writer.enter_context(atomic_writer(path, encoding))
+                    _copy_prefix(path, out, matched, encoding, chunk_size)
+                out.write(token.raw)
+
+            if out is None and reference.read(1):
+                # Výstup je kratší - zhoduje sa len so začiatkom pôvodného obsahu
+                out = writer.enter_context(atomic_writer(path, encoding))
+                _copy_prefix(path, out, matched, encoding, chunk_size)
+        # Zdrojový súbor je už zatvorený, os.replace prebehne pri výstupe z writer
+    return out is not None
+
+def _rewrite_worker(args) -> Tuple[str, bool, list, str]:
+    path, make_transforms = args
+    try:
+        transforms = make_transforms(Path(path))
+        changed = rewrite_file(Path(path), transforms)
+        return path, changed, [t.result() for t in transforms], ""
+    except Exception as e:
+        return path, False, [], str(e)[:50]
+
+def rewrite_tree(paths: List[Path], make_transforms: Callable[[Path], List[Transform]],
+                 workers: int = 1, initializer=None, initargs=()) -> Iterator[Tuple[str, bool, list, str]]:
+    """
+    Prepíše súbory paralelne v procesoch. make_transforms musí byť funkcia
+    na úrovni modulu (prenáša sa do procesov). Výsledky sú v poradí vstupu:
+    (cesta, zmenený, výsledky transformácií, chyba).
+    """
+    jobs = [(str(p), make_transforms) for p in paths]
+
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for job in jobs:
+            yield _rewrite_worker(job)
+        return
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        yield from pool.map(_rewrite_worker, jobs, chunksize=chunksize)
+
+# Nastavenie transformácií pre CLI (v pracovných procesoch)
+_cli_transforms: List[Tuple[str, dict]] = []
+
+def _init_cli(transforms: List[Tuple[str, dict]]):
+    global _cli_transforms
+    _cli_transforms = transforms
+
+def _make_cli_transforms(path: Path) -> List[Transform]:
+    return [TRANSFORMS[name](**options) for name, options in _cli_transforms]
+
+def main():
+    import argparse
+    import sys
+    import io
+
+    # UTF-8 encoding pre Windows
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    parser = argparse.ArgumentParser(description="Streamovací prepis HTML súborov mirroru")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru")
+    parser.add_argument('--transform', action='append', choices=sorted(TRANSFORMS), required=True,
+                        help="transformácia (možno zadať viackrát, použijú sa v poradí)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="počet procesov")
+    args = parser.parse_args()
+
+    mirror_dir = Path(args.mirror)
+    html_files = sorted(mirror_dir.rglob("*.html"))
+    transforms = [(name, {}) for name in args.transform]
+
+    print(f"🔄 Prepisujem {len(html_files)} HTML súborov ({', '.join(args.transform)})...")
+
+    changed = failed = 0
+    for path, was_changed, results, error in rewrite_tree(
+            html_files, _make_cli_transforms, args.workers, _init_cli, (transforms,)):
+        if error:
+            failed += 1
+            print(f"  ❌ {Path(path).relative_to(mirror_dir)}: {error}")
+        elif was_changed:
+            changed += 1
+
+    print(f"✅ Zmenených súborov: {changed}")
+    print(f"❌ Zlyhané: {failed}")
+    return 0
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -2,95 +2,209 @@
 Integrácia komentárov z XML feedov priamo do HTML článkov
 """
 
+import hashlib
+import json
+import os
 import re
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from comment_feeds import FeedCache, default_cache_file, feed_path, load_feed
+from html_rewriter import Token, Transform, atomic_write_text, rewrite_file, rewrite_tree
+
+COMMENTS_START = '<!-- KOMENTÁRE PRIDANÉ AUTOMATICKY -->'
+COMMENTS_END = '<!-- KONIEC KOMENTÁROV -->'
+FEED_HASH_RE = re.compile(r'<!-- feed-hash: ([0-9a-f]+) -->')
+FEED_URL_RE = re.compile(r'http://www\.hradiska\.sk/feeds/(\d+)/comments/default')
+FOOTER_CLASS_RE = re.compile(r'class=["\'][^"\']*footer', re.IGNORECASE)
+
+# Zdieľané súbory odľahčeného režimu (relatívne k mirroru)
+COMMENTS_ASSETS_DIR = "comments"
+
+COMMENTS_CSS = """#comments-section.hc-comments{margin:40px auto;max-width:800px;padding:20px;background:#f9f9f9;border-radius:8px;box-shadow:0 2px 4px rgba(0,0,0,.1)}
+.hc-comments-title{color:#333;border-bottom:3px solid #c0a154;padding-bottom:10px;margin-bottom:20px;font-family:Georgia,serif}
+.hc-comment{background:#fff;padding:15px;margin-bottom:15px;border-left:4px solid #c0a154;border-radius:4px}
+.hc-comment-meta{display:flex;justify-content:space-between;margin-bottom:10px;color:#666;font-size:14px}
+.hc-comment-author{color:#c0a154;font-size:15px}
+.hc-comment-date{color:#999}
+.hc-comment-body{color:#333;line-height:1.6;font-size:14px}
+.hc-comments-more{color:#666;font-style:italic}
+"""
+
+COMMENTS_JS = """(function () {
+  function render(section) {
+    if (section.dataset.loaded) return;
+    section.dataset.loaded = '1';
+    var skip = parseInt(section.dataset.inlined || '0', 10);
+    fetch(section.dataset.src)
+      .then(function (res) { return res.json(); })
+      .then(function (data) {
+        var frag = document.createDocumentFragment();
+        data.comments.slice(skip).forEach(function (c) {
+          var item = document.createElement('div');
+          item.className = 'hc-comment';
+          var meta = document.createElement('div');
+          meta.className = 'hc-comment-meta';
+          var author = document.createElement('strong');
+          author.className = 'hc-comment-author';
+          author.textContent = '\\uD83D\\uDC64 ' + c[0];
+          var date = document.createElement('span');
+          date.className = 'hc-comment-date';
+          date.textContent = '\\uD83D\\uDCC5 ' + c[1];
+          meta.appendChild(author);
+          meta.appendChild(date);
+          var body = document.createElement('div');
+          body.className = 'hc-comment-body';
+          body.innerHTML = c[2];
+          item.appendChild(meta);
+          item.appendChild(body);
+          frag.appendChild(item);
+        });
+        section.appendChild(frag);
+      })
+      .catch(function () {
+        delete section.dataset.loaded;
+        // Prehliadače nedovolia fetch() zo súborov (file://) - zvyšok len cez HTTP server
+        if (location.protocol === 'file:' && !section.querySelector('.hc-comments-offline')) {
+          var note = document.createElement('p');
+          note.className = 'hc-comments-more hc-comments-offline';
+          note.textContent = 'Ďalšie komentáre sa zobrazia len pri otvorení cez webový server.';
+          section.appendChild(note);
+        }
+      });
+  }
+
+  function init() {
+    var sections = document.querySelectorAll('.hc-comments[data-src]');
+    if (!('IntersectionObserver' in window)) {
+      sections.forEach(render);
+      return;
+    }
+    // Komentáre sa dočítajú až keď sa k nim čitateľ priblíži
+    var observer = new IntersectionObserver(function (entries) {
+      entries.forEach(function (entry) {
+        if (entry.isIntersecting) {
+          observer.unobserve(entry.target);
+          render(entry.target);
+        }
+      });
+    }, { rootMargin: '400px' });
+    sections.forEach(function (s) { observer.observe(s); });
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
+"""
+
 class CommentIntegrator:
-    def __init__(self, mirror_dir: str = "backup/hradiska_mirror"):
+    def __init__(self, mirror_dir: str = "backup/hradiska_mirror", use_cache: bool = True,
+                 render_mode: str = 'inline', inline_first: int = 3):
         self.mirror_dir = Path(mirror_dir)
+        # 'inline' = všetko s inline štýlmi, 'lazy' = zdieľané CSS + JSON na článok
+        if render_mode not in ('inline', 'lazy'):
+            raise ValueError(f"Neznámy režim vykresľovania: {render_mode}")
+        self.render_mode = render_mode
+        self.inline_first = inline_first
+        # Sparsované feedy sa cachujú, opakované behy nečítajú XML
+        self.feed_cache = FeedCache(default_cache_file(mirror_dir)) if use_cache else None
+        # Predčítané feedy (feed_id -> feed) pre paralelné spracovanie
+        self.feeds: Dict[str, Dict] = {}
         self.stats = {
             'processed': 0,
             'with_comments': 0,
+            'updated': 0,
+            'unchanged': 0,
             'total_comments': 0,
             'failed': 0
         }
 
     def extract_feed_id(self, html_content: str) -> Optional[str]:
         """Extrahuje comment feed ID z HTML článku"""
-        match = re.search(
-            r'http://www\.hradiska\.sk/feeds/(\d+)/comments/default',
-            html_content
-        )
+        match = FEED_URL_RE.search(html_content)
         return match.group(1) if match else None
 
-    def load_comments_from_feed(self, feed_id: str) -> List[Dict]:
-        """Načíta komentáre z XML feedu"""
-        feed_path = self.mirror_dir / "feeds" / feed_id / "comments" / "default.html"
+    def load_feed(self, feed_id: str) -> Optional[Dict]:
+        """Vráti sparsovaný feed (s hashom obsahu) alebo None"""
+        if feed_id in self.feeds:
+            return self.feeds[feed_id]
 
-        if not feed_path.exists():
-            return []
-
-        try:
-            with open(feed_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        feed_file = feed_path(self.mirror_dir, feed_id)
+        if not feed_file.exists():
+            return None
 
-            root = ET.fromstring(content)
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
+        return load_feed(feed_file, self.feed_cache)
 
-            comments = []
-            entries = root.findall('.//atom:entry', ns)
+    def preload_feeds(self) -> int:
+        """Načíta všetky comment feedy mirroru do pamäte (pred rozdelením práce medzi procesy)"""
+        for feed_file in self.mirror_dir.glob("feeds/*/comments/default.html"):
+            feed_id = feed_file.parent.parent.name
+            try:
+                self.feeds[feed_id] = load_feed(feed_file, self.feed_cache)
+            except Exception as e:
+                print(f"  ⚠️  Chyba pri načítaní feedu {feed_id}: {str(e)[:50]}")
+        return len(self.feeds)
 
-            for entry in entries:
-                author_elem = entry.find('.//atom:author/atom:name', ns)
-                content_elem = entry.find('.//atom:content', ns)
-                published_elem = entry.find('.//atom:published', ns)
+    def load_comments_from_feed(self, feed_id: str) -> List[Dict]:
+        """Načíta komentáre z XML feedu"""
+        try:
+            feed = self.load_feed(feed_id)
+            if feed is None:
+                return []
+            return self.format_comments(feed['comments'])
 
-                author = author_elem.text if author_elem is not None else "Anonym"
-                comment_html = content_elem.text if content_elem is not None else ""
-                published = published_elem.text if published_elem is not None else ""
+        except Exception as e:
+            print(f"  ⚠️  Chyba pri načítaní feedu {feed_id}: {str(e)[:50]}")
+            return []
 
-                # Parsuj dátum
-                try:
-                    date_obj = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                    date_str = date_obj.strftime('%d.%m.%Y %H:%M')
-                except:
-                    date_str = published[:10] if published else ""
+    def format_comments(self, entries: List[Dict]) -> List[Dict]:
+        """Pripraví komentáre z feedu na zobrazenie"""
+        comments = []
+        for entry in entries:
+            published = entry['published']
 
-                comments.append({
-                    'author': author,
-                    'content': comment_html,
-                    'date': date_str,
-                    'published_iso': published
-                })
+            # Parsuj dátum
+            try:
+                date_obj = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                date_str = date_obj.strftime('%d.%m.%Y %H:%M')
+            except:
+                date_str = published[:10] if published else ""
 
-            # Zoraď od najstarších po najnovšie
-            comments.sort(key=lambda x: x['published_iso'])
+            comments.append({
+                'author': entry['author'],
+                'content': entry['content'],
+                'date': date_str,
+                'published_iso': published
+            })
 
-            return comments
+        # Zoraď od najstarších po najnovšie
+        comments.sort(key=lambda x: x['published_iso'])
 
-        except Exception as e:
-            print(f"  ⚠️  Chyba pri načítaní feedu {feed_id}: {str(e)[:50]}")
-            return []
+        return comments
 
-    def generate_comments_html(self, comments: List[Dict]) -> str:
+    def generate_comments_html(self, comments: List[Dict], feed_hash: str = "") -> str:
         """Vygeneruje HTML sekciu s komentármi"""
 
-        html = f"""
-<!-- KOMENTÁRE PRIDANÉ AUTOMATICKY -->
-<div id="comments-section" style="margin: 40px auto; max-width: 800px; padding: 20px; background: #f9f9f9; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+        # Hash feedu umožní pri ďalšom behu preskočiť nezmenené články
+        hash_line = f"<!-- feed-hash: {feed_hash} -->\n" if feed_hash else ""
+
+        parts = [f"""
+{COMMENTS_START}
+{hash_line}<div id="comments-section" style="margin: 40px auto; max-width: 800px; padding: 20px; background: #f9f9f9; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
     <h3 style="color: #333; border-bottom: 3px solid #c0a154; padding-bottom: 10px; margin-bottom: 20px; font-family: Georgia, serif;">
         💬 Komentáre ({len(comments)})
     </h3>
-"""
+"""]
 
-        for i, comment in enumerate(comments, 1):
+        for comment in comments:
             # Escapuj HTML v mene autora
             author = comment['author'].replace('<', '&lt;').replace('>', '&gt;')
 
-            html += f"""
+            parts.append(f"""
     <div class="comment" style="background: white; padding: 15px; margin-bottom: 15px; border-left: 4px solid #c0a154; border-radius: 4px;">
         <div style="display: flex; justify-content: space-between; margin-bottom: 10px; color: #666; font-size: 14px;">
             <strong style="color: #c0a154; font-size: 15px;">👤 {author}</strong>
@@ -100,100 +214,180 @@ class CommentIntegrator:
             {comment['content']}
         </div>
     </div>
-"""
+""")
 
-        html += """
+        parts.append(f"""
 </div>
-<!-- KONIEC KOMENTÁROV -->
-"""
-        return html
-
-    def find_insertion_point(self, html_content: str) -> int:
-        """Nájde miesto kde vložiť komentáre (pred </body> alebo footer)"""
+{COMMENTS_END}
+""")
+        return ''.join(parts)
+
+    def generate_lazy_comments_html(self, comments: List[Dict], feed_id: str,
+                                    html_file: Path, feed_hash: str = "") -> str:
+        """
+        Vygeneruje odľahčenú sekciu komentárov: triedy zo zdieľaného štýlu,
+        prvých N komentárov priamo v HTML (pre čitateľov bez JS), zvyšok
+        sa dočíta z JSON súboru článku až keď sa sekcia dostane do zobrazenia.
+        Dočítanie potrebuje HTTP server - pri otvorení mirroru cez file://
+        prehliadač fetch() zablokuje a čitateľ vidí len vložených N komentárov.
+        """
+        hash_line = f"<!-- feed-hash: {feed_hash} -->\n" if feed_hash else ""
+
+        # Relatívne cesty k CSS a JS fungujú aj cez file://, JSON sa však načíta len cez HTTP
+        root = os.path.relpath(self.mirror_dir, html_file.parent).replace(os.sep, '/')
+        data_src = f"{root}/{COMMENTS_ASSETS_DIR}/data/{feed_id}.json"
+        inlined = comments[:self.inline_first]
+
+        parts = [f"""
+{COMMENTS_START}
+{hash_line}<link rel="stylesheet" href="{root}/{COMMENTS_ASSETS_DIR}/comments.css">
+<div id="comments-section" class="hc-comments" data-src="{data_src}" data-inlined="{len(inlined)}">
+<h3 class="hc-comments-title">💬 Komentáre ({len(comments)})</h3>
+"""]
+
+        for comment in inlined:
+            author = comment['author'].replace('<', '&lt;').replace('>', '&gt;')
+            parts.append(
+                f'<div class="hc-comment"><div class="hc-comment-meta">'
+                f'<strong class="hc-comment-author">👤 {author}</strong>'
+                f'<span class="hc-comment-date">📅 {comment["date"]}</span></div>'
+                f'<div class="hc-comment-body">{comment["content"]}</div></div>\n'
+            )
 
-        # Skús nájsť footer
-        footer_match = re.search(r'<footer|<div[^>]*class=["\'][^"\']*footer', html_content, re.IGNORECASE)
-        if footer_match:
-            return footer_match.start()
+        if len(comments) > len(inlined):
+            parts.append(
+                f'<noscript><p class="hc-comments-more">Ďalších {len(comments) - len(inlined)} '
+                f'komentárov sa zobrazí so zapnutým JavaScriptom.</p></noscript>\n'
+            )
 
-        # Ak nie je footer, vlož pred </body>
-        body_match = re.search(r'</body>', html_content, re.IGNORECASE)
-        if body_match:
-            return body_match.start()
+        parts.append(f"""</div>
+<script src="{root}/{COMMENTS_ASSETS_DIR}/comments.js" defer></script>
+{COMMENTS_END}
+""")
+        return ''.join(parts)
+
+    def write_comments_data(self, feed_id: str, comments: List[Dict]):
+        """Uloží kompaktný JSON s komentármi článku ([autor, dátum, HTML])"""
+        data = {
+            'count': len(comments),
+            'comments': [[c['author'], c['date'], c['content']] for c in comments]
+        }
+        data_file = self.mirror_dir / COMMENTS_ASSETS_DIR / "data" / f"{feed_id}.json"
+        data_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(data_file, json.dumps(data, ensure_ascii=False, separators=(',', ':')))
 
-        # Ak ani to nie je, vlož na koniec
-        return len(html_content)
+    def remove_comments_data(self, feed_id: str):
+        """Zmaže JSON s komentármi článku, ktorého sekcia komentárov zanikla"""
+        data_file = self.mirror_dir / COMMENTS_ASSETS_DIR / "data" / f"{feed_id}.json"
+        try:
+            data_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def write_shared_assets(self):
+        """Zapíše zdieľaný štýl a skript pre odľahčené komentáre"""
+        assets_dir = self.mirror_dir / COMMENTS_ASSETS_DIR
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        for name, content in (('comments.css', COMMENTS_CSS), ('comments.js', COMMENTS_JS)):
+            target = assets_dir / name
+            if not target.exists() or target.read_text(encoding='utf-8') != content:
+                atomic_write_text(target, content)
+
+    def render_comments(self, comments: List[Dict], feed_id: str, html_file: Path, feed_hash: str) -> str:
+        """Vygeneruje sekciu komentárov podľa zvoleného režimu"""
+        if self.render_mode == 'lazy':
+            self.write_comments_data(feed_id, comments)
+            return self.generate_lazy_comments_html(comments, feed_id, html_file, feed_hash)
+        return self.generate_comments_html(comments, feed_hash)
+
+    def region_hash(self, feed: Dict) -> str:
+        """Odtlačok obsahu sekcie - hash feedu, v odľahčenom režime aj s jeho nastaveniami"""
+        if self.render_mode == 'inline':
+            return feed['digest']
+        key = f"{feed['digest']}:{self.render_mode}:{self.inline_first}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+    def is_insertion_point(self, token: Token) -> bool:
+        """Komentáre sa vkladajú pred prvý footer (alebo pred </body>)"""
+        if token.kind != 'start':
+            return False
+        if token.name == 'footer':
+            return True
+        return token.name == 'div' and FOOTER_CLASS_RE.search(token.raw) is not None
+
+    def refresh_article(self, html_file: Path) -> Tuple[str, int]:
+        """
+        Vloží alebo obnoví sekciu komentárov v jednom článku.
+        Vracia (stav, počet komentárov); stav je 'added', 'updated',
+        'removed', 'unchanged' alebo 'none' (článok nemá komentáre).
+        """
+        transform = CommentInjectionTransform(self)
+        rewrite_file(html_file, [transform])
+        return transform.result()
 
     def integrate_comments_into_article(self, html_file: Path) -> bool:
         """Integruje komentáre do jedného HTML článku"""
 
         try:
-            # Načítaj HTML
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-
-            # Skontroluj či už nemá integrované komentáre
-            if '<!-- KOMENTÁRE PRIDANÉ AUTOMATICKY -->' in html_content:
-                return False  # Už má komentáre
-
-            # Extrahuj feed ID
-            feed_id = self.extract_feed_id(html_content)
-            if not feed_id:
-                return False  # Nemá komentáre
-
-            # Načítaj komentáre
-            comments = self.load_comments_from_feed(feed_id)
-            if not comments:
-                return False  # Prázdny feed
-
-            # Vygeneruj HTML komentárov
-            comments_html = self.generate_comments_html(comments)
-
-            # Nájdi miesto na vloženie
-            insertion_point = self.find_insertion_point(html_content)
-
-            # Vlož komentáre
-            new_html = (
-                html_content[:insertion_point] +
-                comments_html +
-                html_content[insertion_point:]
-            )
-
-            # Ulož upravený súbor
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(new_html)
-
-            self.stats['total_comments'] += len(comments)
-            return True
-
+            status, count = self.refresh_article(html_file)
         except Exception as e:
             print(f"  ❌ Chyba pri spracovaní {html_file.name}: {str(e)[:50]}")
             self.stats['failed'] += 1
             return False
 
-    def integrate_all_comments(self):
-        """Integruje komentáre do všetkých článkov"""
+        self._count_result(status, count)
+        return status in ('added', 'updated')
 
-        print("=" * 70)
-        print("  INTEGRÁCIA KOMENTÁROV DO HTML ČLÁNKOV")
-        print("=" * 70)
-        print()
+    def _count_result(self, status: str, count: int):
+        if status == 'added':
+            self.stats['total_comments'] += count
+        elif status == 'updated':
+            self.stats['updated'] += 1
+            self.stats['total_comments'] += count
+        elif status == 'unchanged':
+            self.stats['unchanged'] += 1
 
-        # Nájdi všetky HTML články (okrem search/label a feeds)
+    def find_article_files(self) -> List[Path]:
+        """Nájde všetky HTML články (okrem search/label a feeds)"""
         html_files = []
         for pattern in ['**/*.html']:
             for html_file in self.mirror_dir.glob(pattern):
                 # Preskočiť feeds, search, index
-                rel_path = str(html_file.relative_to(self.mirror_dir))
+                rel_path = html_file.relative_to(self.mirror_dir).as_posix()
                 if any(skip in rel_path for skip in ['feeds/', 'search/', 'index.html']):
                     continue
                 html_files.append(html_file)
+        return html_files
+
+    def integrate_all_comments(self, workers: int = 1):
+        """Integruje komentáre do všetkých článkov (workers > 1 = paralelne v procesoch)"""
+
+        print("=" * 70)
+        print("  INTEGRÁCIA KOMENTÁROV DO HTML ČLÁNKOV")
+        print("=" * 70)
+        print()
+
+        html_files = self.find_article_files()
 
         print(f"📊 Nájdených {len(html_files)} HTML článkov na spracovanie")
         print()
         print("🔄 Integrujem komentáre...")
         print("-" * 70)
 
+        if self.render_mode == 'lazy':
+            self.write_shared_assets()
+
+        if workers > 1:
+            self._integrate_parallel(html_files, workers)
+        else:
+            self._integrate_serial(html_files)
+
+        if self.feed_cache is not None:
+            self.feed_cache.flush()
+
+        self.print_summary()
+
+    def _integrate_serial(self, html_files: List[Path]):
         for i, html_file in enumerate(html_files, 1):
             rel_path = html_file.relative_to(self.mirror_dir)
 
@@ -210,12 +404,42 @@ class CommentIntegrator:
                 if i % 10 == 0 or i == 1:
                     print()
 
+    def _integrate_parallel(self, html_files: List[Path], workers: int):
+        # Feedy sa sparsujú (alebo načítajú z cache) raz v hlavnom procese
+        feed_count = self.preload_feeds()
+        print(f"📥 Načítaných {feed_count} comment feedov, spúšťam {workers} procesov")
+
+        results = rewrite_tree(
+            html_files, _comment_transforms, workers,
+            initializer=_init_worker,
+            initargs=(str(self.mirror_dir), self.feeds, self.render_mode, self.inline_first)
+        )
+
+        for i, (path, changed, transform_results, error) in enumerate(results, 1):
+            self.stats['processed'] += 1
+            rel_path = Path(path).relative_to(self.mirror_dir)
+
+            if error:
+                print(f"  ❌ Chyba pri spracovaní {rel_path}: {error}")
+                self.stats['failed'] += 1
+                continue
+
+            status, count = transform_results[0]
+            self._count_result(status, count)
+            if status in ('added', 'updated'):
+                self.stats['with_comments'] += 1
+                print(f"[{i}/{len(html_files)}] {rel_path} ✅ komentáre "
+                      f"{'pridané' if status == 'added' else 'obnovené'}")
+
+    def print_summary(self):
         print()
         print("=" * 70)
         print("📊 VÝSLEDKY:")
         print("=" * 70)
         print(f"✅ Spracovaných článkov: {self.stats['processed']}")
         print(f"✅ Článkov s komentármi: {self.stats['with_comments']}")
+        print(f"🔄 Z toho obnovených: {self.stats['updated']}")
+        print(f"⚪ Nezmenených (feed bez zmeny): {self.stats['unchanged']}")
         print(f"✅ Celkový počet komentárov: {self.stats['total_comments']}")
         print(f"❌ Zlyhané: {self.stats['failed']}")
         print("=" * 70)
@@ -231,9 +455,178 @@ class CommentIntegrator:
             print("🌐 Spustite lokálny server a pozrite sa:")
             print("   http://localhost:8000")
         else:
-            print("⚠️  Žiadne komentáre na integráciu (možno už sú integrované)")
+            print("⚠️  Žiadne komentáre na integráciu (všetky sú aktuálne)")
+
+# Stav pracovného procesu pri paralelnej integrácii
+_worker_integrator: Optional[CommentIntegrator] = None
+
+def _init_worker(mirror_dir: str, feeds: Dict[str, Dict], render_mode: str, inline_first: int):
+    global _worker_integrator
+    _worker_integrator = CommentIntegrator(mirror_dir, use_cache=False,
+                                           render_mode=render_mode, inline_first=inline_first)
+    _worker_integrator.feeds = feeds
+
+def _comment_transforms(path: Path) -> List[Transform]:
+    return [CommentInjectionTransform(_worker_integrator)]
+
+class CommentInjectionTransform(Transform):
+    """
+    Streamovaná transformácia: nájde feed ID článku, existujúcu sekciu
+    komentárov nahradí (ak sa zmenil feed), inak sekciu vloží pred footer.
+    """
+    name = 'integrate-comments'
+
+    def __init__(self, integrator: CommentIntegrator):
+        self.integrator = integrator
+
+    def begin(self, path: Path):
+        super().begin(path)
+        self.feed_id: Optional[str] = None
+        self.feed: Optional[Dict] = None
+        self.done = False          # sekcia je vyriešená (vložená/ponechaná)
+        self.region: Optional[List[Token]] = None
+        self.deferred: Optional[List[Token]] = None
+        self.deferred_region: Optional[List[Token]] = None
+        self.strip_newline = False
+        self.status = 'none'
+        self.count = 0
+
+    def result(self) -> Tuple[str, int]:
+        return self.status, self.count
+
+    def _render(self) -> Optional[str]:
+        """HTML sekcie (bez okrajových nových riadkov) alebo None, ak nie sú komentáre"""
+        comments = self.integrator.format_comments(self.feed['comments'])
+        self.count = len(comments)
+        if not comments:
+            return None
+        html = self.integrator.render_comments(
+            comments, self.feed_id, self.path, self.integrator.region_hash(self.feed)
+        )
+        return html[1:-1]
+
+    def _insert_before(self, tokens: List[Token]) -> List[Token]:
+        self.done = True
+        if self.feed is None:
+            return tokens
+        html = self._render()
+        if html is None:
+            return tokens  # Prázdny feed
+        self.status = 'added'
+        self.changed = True
+        return [Token('text', '\n'), Token('raw', html), Token('text', '\n')] + tokens
+
+    def _close_region(self) -> List[Token]:
+        region, self.region = self.region, None
+
+        if self.done:
+            # Duplicitná sekcia (nová už bola vložená skôr)
+            self.changed = True
+            self.strip_newline = True
+            return []
+
+        self.done = True
+        if self.feed_id is None:
+            # Feed ID ešte nie je známe - rozhodne sa, keď sa nájde
+            self.deferred_region = region
+            self.deferred = []
+            return []
+        return self._resolve_region(region)
+
+    def _resolve_region(self, region: List[Token]) -> List[Token]:
+        if self.feed is None:
+            self.status = 'unchanged'
+            return region
+
+        # Už integrované - zmena sa pozná podľa hashu feedu
+        old_hash = FEED_HASH_RE.search(''.join(t.raw for t in region))
+        if old_hash and old_hash.group(1) == self.integrator.region_hash(self.feed):
+            self.status = 'unchanged'
+            return region
+
+        self.changed = True
+        html = self._render()
+        if html is None:
+            self.status = 'removed'
+            self.strip_newline = True
+            self.integrator.remove_comments_data(self.feed_id)
+            return []
+        self.status = 'updated'
+        return [Token('raw', html)]
+
+    def _strip_leading_newline(self, token: Token) -> Token:
+        if self.strip_newline and token.kind == 'text':
+            self.strip_newline = False
+            if token.raw.startswith('\n'):
+                return Token('text', token.raw[1:])
+        return token
+
+    def _find_feed(self, token: Token):
+        match = FEED_URL_RE.search(token.raw)
+        if match:
+            self.feed_id = match.group(1)
+            self.feed = self.integrator.load_feed(self.feed_id)
+
+    def process(self, token: Token) -> Iterable[Token]:
+        if token.kind == 'raw':
+            return (token,)
+
+        if self.feed_id is None:
+            self._find_feed(token)
+
+        if self.region is not None:
+            self.region.append(token)
+            if token.kind == 'comment' and token.raw == COMMENTS_END:
+                return self._close_region()
+            return ()
+
+        if self.deferred is not None:
+            # Bod vloženia alebo sekcia už prešli, ale feed ID ešte nie je známe
+            self.deferred.append(token)
+            if self.feed_id is None:
+                return ()
+            deferred, self.deferred = self.deferred, None
+            if self.deferred_region is not None:
+                region, self.deferred_region = self.deferred_region, None
+                out = self._resolve_region(region)
+                if deferred:
+                    deferred[0] = self._strip_leading_newline(deferred[0])
+                return out + deferred
+            return self._insert_before(deferred)
+
+        if token.kind == 'comment' and token.raw == COMMENTS_START:
+            self.region = [token]
+            return ()
+
+        token = self._strip_leading_newline(token)
+
+        if not self.done and (self.integrator.is_insertion_point(token) or
+                              (token.kind == 'end' and token.name == 'body')):
+            if self.feed_id is None:
+                self.deferred = [token]
+                return ()
+            return self._insert_before([token])
+
+        return (token,)
+
+    def finish(self) -> Iterable[Token]:
+        if self.region is not None:
+            # Neukončená sekcia - ponechaj ako je
+            region, self.region = self.region, None
+            return region
+        if self.deferred is not None:
+            deferred, self.deferred = self.deferred, None
+            if self.deferred_region is not None:
+                region, self.deferred_region = self.deferred_region, None
+                return region + deferred
+            return deferred
+        if not self.done and self.feed_id is not None:
+            # Ani footer, ani </body> - vlož na koniec
+            return self._insert_before([])
+        return ()
 
 def main():
+    import argparse
     import sys
     import io
 
@@ -242,8 +635,19 @@ def main():
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-    integrator = CommentIntegrator()
-    integrator.integrate_all_comments()
+    parser = argparse.ArgumentParser(description="Integrácia komentárov do HTML článkov")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="počet procesov (1 = sériovo)")
+    parser.add_argument('--rezim', choices=['inline', 'lazy'], default='inline',
+                        help="inline = štýly v každom komentári, lazy = zdieľané CSS + JSON na článok "
+                             "(zvyšok komentárov sa dočíta len cez HTTP server, nie cez file://)")
+    parser.add_argument('--inline-prvych', type=int, default=3,
+                        help="v režime lazy počet komentárov vložených priamo do HTML")
+    args = parser.parse_args()
+
+    integrator = CommentIntegrator(args.mirror, render_mode=args.rezim, inline_first=args.inline_prvych)
+    integrator.integrate_all_comments(workers=args.workers)
 
     return 0
 
@@ -0,0 +1,250 @@
+"""
+Manifest integrity mirroru
+Zahashuje všetky súbory paralelne do kompaktného manifestu, rýchlo overí mirror
+voči manifestu (nezmenený mtime+veľkosť sa neprehashuje) a porovná dva manifesty
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from html_rewriter import atomic_write_text
+
+MANIFEST_HEADER = "# hradiska-manifest v1"
+ALGORITHMS = ('blake2b', 'sha256')
+BLOCK_SIZE = 1024 * 1024
+
+class Entry(NamedTuple):
+    digest: str
+    size: int
+    mtime_ns: int
+
+def default_manifest_file(mirror_dir: Union[str, Path]) -> Path:
+    return Path(mirror_dir).parent / "mirror_manifest.tsv"
+
+def iter_files(mirror_dir: Union[str, Path]) -> Iterator[Tuple[str, int, int]]:
+    """Prejde mirror cez os.scandir: (relatívna cesta s '/', veľkosť, mtime_ns)"""
+    stack = [(str(mirror_dir), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{prefix}{entry.name}/"))
+                elif entry.is_file():
+                    st = entry.stat()
+                    yield f"{prefix}{entry.name}", st.st_size, st.st_mtime_ns
+
+def hash_file(path: Union[str, Path], algorithm: str = 'blake2b') -> str:
+    # BLAKE2b skrátený na 256 bitov - rovnako dlhý hash ako SHA-256, ale rýchlejší
+    h = hashlib.blake2b(digest_size=32) if algorithm == 'blake2b' else hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(BLOCK_SIZE)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+def default_workers() -> int:
+    return min(32, (os.cpu_count() or 1) * 2)
+
+def hash_files(mirror_dir: Path, paths: List[str], algorithm: str = 'blake2b',
+               workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """
+    Hashuje súbory (cesty relatívne k mirroru) paralelne - hashlib uvoľňuje GIL,
+    takže stačia vlákna. Nečitateľné súbory majú hash None.
+    """
+    def work(rel):
+        try:
+            return rel, hash_file(Path(mirror_dir) / rel, algorithm)
+        except OSError:
+            return rel, None
+
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as pool:
+        return dict(pool.map(work, paths, chunksize=32))
+
+def build_manifest(mirror_dir: Union[str, Path], algorithm: str = 'blake2b',
+                   workers: Optional[int] = None) -> Dict[str, Entry]:
+    """Zahashuje celý mirror"""
+    mirror_dir = Path(mirror_dir)
+    files = {rel: (size, mtime) for rel, size, mtime in iter_files(mirror_dir)}
+    digests = hash_files(mirror_dir, list(files), algorithm, workers)
+    return {
+        rel: Entry(digest, *files[rel])
+        for rel, digest in digests.items()
+        if digest is not None
+    }
+
+def write_manifest(manifest: Dict[str, Entry], manifest_file: Union[str, Path], algorithm: str):
+    """Zapíše manifest: hlavička + riadky 'hash<TAB>veľkosť<TAB>mtime_ns<TAB>cesta', zoradené podľa cesty"""
+    lines = [f"{MANIFEST_HEADER} {algorithm}"]
+    for rel in sorted(manifest):
+        entry = manifest[rel]
+        lines.append(f"{entry.digest}\t{entry.size}\t{entry.mtime_ns}\t{rel}")
+    manifest_file = Path(manifest_file)
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(manifest_file, "\n".join(lines) + "\n")
+
+def read_manifest(manifest_file: Union[str, Path]) -> Tuple[str, Dict[str, Entry]]:
+    """Načíta manifest, vráti (algoritmus, záznamy)"""
+    manifest: Dict[str, Entry] = {}
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        header = f.readline().rstrip('\n')
+        if not header.startswith(MANIFEST_HEADER):
+            raise ValueError(f"{manifest_file} nie je manifest mirroru")
+        algorithm = header[len(MANIFEST_HEADER):].strip()
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Neznámy hashovací algoritmus: {algorithm}")
+
+        for line in f:
+            digest, size, mtime_ns, rel = line.rstrip('\n').split('\t', 3)
+            manifest[rel] = Entry(digest, int(size), int(mtime_ns))
+    return algorithm, manifest
+
+def verify_mirror(mirror_dir: Union[str, Path], manifest: Dict[str, Entry], algorithm: str,
+                  quick: bool = True, workers: Optional[int] = None) -> Tuple[Dict[str, List[str]], Dict[str, Entry]]:
+    """
+    Overí mirror voči manifestu. V rýchlom režime sa súbory s rovnakým
+    mtime+veľkosťou považujú za nezmenené a prehashujú sa len podozrivé.
+    Vráti (výsledky podľa stavu, aktualizovaný manifest).
+    """
+    mirror_dir = Path(mirror_dir)
+    current = {rel: (size, mtime) for rel, size, mtime in iter_files(mirror_dir)}
+    result = {'ok': [], 'touched': [], 'changed': [], 'missing': [], 'new': [], 'unreadable': []}
+    updated: Dict[str, Entry] = {}
+
+    suspects = []
+    for rel, (size, mtime) in current.items():
+        old = manifest.get(rel)
+        if old is None:
+            result['new'].append(rel)
+            suspects.append(rel)
+        elif quick and (old.size, old.mtime_ns) == (size, mtime):
+            result['ok'].append(rel)
+            updated[rel] = old
+        else:
+            suspects.append(rel)
+
+    result['missing'] = sorted(set(manifest) - set(current))
+
+    for rel, digest in hash_files(mirror_dir, suspects, algorithm, workers).items():
+        if digest is None:
+            result['unreadable'].append(rel)
+            continue
+        updated[rel] = Entry(digest, *current[rel])
+        old = manifest.get(rel)
+        if old is None:
+            continue
+        if old.digest != digest:
+            result['changed'].append(rel)
+        elif (old.size, old.mtime_ns) == current[rel]:
+            result['ok'].append(rel)
+        else:
+            # Obsah rovnaký, zmenili sa len metadáta
+            result['touched'].append(rel)
+
+    for paths in result.values():
+        paths.sort()
+    return result, updated
+
+def diff_manifests(old: Dict[str, Entry], new: Dict[str, Entry]) -> Dict[str, List[str]]:
+    """Rozdiel dvoch manifestov podľa obsahu (mtime sa ignoruje)"""
+    return {
+        'added': sorted(set(new) - set(old)),
+        'removed': sorted(set(old) - set(new)),
+        'changed': sorted(rel for rel in set(old) & set(new) if old[rel].digest != new[rel].digest),
+    }
+
+def _print_paths(label: str, paths: List[str], limit: int = 20):
+    if not paths:
+        return
+    print(f"{label}: {len(paths)}")
+    for rel in paths[:limit]:
+        print(f"  • {rel}")
+    if len(paths) > limit:
+        print(f"  ... a ďalších {len(paths) - limit}")
+
+def main():
+    import argparse
+    import sys
+    import io
+    import time
+
+    # UTF-8 encoding pre Windows
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    parser = argparse.ArgumentParser(description="Manifest integrity mirroru")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru")
+    parser.add_argument('--manifest', help="súbor manifestu (predvolene vedľa mirroru)")
+    parser.add_argument('--workers', type=int, help="počet vlákien na hashovanie")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    create = sub.add_parser('vytvor', help="zahashuje celý mirror do manifestu")
+    create.add_argument('--algoritmus', choices=ALGORITHMS, default='blake2b')
+
+    verify = sub.add_parser('over', help="overí mirror voči manifestu")
+    verify.add_argument('--uplne', action='store_true', help="prehashuje všetko (ignoruje mtime+veľkosť)")
+    verify.add_argument('--aktualizuj', action='store_true', help="po overení zapíše aktuálny stav do manifestu")
+
+    diff = sub.add_parser('porovnaj', help="porovná dva manifesty")
+    diff.add_argument('stary')
+    diff.add_argument('novy')
+
+    args = parser.parse_args()
+    manifest_file = Path(args.manifest) if args.manifest else default_manifest_file(args.mirror)
+    started = time.time()
+
+    if args.command == 'vytvor':
+        print(f"🔐 Hashujem mirror {args.mirror} ({args.algoritmus})...")
+        manifest = build_manifest(args.mirror, args.algoritmus, args.workers)
+        write_manifest(manifest, manifest_file, args.algoritmus)
+        total = sum(entry.size for entry in manifest.values())
+        print(f"✅ {len(manifest)} súborov ({total / (1024*1024):.2f} MB) za {time.time() - started:.1f}s")
+        print(f"💾 Manifest: {manifest_file}")
+        return 0
+
+    if args.command == 'over':
+        if not manifest_file.exists():
+            print(f"❌ Manifest {manifest_file} neexistuje - najprv spusti 'vytvor'")
+            return 1
+        algorithm, manifest = read_manifest(manifest_file)
+        result, updated = verify_mirror(args.mirror, manifest, algorithm,
+                                        quick=not args.uplne, workers=args.workers)
+
+        print(f"🔍 Overených {len(manifest)} záznamov za {time.time() - started:.1f}s")
+        print(f"✅ V poriadku: {len(result['ok'])}")
+        _print_paths("🕒 Zmenený len čas", result['touched'])
+        _print_paths("❌ Zmenený obsah", result['changed'])
+        _print_paths("❌ Chýbajúce", result['missing'])
+        _print_paths("⚠️  Nečitateľné", result['unreadable'])
+        _print_paths("➕ Nové", result['new'])
+
+        if args.aktualizuj:
+            write_manifest(updated, manifest_file, algorithm)
+            print(f"💾 Manifest aktualizovaný: {manifest_file}")
+
+        return 1 if result['changed'] or result['missing'] or result['unreadable'] else 0
+
+    old_algorithm, old = read_manifest(args.stary)
+    new_algorithm, new = read_manifest(args.novy)
+    if old_algorithm != new_algorithm:
+        # Hashe rôznych algoritmov sa nedajú porovnať - všetko by vyšlo ako zmenené
+        print(f"❌ Manifesty používajú rôzne algoritmy ({old_algorithm} a {new_algorithm}) - "
+              f"vytvor ich s rovnakým --algoritmus")
+        return 1
+    changes = diff_manifests(old, new)
+    _print_paths("➕ Pridané", changes['added'])
+    _print_paths("➖ Odstránené", changes['removed'])
+    _print_paths("✏️  Zmenené", changes['changed'])
+    if not any(changes.values()):
+        print("✅ Manifesty sú zhodné")
+    return 0
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Synchronizácia assets (obrázky, dokumenty) do výstupu pre Next.js
+Nezmenené súbory sa preskočia (veľkosť + mtime, pri zhode veľkosti aj hash),
+nové a zmenené sa vytvoria ako reflink (copy-on-write) alebo hardlink,
+inak sa kopírujú paralelne. Súbory, ktoré v zdroji už nie sú, sa zmažú.
+Pozor: hardlink zdieľa dáta so zálohou - výstup neupravovať na mieste
+(ak ho niečo prepisuje, použiť režim 'reflink' alebo 'copy').
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+# Poradie metód v režime 'auto': reflink nezdieľa dáta pri zápise, hardlink zdieľa inode
+METHODS = ('reflink', 'hardlink', 'copy')
+MODES = ('auto',) + METHODS
+
+FICLONE = 0x40049409  # Linux ioctl (btrfs, xfs, bcachefs...)
+
+TMP_PREFIX = '.sync-'
+
+def iter_tree(root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """Všetky súbory pod root ako (relatívna cesta s '/', stat)"""
+    stack = [(str(root), '')]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel + '/'))
+                elif entry.is_file() and not entry.name.startswith(TMP_PREFIX):
+                    yield rel, entry.stat()
+
+def file_digest(path, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def reflink(src: Path, dst: Path):
+    """Copy-on-write klon súboru (len Linux s podporou FICLONE)"""
+    if not sys.platform.startswith('linux'):
+        raise OSError(errno.ENOTSUP, "reflink nie je podporovaný", str(dst))
+    import fcntl
+
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    shutil.copystat(src, dst)
+
+class AssetSync:
+    def __init__(self, mode: str = 'auto', workers: int = None):
+        if mode not in MODES:
+            raise ValueError(f"Neznámy režim {mode}, povolené: {', '.join(MODES)}")
+        self.methods = METHODS if mode == 'auto' else (mode,)
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.unsupported = set()  # (metóda, zariadenie zdroja, zariadenie cieľa)
+
+    def place(self, src: Path, dst: Path, src_dev: int, dst_dev: int) -> str:
+        """Vytvorí dst ako kópiu src (atomicky cez dočasný súbor), vráti použitú metódu"""
+        tmp = dst.with_name(f"{TMP_PREFIX}{os.getpid()}-{dst.name}")
+        methods = [m for m in self.methods if (m, src_dev, dst_dev) not in self.unsupported] or ['copy']
+        for method in methods:
+            try:
+                if method == 'reflink':
+                    reflink(src, tmp)
+                elif method == 'hardlink':
+                    os.link(src, tmp)
+                else:
+                    shutil.copy2(src, tmp)
+                os.replace(tmp, dst)
+                return method
+            except OSError:
+                try:
+                    os.unlink(tmp)
+                except FileNotFoundError:
+                    pass
+                if method == methods[-1]:
+                    raise
+                # Na tejto dvojici zariadení to nepôjde ani pri ďalších súboroch
+                self.unsupported.add((method, src_dev, dst_dev))
+
+    def unchanged(self, src: Path, src_stat: os.stat_result, dst: Path) -> bool:
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            return False
+        if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+            return True  # hardlink na ten istý súbor
+        if dst_stat.st_size != src_stat.st_size:
+            return False
+        if dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return True
+        # Rovnaká veľkosť, iný čas - rozhodne obsah; pri zhode sa len zosúladí čas
+        if file_digest(src) != file_digest(dst):
+            return False
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        return True
+
+    def _sync_one(self, src_dir: Path, dst_dir: Path, rel: str, src_stat: os.stat_result,
+                  dst_dev: int) -> Tuple[str, int]:
+        src, dst = src_dir / rel, dst_dir / rel
+        if self.unchanged(src, src_stat, dst):
+            return 'unchanged', 0
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        return self.place(src, dst, src_stat.st_dev, dst_dev), src_stat.st_size
+
+    def sync_tree(self, src_dir, dst_dir, prune: bool = True) -> Dict:
+        """
+        Zosynchronizuje dst_dir so src_dir. Vráti počty podľa akcie
+        ('unchanged', 'reflink', 'hardlink', 'copy', 'pruned', 'errors'), bajty a čas.
+        """
+        src_dir, dst_dir = Path(src_dir), Path(dst_dir)
+        started = time.perf_counter()
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        dst_dev = os.stat(dst_dir).st_dev
+
+        stats = {action: 0 for action in ('unchanged',) + METHODS + ('pruned',)}
+        stats.update({'bytes': 0, 'errors': {}})
+
+        sources = dict(iter_tree(src_dir))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {rel: pool.submit(self._sync_one, src_dir, dst_dir, rel, st, dst_dev)
+                       for rel, st in sorted(sources.items())}
+            for rel, future in futures.items():
+                try:
+                    action, size = future.result()
+                except OSError as e:
+                    stats['errors'][rel] = str(e)
+                    continue
+                stats[action] += 1
+                stats['bytes'] += size
+
+        if prune:
+            for rel, _ in list(iter_tree(dst_dir)):
+                if rel not in sources:
+                    os.unlink(dst_dir / rel)
+                    stats['pruned'] += 1
+            # Prázdne priečinky po zmazaných súboroch
+            for dirpath, dirnames, filenames in os.walk(dst_dir, topdown=False):
+                if Path(dirpath) != dst_dir and not os.listdir(dirpath):
+                    os.rmdir(dirpath)
+
+        stats['files'] = len(sources)
+        stats['seconds'] = time.perf_counter() - started
+        return stats
+
+def sync_tree(src_dir, dst_dir, mode: str = 'auto', workers: int = None, prune: bool = True) -> Dict:
+    return AssetSync(mode, workers).sync_tree(src_dir, dst_dir, prune)
+
+def format_stats(stats: Dict) -> str:
+    placed = stats['reflink'] + stats['hardlink'] + stats['copy']
+    return (f"{stats['files']} súborov: nezmenených {stats['unchanged']}, nových/zmenených {placed} "
+            f"(reflink {stats['reflink']}, hardlink {stats['hardlink']}, kópia {stats['copy']}, "
+            f"{stats['bytes'] / 1024 / 1024:.1f} MB), zmazaných {stats['pruned']}, "
+            f"{stats['seconds']:.2f}s")
@@ -0,0 +1,152 @@
+"""
+Benchmark konvertora obsahu
+Porovná všeobecnú extrakciu (BeautifulSoup) s rýchlou Blogger cestou (lxml)
+na stránkach mirroru: čas na stránku a veľkosť výstupu.
+Porovná aj html2text s vlastným prevodom do Markdownu (priepustnosť a zhoda výstupu).
+"""
+
+import difflib
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from bs4 import XMLParsedAsHTMLWarning
+
+from lxml import etree, html as lxml_html
+
+from converter import BLOGGER_XPATH, ContentConverter
+from markdown_emitter import element_to_markdown
+
+def _timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+def benchmark_extraction(converter: ContentConverter, html_files, detail: bool = False):
+    """Zmeria obe cesty extrakcie pre každú stránku"""
+    rows = []
+    for html_file in html_files:
+        generic, generic_time = _timed(converter.extract_generic_article, html_file)
+        fast, fast_time = _timed(converter.extract_blogger_article, html_file)
+        rows.append({
+            'file': html_file,
+            'generic_time': generic_time,
+            'generic_size': len(generic['content']),
+            'fast_time': fast_time if fast is not None else None,
+            'fast_size': len(fast['content']) if fast is not None else None,
+        })
+
+    blogger = [row for row in rows if row['fast_time'] is not None]
+
+    print("📊 EXTRAKCIA ČLÁNKOV:")
+    print("-" * 70)
+    print(f"Stránok: {len(rows)}, z toho Blogger príspevkov (rýchla cesta): {len(blogger)}")
+    if not blogger:
+        return rows
+
+    generic_ms = [row['generic_time'] * 1000 for row in blogger]
+    fast_ms = [row['fast_time'] * 1000 for row in blogger]
+    generic_kb = sum(row['generic_size'] for row in blogger) / 1024
+    fast_kb = sum(row['fast_size'] for row in blogger) / 1024
+
+    print(f"{'':24}{'všeobecná':>14}{'Blogger/lxml':>14}")
+    print(f"{'priemer ms/stránku':24}{statistics.mean(generic_ms):14.1f}{statistics.mean(fast_ms):14.1f}")
+    print(f"{'medián ms/stránku':24}{statistics.median(generic_ms):14.1f}{statistics.median(fast_ms):14.1f}")
+    print(f"{'spolu s':24}{sum(generic_ms) / 1000:14.2f}{sum(fast_ms) / 1000:14.2f}")
+    print(f"{'Markdown spolu KB':24}{generic_kb:14.0f}{fast_kb:14.0f}")
+    print(f"Zrýchlenie: {sum(generic_ms) / sum(fast_ms):.1f}x, "
+          f"výstup menší {generic_kb / max(fast_kb, 1):.1f}x (bez navigácie, bočného panela a pätičky)")
+
+    if detail:
+        print()
+        print(f"{'stránka':50}{'ms':>8}{'ms':>8}{'KB':>8}{'KB':>8}")
+        for row in blogger:
+            print(f"{row['file'].name[:50]:50}{row['generic_time'] * 1000:8.1f}{row['fast_time'] * 1000:8.1f}"
+                  f"{row['generic_size'] / 1024:8.1f}{row['fast_size'] / 1024:8.1f}")
+    print()
+    return rows
+
+def _markdown_lines(text: str):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+def benchmark_markdown(converter: ContentConverter, html_files, detail: bool = False):
+    """Zmeria prevod tela príspevku do Markdownu: html2text vs. prechod lxml stromom"""
+    rows = []
+    for html_file in html_files:
+        try:
+            bodies = lxml_html.fromstring(html_file.read_bytes()).xpath(BLOGGER_XPATH['body'])
+        except (ValueError, etree.ParserError):
+            continue
+        if len(bodies) != 1:
+            continue
+
+        # html2text potrebuje serializovaný HTML reťazec, meria sa aj serializácia
+        reference, h2t_time = _timed(
+            lambda: converter.h2t.handle(lxml_html.tostring(bodies[0], encoding='unicode')))
+        emitted, emit_time = _timed(element_to_markdown, bodies[0])
+        similarity = difflib.SequenceMatcher(
+            None, _markdown_lines(reference), _markdown_lines(emitted), autojunk=False).ratio()
+        rows.append({
+            'file': html_file,
+            'html_size': len(lxml_html.tostring(bodies[0])),
+            'h2t_time': h2t_time,
+            'emit_time': emit_time,
+            'similarity': similarity,
+        })
+
+    print("📝 PREVOD DO MARKDOWNU (telo príspevku):")
+    print("-" * 70)
+    if not rows:
+        print("Žiadne Blogger príspevky")
+        return rows
+
+    html_kb = sum(row['html_size'] for row in rows) / 1024
+    h2t_s = sum(row['h2t_time'] for row in rows)
+    emit_s = sum(row['emit_time'] for row in rows)
+    similarity = [row['similarity'] for row in rows]
+
+    print(f"Príspevkov: {len(rows)}, HTML spolu: {html_kb:.0f} KB")
+    print(f"{'':24}{'html2text':>14}{'lxml strom':>14}")
+    print(f"{'spolu s':24}{h2t_s:14.2f}{emit_s:14.2f}")
+    print(f"{'priepustnosť KB/s':24}{html_kb / h2t_s:14.0f}{html_kb / emit_s:14.0f}")
+    print(f"Zrýchlenie: {h2t_s / emit_s:.1f}x")
+    print(f"Zhoda riadkov s html2text: priemer {statistics.mean(similarity):.1%}, "
+          f"medián {statistics.median(similarity):.1%}, "
+          f"úplná zhoda {sum(1 for s in similarity if s == 1.0)}/{len(rows)}")
+
+    if detail:
+        print()
+        print(f"{'príspevok':50}{'ms':>8}{'ms':>8}{'zhoda':>8}")
+        for row in sorted(rows, key=lambda r: r['similarity']):
+            print(f"{row['file'].name[:50]:50}{row['h2t_time'] * 1000:8.1f}{row['emit_time'] * 1000:8.1f}"
+                  f"{row['similarity']:8.0%}")
+    print()
+    return rows
+
+def main():
+    import argparse
+
+    warnings.filterwarnings('ignore', category=XMLParsedAsHTMLWarning)
+
+    parser = argparse.ArgumentParser(description="Benchmark konvertora obsahu")
+    parser.add_argument('--html', default="../hradiska-web", help="priečinok s HTML stránkami")
+    parser.add_argument('--limit', type=int, help="len prvých N stránok")
+    parser.add_argument('--detail', action='store_true', help="vypísať čas a veľkosť pre každú stránku")
+    args = parser.parse_args()
+
+    html_files = sorted(Path(args.html).rglob("*.html"))[:args.limit]
+    if not html_files:
+        print(f"❌ V {args.html} nie sú žiadne HTML súbory")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        converter = ContentConverter(backup_dir=tmp, output_dir=tmp)
+        benchmark_extraction(converter, html_files, args.detail)
+        benchmark_markdown(converter, html_files, args.detail)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
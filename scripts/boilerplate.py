@@ -0,0 +1,58 @@
+"""
+Odstránenie šablóny webu (bočný panel, blogroll, pätička) naprieč stránkami
+Obsah článku sa rozdelí na bloky (odseky Markdownu) a každý blok sa zahashuje.
+Bloky, ktoré sa opakujú na viac ako THRESHOLD podielu stránok, nie sú obsahom
+článku a z MDX sa vypustia. Počty stránok pre všetky hashe sa rátajú naraz cez numpy.
+"""
+
+import hashlib
+import re
+from typing import Iterable, List, Set, Tuple
+
+import numpy as np
+
+from search_index import strip_markdown
+
+THRESHOLD = 0.1  # podiel stránok, od ktorého je blok šablónou
+MIN_PAGES = 5    # a zároveň aspoň toľko stránok (malý korpus)
+
+_BLANK_LINE_RE = re.compile(r'\n[ \t]*\n')
+_MARKUP_RE = re.compile(r'[#*_>`|\\]+')
+
+def split_blocks(content: str) -> List[str]:
+    return [block for block in _BLANK_LINE_RE.split(content) if block.strip()]
+
+def block_hash(block: str) -> str:
+    """Hash bloku bez ohľadu na medzery a veľkosť písmen (16 hex znakov)"""
+    normalized = ' '.join(block.lower().split())
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
+
+def page_blocks(content: str) -> List[str]:
+    """Zoradené unikátne hashe blokov stránky (ukladajú sa do manifestu konverzie)"""
+    return sorted({block_hash(block) for block in split_blocks(content)})
+
+def find_boilerplate(pages: Iterable[List[str]], threshold: float = THRESHOLD,
+                     min_pages: int = MIN_PAGES) -> Set[str]:
+    """Hashe blokov, ktoré sú na viac ako threshold podielu stránok (a aspoň na min_pages)"""
+    pages = list(pages)
+    hashes = np.fromiter((int(h, 16) for blocks in pages for h in blocks), dtype=np.uint64)
+    if not hashes.size:
+        return set()
+    unique, counts = np.unique(hashes, return_counts=True)
+    limit = max(min_pages, threshold * len(pages))
+    return {f"{h:016x}" for h in unique[counts > limit].tolist()}
+
+def remove_boilerplate(content: str, boilerplate: Set[str]) -> Tuple[str, int]:
+    """Obsah bez blokov šablóny a počet vypustených blokov (bez zmeny vráti obsah nedotknutý)"""
+    if not boilerplate:
+        return content, 0
+    blocks = split_blocks(content)
+    kept = [block for block in blocks if block_hash(block) not in boilerplate]
+    if len(kept) == len(blocks):
+        return content, 0
+    return '\n\n'.join(block.strip('\n') for block in kept), len(blocks) - len(kept)
+
+def plain_excerpt(content: str, length: int = 200) -> str:
+    """Výťažok z Markdownu (po vypustení šablóny už pôvodný výťažok nesedí)"""
+    text = _MARKUP_RE.sub(' ', strip_markdown(content))
+    return ' '.join(text.split())[:length] + '...'
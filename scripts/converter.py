@@ -5,14 +5,96 @@ Konvertuje stiahnutý HTML obsah na Markdown/MDX formát
 
 import os
 import json
+import hashlib
+import math
 import re
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from bs4 import BeautifulSoup
 import html2text
-from typing import Dict, List
+from lxml import etree, html as lxml_html
+from typing import Dict, List, Optional
 from datetime import datetime
-import yaml
-import shutil
+from urllib.parse import urlparse
+
+from asset_sync import MODES as ASSET_MODES, AssetSync, format_stats
+from boilerplate import find_boilerplate, page_blocks, plain_excerpt, remove_boilerplate
+from geo_index import build_geo_tiles, coordinates_from_markdown, extract_coordinates
+from image_variants import build_variants
+from markdown_emitter import element_to_markdown
+from mdx_frontmatter import render_mdx
+from related_articles import build_related
+from search_index import build_search_index
+from static_json import sync_json_tree, write_json_if_changed
+
+# Pri zmene extrakcie alebo formátu MDX zvýš verziu - všetko sa skonvertuje nanovo
+CONVERTER_VERSION = 7
+
+# Predpočítané stránky zoznamu článkov pre API
+ARTICLES_PAGE_SIZE = 12
+RECENT_COUNT = 10
+
+# Slovenská diakritika -> ASCII (mená súborov, vyhľadávanie)
+SLOVAK_TRANSLITERATION = {
+    'á': 'a', 'č': 'c', 'ď': 'd', 'é': 'e', 'í': 'i',
+    'ľ': 'l', 'ň': 'n', 'ó': 'o', 'š': 's', 'ť': 't',
+    'ú': 'u', 'ý': 'y', 'ž': 'z', 'ô': 'o', 'ä': 'a',
+    'Á': 'A', 'Č': 'C', 'Ď': 'D', 'É': 'E', 'Í': 'I',
+    'Ľ': 'L', 'Ň': 'N', 'Ó': 'O', 'Š': 'S', 'Ť': 'T',
+    'Ú': 'U', 'Ý': 'Y', 'Ž': 'Z', 'Ô': 'O', 'Ä': 'A'
+}
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Uzly Blogger šablóny hradiska.sk
+BLOGGER_XPATH = {
+    'body': f"//div[{_has_class('post-body')}]",
+    'title': f"//h3[{_has_class('post-title')}]",
+    'canonical': "//link[@rel='canonical']/@href",
+    'published': f"//abbr[{_has_class('published')}]/@title",
+    'date_header': f"//h2[{_has_class('date-header')}]",
+    'labels': f"//span[{_has_class('post-labels')}]//a",
+}
+
+SLOVAK_MONTHS = {
+    'januára': 1, 'februára': 2, 'marca': 3, 'apríla': 4, 'mája': 5, 'júna': 6,
+    'júla': 7, 'augusta': 8, 'septembra': 9, 'októbra': 10, 'novembra': 11, 'decembra': 12,
+}
+
+def parse_slovak_date(text: str) -> Optional[str]:
+    """'streda 14. decembra 2016' -> '2016-12-14'"""
+    m = re.search(r'(\d{1,2})\.\s*([^\W\d_]+)\s+(\d{4})', text)
+    if not m or m.group(2).lower() not in SLOVAK_MONTHS:
+        return None
+    return f"{m.group(3)}-{SLOVAK_MONTHS[m.group(2).lower()]:02d}-{int(m.group(1)):02d}"
+
+_ISO_DATE_RE = re.compile(r'\s*(\d{4})-(\d{2})-(\d{2})')
+_PATH_DATE_RE = re.compile(r'(?:^|/)((?:19|20)\d{2})/(0[1-9]|1[0-2])(?:/|$)')
+
+def normalize_date(value: Optional[str]) -> Optional[str]:
+    """Blogger časová značka, ISO dátum alebo slovenský text -> 'YYYY-MM-DD'"""
+    if not value:
+        return None
+    m = _ISO_DATE_RE.match(value)
+    if m:
+        try:
+            return datetime(*map(int, m.groups())).strftime('%Y-%m-%d')
+        except ValueError:
+            return None
+    return parse_slovak_date(value)
+
+def date_from_path(path: str) -> Optional[str]:
+    """'/2016/12/clanok.html' -> '2016-12' (Blogger adresa obsahuje len rok a mesiac)"""
+    m = _PATH_DATE_RE.search(path)
+    return f"{m.group(1)}-{m.group(2)}" if m else None
+
+def chronological(articles: List[Dict]) -> List[Dict]:
+    """Od najnovších; články bez dátumu na konci (pri zhode ostáva pôvodné poradie)"""
+    dated = sorted((a for a in articles if a.get('date')), key=lambda a: a['date'], reverse=True)
+    return dated + [a for a in articles if not a.get('date')]
 
 class ContentConverter:
     def __init__(self, backup_dir: str = "../backup", output_dir: str = "../nextjs-app/content"):
@@ -43,16 +125,7 @@ class ContentConverter:
     def sanitize_filename(self, title: str) -> str:
         """Vytvorí bezpečné meno súboru z titulku"""
         # Odstránenie diakritiky
-        replacements = {
-            'á': 'a', 'č': 'c', 'ď': 'd', 'é': 'e', 'í': 'i',
-            'ľ': 'l', 'ň': 'n', 'ó': 'o', 'š': 's', 'ť': 't',
-            'ú': 'u', 'ý': 'y', 'ž': 'z', 'ô': 'o', 'ä': 'a',
-            'Á': 'A', 'Č': 'C', 'Ď': 'D', 'É': 'E', 'Í': 'I',
-            'Ľ': 'L', 'Ň': 'N', 'Ó': 'O', 'Š': 'S', 'Ť': 'T',
-            'Ú': 'U', 'Ý': 'Y', 'Ž': 'Z', 'Ô': 'O', 'Ä': 'A'
-        }
-
-        for sk, en in replacements.items():
+        for sk, en in SLOVAK_TRANSLITERATION.items():
             title = title.replace(sk, en)
 
         # Nahradenie špeciálnych znakov
@@ -60,26 +133,107 @@ class ContentConverter:
         filename = re.sub(r'[-\s]+', '-', filename)
         return filename[:100]  # Max dĺžka 100 znakov
 
-    def extract_article_from_html(self, html_file: Path) -> Dict:
-        """Extrahuje článok z HTML súboru"""
-        with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-            html_content = f.read()
-
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        article = {
+    def new_article(self) -> Dict:
+        return {
             'title': '',
             'slug': '',
             'content': '',
             'excerpt': '',
-            'date': datetime.now().isoformat(),
+            'date': None,
             'author': 'hradiska.sk',
             'categories': [],
             'tags': [],
             'images': [],
-            'original_url': ''
+            'original_url': '',
+            'coordinates': [],
+            'generic': False
         }
 
+    def extract_article_from_html(self, html_file: Path, fast: bool = True) -> Dict:
+        """Extrahuje článok z HTML súboru (Blogger stránky rýchlou cestou cez lxml)"""
+        article = self.extract_blogger_article(html_file) if fast else None
+        if article is None:
+            article = self.extract_generic_article(html_file)
+
+        # Dátum zo stránky, inak aspoň rok a mesiac z adresy (/YYYY/MM/)
+        try:
+            rel_path = html_file.relative_to(self.find_html_dir()).as_posix()
+        except ValueError:
+            rel_path = html_file.name
+        article['date'] = (normalize_date(article['date'])
+                           or date_from_path(urlparse(article['original_url']).path)
+                           or date_from_path(rel_path))
+        return article
+
+    def extract_blogger_article(self, html_file: Path) -> Optional[Dict]:
+        """
+        Rýchla extrakcia pre Blogger šablónu hradiska.sk: priamo telo príspevku
+        (div.post-body), titulok (h3.post-title), štítky a dátum. Vráti None,
+        ak stránka nie je jeden Blogger príspevok (zoznamy, iné súbory).
+        """
+        try:
+            tree = lxml_html.fromstring(html_file.read_bytes())
+        except (etree.ParserError, ValueError):
+            return None
+
+        bodies = tree.xpath(BLOGGER_XPATH['body'])
+        if len(bodies) != 1:
+            return None
+        content_elem = bodies[0]
+
+        article = self.new_article()
+
+        titles = tree.xpath(BLOGGER_XPATH['title'])
+        if titles:
+            article['title'] = ' '.join(titles[0].text_content().split())
+            article['slug'] = self.sanitize_filename(article['title'])
+
+        canonical = tree.xpath(BLOGGER_XPATH['canonical'])
+        if canonical:
+            article['original_url'] = canonical[0]
+
+        for img in content_elem.iter('img'):
+            article['images'].append({
+                'src': img.get('src', ''),
+                'alt': img.get('alt', ''),
+                'title': img.get('title', '')
+            })
+
+        # Konverzia na Markdown priamo zo stromu (bez serializácie pre html2text)
+        article['content'] = element_to_markdown(content_elem)
+
+        # Vytvorenie výťažku
+        text = content_elem.text_content()
+        article['excerpt'] = ' '.join(text[:500].split())[:200] + '...'
+
+        # Súradnice z vložených máp, odkazov a textu (len telo príspevku - nie bočný panel)
+        article['coordinates'] = extract_coordinates(content_elem.xpath('.//iframe/@src | .//a/@href'), text)
+
+        # Dátum - časová značka príspevku, inak hlavička dňa
+        published = tree.xpath(BLOGGER_XPATH['published'])
+        if published:
+            article['date'] = published[0]
+        else:
+            headers = tree.xpath(BLOGGER_XPATH['date_header'])
+            if headers:
+                article['date'] = headers[0].text_content()
+
+        article['categories'] = [
+            label.text_content().strip() for label in tree.xpath(BLOGGER_XPATH['labels'])
+        ]
+
+        return article
+
+    def extract_generic_article(self, html_file: Path) -> Dict:
+        """Všeobecná extrakcia cez BeautifulSoup (pre stránky mimo Blogger šablóny)"""
+        with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
+            html_content = f.read()
+
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        article = self.new_article()
+        article['generic'] = True
+
         # Titulok
         title_elem = soup.find('h1') or soup.find('title')
         if title_elem:
@@ -122,8 +276,7 @@ class ContentConverter:
         date_elem = soup.find(['time', '.date', '.post-date'])
         if date_elem:
             date_text = date_elem.get('datetime') or date_elem.get_text()
-            # Tu by sme mali parsovať dátum, ale nechám ako je
-            article['date'] = date_text or article['date']
+            article['date'] = date_text.strip() or None
 
         # Kategórie a tagy
         for cat_elem in soup.select('.category, .cat-links a'):
@@ -148,86 +301,384 @@ class ContentConverter:
             'images': article['images']
         }
 
-        mdx_content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)}---
-
-{article['content']}
-"""
-        return mdx_content
+        return render_mdx(frontmatter, article['content'])
+
+    def convert_file(self, html_file: Path) -> Dict:
+        """
+        Skonvertuje jeden HTML súbor. Vráti záznam do articles.json, článok a pri
+        všeobecnej extrakcii aj hashe blokov obsahu (hľadanie šablóny webu); MDX
+        skladá a zapisuje volajúci (kvôli deterministickému poradiu pri paralelnom behu).
+        """
+        # Extrakcia článku
+        article = self.extract_article_from_html(html_file)
+
+        if not article['title']:
+            article['title'] = html_file.stem
+            article['slug'] = self.sanitize_filename(html_file.stem)
+
+        mdx_filename = f"{article['slug']}.mdx"
+
+        return {
+            'entry': {
+                'title': article['title'],
+                'slug': article['slug'],
+                'file': mdx_filename,
+                'date': article['date'],
+                'categories': article['categories'],
+                'tags': article['tags'],
+                'cover': article['images'][0]['src'] if article['images'] else None,
+                'coordinates': article['coordinates']
+            },
+            'article': article,
+            'blocks': page_blocks(article['content']) if article['generic'] else None
+        }
 
-    def process_all_html_files(self):
-        """Spracuje všetky HTML súbory"""
+    def find_html_dir(self) -> Path:
         html_dir = self.backup_dir / "html"
         if not html_dir.exists():
             html_dir = self.backup_dir / "wget_backup" / "www.hradiska.sk"
-
-        articles_data = []
+        return html_dir
+
+    def find_html_files(self) -> List[Path]:
+        # Zoradené, aby bol výstup (articles.json) pri každom behu rovnaký
+        return sorted(self.find_html_dir().rglob("*.html"))
+
+    def load_manifest(self) -> Dict:
+        """Manifest konverzie z minulého behu (prázdny pri inej verzii konvertora)"""
+        manifest_file = self.data_dir / "conversion_manifest.json"
+        if manifest_file.exists():
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == CONVERTER_VERSION:
+                return manifest
+        return {'version': CONVERTER_VERSION, 'files': {}, 'outputs': {}}
+
+    def process_all_html_files(self, workers: int = None, incremental: bool = True):
+        """
+        Spracuje všetky HTML súbory (paralelne v procesoch, výsledky v pôvodnom poradí).
+        Inkrementálne: súbory s nezmeneným hashom a rovnakou verziou konvertora sa
+        preskočia, výstupy odstránených zdrojov sa zmažú. Stránkam bez Blogger
+        šablóny sa vypustia bloky, ktoré sa opakujú na mnohých z nich (šablóna webu).
+        """
+        workers = workers or os.cpu_count() or 1
+        timings = []
 
         # Nájdenie všetkých HTML súborov
-        html_files = list(html_dir.rglob("*.html"))
+        html_dir = self.find_html_dir()
+        html_files = self.find_html_files()
+        sources = {html_file: html_file.relative_to(html_dir).as_posix() for html_file in html_files}
         print(f"Nájdených {len(html_files)} HTML súborov")
 
-        for i, html_file in enumerate(html_files, 1):
-            print(f"Spracovávam {i}/{len(html_files)}: {html_file.name}")
-
-            try:
-                # Extrakcia článku
-                article = self.extract_article_from_html(html_file)
-
-                if not article['title']:
-                    article['title'] = html_file.stem
-                    article['slug'] = self.sanitize_filename(html_file.stem)
-
-                # Konverzia na MDX
-                mdx_content = self.convert_to_mdx(article)
-
-                # Uloženie MDX súboru
-                mdx_filename = f"{article['slug']}.mdx"
-                mdx_path = self.content_dir / mdx_filename
-
-                with open(mdx_path, 'w', encoding='utf-8') as f:
-                    f.write(mdx_content)
-
-                articles_data.append({
-                    'title': article['title'],
-                    'slug': article['slug'],
-                    'file': mdx_filename,
-                    'date': article['date'],
-                    'categories': article['categories'],
-                    'tags': article['tags']
-                })
-
-            except Exception as e:
-                print(f"Chyba pri spracovaní {html_file}: {e}")
+        started = time.perf_counter()
+        previous = self.load_manifest() if incremental else {'files': {}, 'outputs': {}}
+        records = {}    # zdroj -> {'hash', 'file', 'entry', 'blocks'}
+        converted = {}  # zdroj -> článok (len práve skonvertované)
+
+        digests = {}
+        for html_file, rel in sources.items():
+            digests[rel] = hashlib.blake2b(html_file.read_bytes(), digest_size=16).hexdigest()
+            known = previous['files'].get(rel)
+            if known and known['hash'] == digests[rel] and (self.content_dir / known['file']).exists():
+                records[rel] = known
+
+        def convert(batch: List[Path]):
+            if not batch:
+                return
+            print(f"Konvertujem {len(batch)} súborov ({workers} procesov)")
+            for i, (html_file, result, elapsed, error) in enumerate(self._convert_files(batch, workers), 1):
+                print(f"Spracovávam {i}/{len(batch)}: {html_file.name} ({elapsed * 1000:.0f} ms)")
+                rel = sources[html_file]
+
+                if error:
+                    print(f"Chyba pri spracovaní {html_file}: {error}")
+                    records.pop(rel, None)
+                    continue
+
+                records[rel] = {'hash': digests[rel], 'file': result['entry']['file'], 'entry': result['entry']}
+                if result['blocks'] is not None:
+                    records[rel]['blocks'] = result['blocks']
+                converted[rel] = result['article']
+                timings.append((elapsed, html_file))
+
+        convert([html_file for html_file in html_files if sources[html_file] not in records])
+
+        # Šablóna webu z hashov blokov všetkých stránok naraz; nezmenené stránky
+        # s blokmi, ktoré do šablóny pribudli alebo z nej vypadli, treba skonvertovať znova
+        boilerplate = find_boilerplate(record['blocks'] for record in records.values() if 'blocks' in record)
+        changed_boilerplate = boilerplate.symmetric_difference(previous.get('boilerplate', []))
+        if changed_boilerplate:
+            convert([html_file for html_file in html_files
+                     if sources[html_file] in records and sources[html_file] not in converted
+                     and changed_boilerplate.intersection(records[sources[html_file]].get('blocks', ()))])
+
+        # Pri zhode slugov vyhráva posledný zdroj v poradí (ako pri sériovom behu)
+        outputs = {}
+        for html_file in html_files:
+            rel = sources[html_file]
+            if rel in records:
+                outputs[records[rel]['file']] = rel
+
+        # Nezmenený zdroj, ktorého výstup naposledy zapísal iný zdroj, treba skonvertovať znova
+        by_source = {rel: html_file for html_file, rel in sources.items()}
+        convert([by_source[rel] for mdx_filename, rel in outputs.items()
+                 if rel not in converted and previous['outputs'].get(mdx_filename) != rel])
+
+        # Uloženie MDX súborov (bez blokov šablóny)
+        removed_blocks = cleaned = 0
+        for mdx_filename, rel in outputs.items():
+            if rel not in converted:
                 continue
+            article = converted[rel]
+            if article['generic']:
+                content, removed = remove_boilerplate(article['content'], boilerplate)
+                if removed:
+                    article['content'] = content
+                    article['excerpt'] = plain_excerpt(content)
+                    removed_blocks += removed
+                    cleaned += 1
+                # Súradnice až z obsahu bez šablóny (bočný panel má vlastné odkazy na mapy)
+                records[rel]['entry']['coordinates'] = coordinates_from_markdown(article['content'])
+            with open(self.content_dir / mdx_filename, 'w', encoding='utf-8') as f:
+                f.write(self.convert_to_mdx(article))
+
+        # Výstupy zdrojov, ktoré už neexistujú
+        pruned = 0
+        for mdx_filename in previous['outputs']:
+            mdx_path = self.content_dir / mdx_filename
+            if mdx_filename not in outputs and mdx_path.exists():
+                mdx_path.unlink()
+                pruned += 1
+
+        articles_data = [records[sources[html_file]]['entry'] for html_file in html_files
+                         if sources[html_file] in records]
 
         # Uloženie zoznamu článkov
         articles_json = self.data_dir / "articles.json"
         with open(articles_json, 'w', encoding='utf-8') as f:
             json.dump(articles_data, f, ensure_ascii=False, indent=2)
 
-        print(f"Konverzia dokončená! Spracovaných {len(articles_data)} článkov.")
-
-    def copy_assets(self):
-        """Skopíruje obrázky a iné assets"""
-        # Kopírovanie obrázkov
-        src_images = self.backup_dir / "assets" / "images"
-        if src_images.exists():
-            for img_file in src_images.iterdir():
-                if img_file.is_file():
-                    shutil.copy2(img_file, self.images_dir)
-                    print(f"Skopírovaný obrázok: {img_file.name}")
-
-        # Kopírovanie dokumentov
-        src_docs = self.backup_dir / "documents"
+        # Manifest pre ďalší inkrementálny beh
+        with open(self.data_dir / "conversion_manifest.json", 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': CONVERTER_VERSION,
+                'files': {rel: records[rel] for rel in sorted(records)},
+                'outputs': dict(sorted(outputs.items())),
+                'boilerplate': sorted(boilerplate),
+            }, f, ensure_ascii=False, indent=1)
+
+        total = time.perf_counter() - started
+        cpu = sum(elapsed for elapsed, _ in timings)
+        print(f"Konverzia dokončená! Článkov: {len(articles_data)}, skonvertovaných: {len(timings)}, "
+              f"nezmenených: {len(records) - len(converted)}, odstránených výstupov: {pruned}")
+        print(f"Šablóna webu: {len(boilerplate)} blokov, vypustených {removed_blocks} blokov "
+              f"z {cleaned} článkov")
+        print(f"Čas: {total:.2f}s (súčet časov súborov {cpu:.1f}s)")
+        if timings:
+            print("Najpomalšie súbory:")
+            for elapsed, html_file in sorted(timings, key=lambda x: x[0], reverse=True)[:5]:
+                print(f"  {elapsed * 1000:7.0f} ms  {html_file.name}")
+
+    def _convert_files(self, html_files: List[Path], workers: int):
+        """Generuje (súbor, výsledok, čas, chyba) v poradí vstupu"""
+        if workers <= 1:
+            for html_file in html_files:
+                yield (html_file,) + _timed_convert(self, html_file)
+            return
+
+        chunksize = max(1, len(html_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(self.backup_dir), str(self.output_dir))) as pool:
+            for html_file, outcome in zip(html_files, pool.map(_convert_worker, html_files,
+                                                               chunksize=chunksize)):
+                yield (html_file,) + outcome
+
+    def copy_assets(self, mode: str = 'auto', workers: int = None):
+        """
+        Synchronizuje obrázky a dokumenty do výstupu: nezmenené preskočí,
+        nové vytvorí ako reflink/hardlink (inak paralelná kópia), zastarané zmaže
+        """
         docs_dir = self.output_dir / "documents"
         docs_dir.mkdir(exist_ok=True)
 
-        if src_docs.exists():
-            for doc_file in src_docs.iterdir():
-                if doc_file.is_file():
-                    shutil.copy2(doc_file, docs_dir)
-                    print(f"Skopírovaný dokument: {doc_file.name}")
+        syncer = AssetSync(mode, workers)
+        for label, src_dir, dst_dir in [
+            ("Obrázky", self.backup_dir / "assets" / "images", self.images_dir),
+            ("Dokumenty", self.backup_dir / "documents", docs_dir),
+        ]:
+            # Bez zdroja nič nemažeme (napr. nekompletná záloha)
+            if not src_dir.exists():
+                print(f"{label}: zdroj {src_dir} neexistuje, preskakujem")
+                continue
+
+            stats = syncer.sync_tree(src_dir, dst_dir)
+            print(f"{label}: {format_stats(stats)}")
+            for rel, error in stats['errors'].items():
+                print(f"  Chyba pri kopírovaní {rel}: {error}")
+
+    def build_image_variants(self, workers: int = None):
+        """Responzívne varianty obrázkov do public/ Next.js projektu a manifest data/images.json"""
+        variants_dir = self.output_dir.parent / "public" / "images" / "responsive"
+        stats = build_variants(self.images_dir, variants_dir, self.data_dir / "images.json",
+                               url_prefix="/images/responsive", workers=workers)
+        print(f"Obrázkov: {stats['images']} (formáty: {', '.join(stats['formats'] + ['jpeg/png'])}), "
+              f"spracovaných: {stats['processed']}, z cache: {stats['cached']}, "
+              f"zmazaných variantov: {stats['pruned']}, {stats['seconds']:.2f}s")
+        for rel, error in stats['errors'].items():
+            print(f"  Chyba pri spracovaní {rel}: {error}")
+
+    def load_articles(self) -> Optional[List[Dict]]:
+        """Články z articles.json; pri zhode MDX súborov platí posledný záznam (ako pri zápise)"""
+        articles_json = self.data_dir / "articles.json"
+        if not articles_json.exists():
+            return None
+
+        with open(articles_json, 'r', encoding='utf-8') as f:
+            articles = json.load(f)
+
+        by_file = {}
+        for article in articles:
+            by_file.pop(article['file'], None)
+            by_file[article['file']] = article
+        return list(by_file.values())
+
+    def generate_article_pages(self, page_size: int = ARTICLES_PAGE_SIZE):
+        """
+        Predpočítané stránky pre /api/articles do data/api: articles/page-N.json,
+        categories/<slug>/page-N.json, recent.json, archív po rokoch a mesiacoch
+        (archive/<YYYY>.json, archive/<YYYY-MM>.json, archive/index.json)
+        a index.json s kategóriami. Všetky zoznamy sú od najnovších.
+        """
+        articles = self.load_articles()
+        if articles is None:
+            print("Súbor s článkami neexistuje!")
+            return
+        articles = chronological(articles)
+
+        def paginate(prefix: str, items: List[Dict]) -> Dict[str, Dict]:
+            pages = max(1, math.ceil(len(items) / page_size))
+            return {
+                f"{prefix}/page-{n}.json": {
+                    'page': n,
+                    'pages': pages,
+                    'total': len(items),
+                    'items': items[(n - 1) * page_size:n * page_size],
+                }
+                for n in range(1, pages + 1)
+            }
+
+        files = paginate("articles", articles)
+
+        by_category = defaultdict(list)
+        for article in articles:
+            for category in article.get('categories', []):
+                by_category[category].append(article)
+
+        categories = []
+        used_slugs = set()
+        for name in sorted(by_category):
+            slug = base = self.sanitize_filename(name) or "kategoria"
+            n = 2
+            while slug in used_slugs:
+                slug = f"{base}-{n}"
+                n += 1
+            used_slugs.add(slug)
+            files.update(paginate(f"categories/{slug}", by_category[name]))
+            categories.append({
+                'name': name,
+                'slug': slug,
+                'count': len(by_category[name]),
+                'pages': max(1, math.ceil(len(by_category[name]) / page_size)),
+            })
+
+        files["recent.json"] = [a for a in articles[:RECENT_COUNT] if a.get('date')]
+        files.update(self.archive_files(articles))
+        files["index.json"] = {
+            'page_size': page_size,
+            'total': len(articles),
+            'pages': max(1, math.ceil(len(articles) / page_size)),
+            'categories': categories,
+        }
+
+        written, removed = sync_json_tree(self.data_dir / "api", files)
+        print(f"API stránky: {len(files)} súborov ({len(articles)} článkov, {len(categories)} kategórií, "
+              f"po {page_size}), zmenených {written}, zmazaných {removed}")
+
+    def archive_files(self, articles: List[Dict]) -> Dict[str, object]:
+        """Archív z chronologicky zoradených článkov; bez dátumu idú do archive/undated.json"""
+        by_year = defaultdict(list)
+        by_month = defaultdict(list)
+        undated = []
+        for article in articles:
+            date = article.get('date')
+            if not date:
+                undated.append(article)
+                continue
+            by_year[date[:4]].append(article)
+            by_month[date[:7]].append(article)
+
+        files = {f"archive/{year}.json": items for year, items in by_year.items()}
+        files.update({f"archive/{month}.json": items for month, items in by_month.items()})
+        if undated:
+            files["archive/undated.json"] = undated
+        files["archive/index.json"] = {
+            'total': len(articles),
+            'undated': len(undated),
+            'years': [
+                {
+                    'year': year,
+                    'count': len(by_year[year]),
+                    'months': [
+                        {'month': month, 'count': len(by_month[month])}
+                        for month in sorted((m for m in by_month if m.startswith(year)), reverse=True)
+                    ],
+                }
+                for year in sorted(by_year, reverse=True)
+            ],
+        }
+        return files
+
+    def generate_search_index(self):
+        """Statický vyhľadávací index do public/search Next.js projektu"""
+        articles = self.load_articles()
+        if articles is None:
+            print("Súbor s článkami neexistuje!")
+            return
+
+        search_dir = self.output_dir.parent / "public" / "search"
+        stats = build_search_index(articles, self.content_dir, search_dir, SLOVAK_TRANSLITERATION)
+        print(f"Vyhľadávací index: {stats['docs']} článkov, {stats['terms']} termínov v {stats['shards']} "
+              f"častiach ({stats['total_kb']:.0f} KB, medián {stats['median_kb']:.1f} KB, "
+              f"najväčšia {stats['largest_kb']:.1f} KB), zmenených {stats['written']}, "
+              f"zmazaných {stats['removed']}")
+
+    def generate_related_articles(self):
+        """Súvisiace články (TF-IDF podobnosť) do data/related.json"""
+        articles = self.load_articles()
+        if articles is None:
+            print("Súbor s článkami neexistuje!")
+            return
+
+        stats = build_related(articles, self.content_dir, self.data_dir / "related.json", SLOVAK_TRANSLITERATION)
+        print(f"Súvisiace články: {stats['linked']}/{stats['articles']} článkov s odkazmi, "
+              f"{stats['terms']} termínov ({stats['nnz']} nenulových váh), "
+              f"{'zapísané' if stats['written'] else 'bez zmeny'}, {stats['seconds']:.2f}s")
+
+    def generate_map_tiles(self):
+        """Miesta z článkov do data/places.json a dlaždice mapy do public/geo Next.js projektu"""
+        articles = self.load_articles()
+        if articles is None:
+            print("Súbor s článkami neexistuje!")
+            return
+
+        places = [
+            {'lat': lat, 'lon': lon, 'slug': article['slug'], 'title': article['title']}
+            for article in articles for lat, lon in article.get('coordinates', [])
+        ]
+        write_json_if_changed(self.data_dir / "places.json", places)
+
+        stats = build_geo_tiles(places, self.output_dir.parent / "public" / "geo")
+        print(f"Mapa: {stats['points']} miest z {len({p['slug'] for p in places})} článkov, "
+              f"{stats['tiles']} dlaždíc, zmenených {stats['written']}, zmazaných {stats['removed']}")
 
     def generate_navigation_structure(self):
         """Generuje navigačnú štruktúru pre Next.js"""
@@ -246,19 +697,16 @@ class ContentConverter:
         }
 
         # Načítanie článkov
-        articles_json = self.data_dir / "articles.json"
-        if articles_json.exists():
-            with open(articles_json, 'r', encoding='utf-8') as f:
-                articles = json.load(f)
+        articles = self.load_articles()
+        if articles is not None:
+            # Kategórie
+            categories = set()
+            for article in articles:
+                categories.update(article.get('categories', []))
+            navigation['categories'] = sorted(list(categories))
 
-                # Kategórie
-                categories = set()
-                for article in articles:
-                    categories.update(article.get('categories', []))
-                navigation['categories'] = sorted(list(categories))
-
-                # Posledné príspevky
-                navigation['recentPosts'] = articles[:10]
+            # Posledné príspevky (podľa dátumu publikovania)
+            navigation['recentPosts'] = [a for a in chronological(articles)[:RECENT_COUNT] if a.get('date')]
 
         # Uloženie navigácie
         nav_file = self.data_dir / "navigation.json"
@@ -267,24 +715,75 @@ class ContentConverter:
 
         print("Navigačná štruktúra vygenerovaná")
 
+def _timed_convert(converter: ContentConverter, html_file: Path):
+    started = time.perf_counter()
+    try:
+        result = converter.convert_file(html_file)
+        return result, time.perf_counter() - started, ""
+    except Exception as e:
+        return None, time.perf_counter() - started, str(e)
+
+# Konvertor v pracovnom procese (vytvorí sa raz na proces)
+_worker_converter = None
+
+def _init_worker(backup_dir: str, output_dir: str):
+    global _worker_converter
+    _worker_converter = ContentConverter(backup_dir, output_dir)
+
+def _convert_worker(html_file: Path):
+    return _timed_convert(_worker_converter, html_file)
+
 def main():
     """Hlavná funkcia"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Konverzia HTML obsahu do MDX")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="počet procesov (1 = sériovo)")
+    parser.add_argument('--vsetko', action='store_true',
+                        help="skonvertovať všetky súbory (ignorovať manifest konverzie)")
+    parser.add_argument('--bez-variantov', action='store_true',
+                        help="negenerovať responzívne varianty obrázkov")
+    parser.add_argument('--assets', choices=ASSET_MODES, default='auto',
+                        help="spôsob kopírovania obrázkov a dokumentov (auto = reflink, hardlink, kópia)")
+    args = parser.parse_args()
+
     converter = ContentConverter()
 
     print("Začínam konverziu obsahu...")
     print("-" * 50)
 
     # Spracovanie HTML súborov
-    converter.process_all_html_files()
+    converter.process_all_html_files(args.workers, incremental=not args.vsetko)
 
     # Kopírovanie assets
     print("\nKopírovanie obrázkov a dokumentov...")
-    converter.copy_assets()
+    converter.copy_assets(args.assets)
+
+    if not args.bez_variantov:
+        print("\nGenerovanie responzívnych variantov obrázkov...")
+        converter.build_image_variants(args.workers)
 
     # Generovanie navigácie
     print("\nGenerovanie navigačnej štruktúry...")
     converter.generate_navigation_structure()
 
+    # Predpočítané stránky pre API
+    print("\nGenerovanie stránok zoznamu článkov...")
+    converter.generate_article_pages()
+
+    # Vyhľadávanie
+    print("\nGenerovanie vyhľadávacieho indexu...")
+    converter.generate_search_index()
+
+    # Súvisiace články
+    print("\nHľadanie súvisiacich článkov...")
+    converter.generate_related_articles()
+
+    # Mapa
+    print("\nGenerovanie dlaždíc mapy...")
+    converter.generate_map_tiles()
+
     print("\n" + "=" * 50)
     print("Konverzia dokončená!")
     print(f"Obsah je pripravený v: {converter.output_dir}")
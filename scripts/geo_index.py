@@ -0,0 +1,200 @@
+"""
+Mapa hradísk - súradnice z článkov a dlaždice GeoJSON pre Next.js
+Súradnice sa hľadajú vo vložených mapách a odkazoch (Google Maps, Mapy.cz,
+OpenStreetMap, Freemap, ZBGIS, GKU) a v texte (stupne s N/E, "GPS: lat, lon").
+Body sa pre každú úroveň priblíženia zlúčia do zhlukov na mriežke v pixeloch
+a rozdelia do dlaždíc z/x/y (Web Mercator, ako podkladová mapa), takže mapa
+načíta len dlaždice vo výreze.
+"""
+
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from static_json import sync_json_tree
+
+GEO_VERSION = 1
+
+MIN_ZOOM = 6
+MAX_ZOOM = 13         # na najväčšom priblížení sa body nezhlukujú
+TILE_SIZE = 256
+CLUSTER_RADIUS = 40   # px - bližšie body sa na danej úrovni zlúčia
+PRECISION = 5         # desatinné miesta súradníc (~1 m)
+
+MAP_HOSTS = ('google.', 'mapy.cz', 'openstreetmap.', 'freemap.sk', 'skgeodesy.sk', 'gku.sk', 'geoportal.')
+
+_NUMBER = r'-?\d{1,3}\.\d+'
+_PAIR_RE = re.compile(rf'\s*({_NUMBER})\s*,\s*({_NUMBER})')
+_GOOGLE_AT_RE = re.compile(rf'@({_NUMBER}),({_NUMBER})')
+_GOOGLE_PB_RE = re.compile(rf'!2d({_NUMBER})!3d({_NUMBER})|!3d({_NUMBER})!4d({_NUMBER})')
+_FRAGMENT_MAP_RE = re.compile(rf'map=\d+(?:\.\d+)?/({_NUMBER})/({_NUMBER})')
+
+# 48°30'13"N 18°19'11"E, 48.5038°N, 48°30,2' s. š.
+_DEGREES_RE = re.compile(
+    r'(\d{1,3}(?:[.,]\d+)?)\s*°\s*'
+    r'(?:(\d{1,2}(?:[.,]\d+)?)\s*[\'′’]\s*)?'
+    r'(?:(\d{1,2}(?:[.,]\d+)?)\s*(?:"|″|”|\'\'|’’)\s*)?'
+    r'([NSEW]|[sj]\.\s*š\.|[vz]\.\s*d\.)'
+)
+_GPS_RE = re.compile(r'GPS\W{0,5}(\d{1,2}[.,]\d{3,})\s*[°NS]?\s*[,;\s]\s*(\d{1,3}[.,]\d{3,})', re.IGNORECASE)
+_MD_URL_RE = re.compile(r'\]\((\S+?)\)|<(https?://[^>\s]+)>')
+
+Point = Tuple[float, float]  # (lat, lon)
+
+# s. š. = severnej šírky, v. d. = východnej dĺžky
+SLOVAK_HEMISPHERES = {'s': 'N', 'j': 'S', 'v': 'E', 'z': 'W'}
+
+def _point(lat, lon) -> Optional[Point]:
+    try:
+        lat, lon = float(str(lat).replace(',', '.')), float(str(lon).replace(',', '.'))
+    except ValueError:
+        return None
+    if not (-85 < lat < 85 and -180 <= lon <= 180) or (lat == 0 and lon == 0):
+        return None
+    return round(lat, PRECISION), round(lon, PRECISION)
+
+def coordinates_from_url(url: str) -> List[Point]:
+    """Súradnice z adresy mapy (parametre, cesta, fragment); iné adresy sa ignorujú"""
+    parsed = urlparse(unquote(url.replace('&amp;', '&')))
+    host = parsed.netloc.lower()
+    if not any(h in host for h in MAP_HOSTS) or ('google.' in host and 'maps' not in host + parsed.path):
+        return []
+    query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+    found = []
+    for key in ('ll', 'q', 'center', 'pos', 'query'):
+        m = _PAIR_RE.match(query.get(key, ''))
+        if m:
+            found.append(_point(m.group(1), m.group(2)))
+    m = _PAIR_RE.match(query.get('c', ''))
+    if m and 'skgeodesy' in host:  # ZBGIS: c=lon,lat
+        found.append(_point(m.group(2), m.group(1)))
+    for lat_key, lon_key in (('lat', 'lng'), ('lat', 'lon'), ('mlat', 'mlon'), ('y', 'x')):
+        if lat_key in query and lon_key in query:
+            found.append(_point(query[lat_key], query[lon_key]))
+
+    m = _GOOGLE_AT_RE.search(parsed.path)
+    if m:
+        found.append(_point(m.group(1), m.group(2)))
+    for m in _GOOGLE_PB_RE.finditer(parsed.query + parsed.path):
+        found.append(_point(m.group(2), m.group(1)) if m.group(1) else _point(m.group(3), m.group(4)))
+    m = _FRAGMENT_MAP_RE.search(parsed.fragment)
+    if m:
+        found.append(_point(m.group(1), m.group(2)))
+    return [p for p in found if p]
+
+def _degrees(m: re.Match) -> Tuple[float, str]:
+    value = sum(float(part.replace(',', '.')) / 60 ** i
+                for i, part in enumerate(m.group(1, 2, 3)) if part)
+    suffix = m.group(4)
+    hemisphere = SLOVAK_HEMISPHERES[suffix[0]] if '.' in suffix else suffix
+    return (-value if hemisphere in 'SW' else value), hemisphere
+
+def coordinates_from_text(text: str) -> List[Point]:
+    """Súradnice zapísané v texte: zemepisná šírka nasledovaná dĺžkou"""
+    found = []
+    lat = None
+    for m in _DEGREES_RE.finditer(text):
+        value, hemisphere = _degrees(m)
+        if hemisphere in 'NS':
+            lat = value
+        elif lat is not None:
+            found.append(_point(lat, value))
+            lat = None
+    for m in _GPS_RE.finditer(text):
+        found.append(_point(m.group(1), m.group(2)))
+    return [p for p in found if p]
+
+def extract_coordinates(urls: Iterable[str], text: str) -> List[List[float]]:
+    """Unikátne súradnice [lat, lon] z adries (iframe, odkazy) a textu v poradí výskytu"""
+    points = [p for url in urls if url for p in coordinates_from_url(url)]
+    points += coordinates_from_text(text)
+    return [list(p) for p in dict.fromkeys(points)]
+
+def coordinates_from_markdown(content: str) -> List[List[float]]:
+    urls = [m.group(1) or m.group(2) for m in _MD_URL_RE.finditer(content)]
+    return extract_coordinates(urls, content)
+
+def world_pixel(lat: float, lon: float, zoom: int) -> Tuple[float, float]:
+    """Web Mercator: súradnice -> pixel na mape celého sveta pri danom priblížení"""
+    scale = TILE_SIZE * 2 ** zoom
+    sin_lat = math.sin(math.radians(lat))
+    x = (lon + 180) / 360 * scale
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale
+    return x, y
+
+def _feature(lat: float, lon: float, properties: Dict, bbox: Optional[List[float]] = None) -> Dict:
+    feature = {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+               'properties': properties}
+    if bbox:
+        feature['bbox'] = bbox
+    return feature
+
+def cluster_level(places: List[Dict], zoom: int, radius: Optional[int] = CLUSTER_RADIUS
+                  ) -> Dict[Tuple[int, int], List[Dict]]:
+    """
+    Prvky jednej úrovne rozdelené do dlaždíc (x, y); body v jednej bunke mriežky
+    tvoria zhluk (radius=None: bez zhlukovania, len články na rovnakom mieste)
+    """
+    cells = defaultdict(list)
+    for place in places:
+        if radius:
+            x, y = world_pixel(place['lat'], place['lon'], zoom)
+            cells[(int(x // radius), int(y // radius))].append(place)
+        else:
+            cells[(place['lat'], place['lon'])].append(place)
+
+    tiles = defaultdict(list)
+    for members in cells.values():
+        lat = round(sum(p['lat'] for p in members) / len(members), PRECISION)
+        lon = round(sum(p['lon'] for p in members) / len(members), PRECISION)
+        if len(members) == 1 or len({(p['lat'], p['lon']) for p in members}) == 1:
+            # Jeden bod (alebo viac článkov na tom istom mieste)
+            feature = _feature(lat, lon, {
+                'articles': [{'slug': p['slug'], 'title': p['title']} for p in members],
+            })
+        else:
+            feature = _feature(lat, lon, {
+                'cluster': True,
+                'count': len(members),
+            }, [min(p['lon'] for p in members), min(p['lat'] for p in members),
+                max(p['lon'] for p in members), max(p['lat'] for p in members)])
+        x, y = world_pixel(lat, lon, zoom)
+        tiles[(int(x // TILE_SIZE), int(y // TILE_SIZE))].append(feature)
+    return tiles
+
+def build_geo_tiles(places: List[Dict], out_dir, min_zoom: int = MIN_ZOOM, max_zoom: int = MAX_ZOOM) -> Dict:
+    """
+    Zapíše do out_dir dlaždice <z>/<x>/<y>.json (GeoJSON FeatureCollection)
+    a index.json so zoznamom existujúcich dlaždíc. places: {'lat', 'lon', 'slug', 'title'}.
+    """
+    files = {}
+    tiles_by_zoom = {}
+    for zoom in range(min_zoom, max_zoom + 1):
+        tiles = cluster_level(places, zoom, CLUSTER_RADIUS if zoom < max_zoom else None)
+        tiles_by_zoom[str(zoom)] = sorted(f"{x}/{y}" for x, y in tiles)
+        for (x, y), features in tiles.items():
+            files[f"{zoom}/{x}/{y}.json"] = {'type': 'FeatureCollection', 'features': features}
+
+    bounds = None
+    if places:
+        bounds = [min(p['lon'] for p in places), min(p['lat'] for p in places),
+                  max(p['lon'] for p in places), max(p['lat'] for p in places)]
+    files['index.json'] = {
+        'version': GEO_VERSION,
+        'tile_size': TILE_SIZE,
+        'minzoom': min_zoom,
+        'maxzoom': max_zoom,
+        'bounds': bounds,
+        'points': len(places),
+        'tiles': tiles_by_zoom,
+    }
+    written, removed = sync_json_tree(out_dir, files)
+    return {
+        'points': len(places),
+        'tiles': len(files) - 1,
+        'written': written,
+        'removed': removed,
+    }
@@ -0,0 +1,178 @@
+"""
+Responzívne varianty obrázkov pre Next.js
+Zo skopírovaných obrázkov (content/images) vytvorí zmenšené verzie v niekoľkých
+šírkach a formátoch (AVIF ak ho Pillow vie zapísať, WebP, JPEG alebo PNG pri
+priehľadnosti) v procesoch. Názvy variantov obsahujú hash zdroja, takže nezmenené
+obrázky sa neprepočítavajú. Manifest (data/images.json) popisuje šírky
+a rozmery pre srcset.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from PIL import Image, ImageOps, features
+
+from asset_sync import file_digest, iter_tree
+
+MANIFEST_VERSION = 1
+
+WIDTHS = (320, 640, 960, 1280, 1920)
+
+SOURCE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tif', '.tiff'}
+
+FILE_EXTENSIONS = {'avif': 'avif', 'webp': 'webp', 'jpeg': 'jpg', 'png': 'png'}
+
+SAVE_OPTIONS = {
+    'avif': {'quality': 50, 'speed': 6},
+    'webp': {'quality': 75, 'method': 4},
+    'jpeg': {'quality': 80, 'optimize': True, 'progressive': True},
+    'png': {'optimize': True},
+}
+
+def _can_write(fmt: str) -> bool:
+    try:
+        return bool(features.check(fmt))
+    except ValueError:
+        # Staršie verzie Pillow funkciu nepoznajú
+        return False
+
+def available_formats() -> List[str]:
+    """Moderné formáty, ktoré nainštalovaný Pillow vie zapísať (AVIF od Pillow 11.2)"""
+    return [fmt for fmt in ('avif', 'webp') if _can_write(fmt)]
+
+def asset_key(url: str) -> str:
+    """Meno súboru, pod ktorým scraper uložil obrázok z danej URL"""
+    return urlparse(url).path.strip('/').replace('/', '_').replace('\\', '_')
+
+def variant_name(rel: str, digest: str, width: int, fmt: str) -> str:
+    stem = rel.rsplit('.', 1)[0].replace('/', '_')
+    return f"{stem}-{digest[:10]}-{width}.{FILE_EXTENSIONS[fmt]}"
+
+def render_variants(src: Path, rel: str, digest: str, out_dir: Path,
+                    widths=WIDTHS, formats=()) -> Dict:
+    """Vytvorí chýbajúce varianty jedného obrázka a vráti jeho záznam do manifestu"""
+    with Image.open(src) as im:
+        if getattr(im, 'is_animated', False):
+            # Animácie sa nechávajú v origináli
+            return {'width': im.width, 'height': im.height, 'fallback': None, 'variants': {}}
+        im = ImageOps.exif_transpose(im)
+        has_alpha = im.mode in ('RGBA', 'LA', 'PA') or 'transparency' in im.info
+        im = im.convert('RGBA' if has_alpha else 'RGB')
+
+    width, height = im.size
+    fallback = 'png' if has_alpha else 'jpeg'
+    # Bez zväčšovania: menšie šírky a pôvodná (najviac po najväčší breakpoint)
+    targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+
+    variants = {fmt: [] for fmt in list(formats) + [fallback]}
+    for target in targets:
+        target_height = max(1, round(height * target / width))
+        resized = None
+        for fmt in variants:
+            name = variant_name(rel, digest, target, fmt)
+            path = out_dir / name
+            if not path.exists():
+                if resized is None:
+                    resized = im if target == width else im.resize((target, target_height), Image.LANCZOS)
+                tmp = out_dir / f".tmp-{os.getpid()}-{name}"
+                resized.save(tmp, format=fmt.upper(), **SAVE_OPTIONS[fmt])
+                os.replace(tmp, path)
+            variants[fmt].append({'width': target, 'height': target_height, 'file': name})
+
+    return {'width': width, 'height': height, 'fallback': fallback, 'variants': variants}
+
+def _variants_worker(args) -> Tuple[str, Optional[Dict], str]:
+    src, rel, out_dir, widths, formats, known = args
+    try:
+        digest = file_digest(src)
+        if known and known['hash'] == digest and all(
+                (out_dir / v['file']).exists() for files in known['variants'].values() for v in files):
+            entry = dict(known)
+        else:
+            entry = render_variants(src, rel, digest, out_dir, widths, formats)
+            entry['hash'] = digest
+        st = os.stat(src)
+        entry.update({'size': st.st_size, 'mtime_ns': st.st_mtime_ns})
+        return rel, entry, ""
+    except Exception as e:
+        return rel, None, str(e)[:100]
+
+def load_manifest(manifest_file: Path, widths, formats) -> Dict:
+    """Manifest z minulého behu; pri inej verzii, šírkach alebo formátoch prázdny"""
+    if manifest_file.exists():
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if (manifest.get('version') == MANIFEST_VERSION and manifest.get('widths') == list(widths)
+                and manifest.get('formats') == list(formats)):
+            return manifest
+    return {'images': {}}
+
+def build_variants(src_dir, out_dir, manifest_file, url_prefix: str = '/images/responsive',
+                   widths=WIDTHS, formats: List[str] = None, workers: int = None) -> Dict:
+    """
+    Zosynchronizuje varianty všetkých obrázkov zo src_dir do out_dir a zapíše manifest.
+    Vráti počty ('images', 'processed', 'cached', 'pruned', 'errors') a čas.
+    """
+    src_dir, out_dir, manifest_file = Path(src_dir), Path(out_dir), Path(manifest_file)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    formats = available_formats() if formats is None else list(formats)
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    previous = load_manifest(manifest_file, widths, formats)['images']
+    images = {}
+    jobs = []
+    for rel, st in sorted(iter_tree(src_dir)):
+        if Path(rel).suffix.lower() not in SOURCE_EXTENSIONS:
+            continue
+        known = previous.get(rel)
+        # Rovnaká veľkosť a čas - ani sa nehashuje
+        if known and known['size'] == st.st_size and known['mtime_ns'] == st.st_mtime_ns and all(
+                (out_dir / v['file']).exists() for files in known['variants'].values() for v in files):
+            images[rel] = known
+            continue
+        jobs.append((src_dir / rel, rel, out_dir, tuple(widths), tuple(formats), known))
+
+    cached = len(images)
+    errors = {}
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for rel, entry, error in pool.map(_variants_worker, jobs,
+                                              chunksize=max(1, len(jobs) // (workers * 4))):
+                if error:
+                    errors[rel] = error
+                else:
+                    images[rel] = entry
+
+    # Varianty, na ktoré manifest už neodkazuje (zmenené alebo zmazané zdroje)
+    referenced = {v['file'] for entry in images.values() for files in entry['variants'].values() for v in files}
+    pruned = 0
+    for rel, _ in list(iter_tree(out_dir)):
+        if rel not in referenced:
+            os.unlink(out_dir / rel)
+            pruned += 1
+
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': MANIFEST_VERSION,
+            'url_prefix': url_prefix,
+            'widths': list(widths),
+            'formats': formats,
+            'images': dict(sorted(images.items())),
+        }, f, ensure_ascii=False, indent=1)
+
+    return {
+        'images': len(images),
+        'processed': len(jobs) - len(errors),
+        'cached': cached,
+        'pruned': pruned,
+        'errors': errors,
+        'formats': formats,
+        'seconds': time.perf_counter() - started,
+    }
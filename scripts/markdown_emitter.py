@@ -0,0 +1,220 @@
+"""
+Rýchly prevod HTML -> Markdown priamo z lxml stromu
+Prechádza už sparsovaný strom (bez opätovnej serializácie a parsovania ako html2text)
+a výstupom sa drží konvencií html2text (body_width=0), aby sa MDX súbory nemenili zbytočne
+"""
+
+import re
+from typing import List
+
+SKIP_TAGS = {'script', 'style', 'noscript', 'iframe', 'object', 'embed', 'head', 'title', 'meta', 'link'}
+
+BLOCK_TAGS = {'p', 'div', 'center', 'section', 'article', 'header', 'footer', 'address',
+              'dl', 'dt', 'dd', 'form', 'figure', 'figcaption', 'fieldset', 'main', 'nav', 'aside'}
+
+HEADINGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+
+EMPHASIS = {'b': '**', 'strong': '**', 'i': '_', 'em': '_', 'code': '`', 'tt': '`'}
+
+_WS_RE = re.compile(r'[ \t\r\n\f\v\xa0]+')
+_LINE_START_ESCAPES = [
+    (re.compile(r'^(\d+)\.(\s)'), r'\1\\.\2'),   # "1. " by sa zmenilo na zoznam
+    (re.compile(r'^([-+])(\s)'), r'\\\1\2'),     # "- " a "+ " tiež
+]
+
+def _escape_line_start(text: str) -> str:
+    for pattern, replacement in _LINE_START_ESCAPES:
+        text = pattern.sub(replacement, text, count=1)
+    return text
+
+class MarkdownEmitter:
+    def __init__(self, list_depth: int = 0):
+        self.parts: List[str] = []
+        self.pending = 0           # počet zlomov riadkov pred ďalším textom
+        self.at_line_start = True
+        self.list_depth = list_depth
+
+    # Výstup
+
+    def _emit(self, text: str, escape: bool = False):
+        if self.pending:
+            if self.parts:
+                self.parts.append('\n' * self.pending)
+            self.pending = 0
+        if escape and self.at_line_start:
+            text = _escape_line_start(text)
+        self.parts.append(text)
+        self.at_line_start = text.endswith('\n')
+
+    def _text(self, text: str):
+        text = _WS_RE.sub(' ', text)
+        if self.at_line_start or self.pending:
+            text = text.lstrip(' ')
+        elif text.startswith(' ') and self.parts and self.parts[-1].endswith(' '):
+            text = text[1:]
+        if text:
+            self._emit(text, escape=True)
+
+    def _block(self, newlines: int = 2):
+        if self.parts:
+            self.pending = max(self.pending, newlines)
+        self.at_line_start = True
+
+    def result(self) -> str:
+        text = ''.join(self.parts)
+        text = re.sub(r'[ \t]+\n(?=\n)', '\n', text)
+        return re.sub(r'\n{3,}', '\n\n', text).strip('\n') + '\n'
+
+    # Prechod stromom
+
+    def convert(self, elem) -> str:
+        self._children(elem)
+        return self.result()
+
+    def _children(self, elem):
+        if elem.text:
+            self._text(elem.text)
+        for child in elem:
+            if isinstance(child.tag, str):
+                self._element(child)
+            if child.tail:
+                self._text(child.tail)
+
+    def _inline(self, elem) -> str:
+        """Obsah elementu ako jeden riadok (pre zvýraznenie, odkazy, bunky tabuľky)"""
+        nested = MarkdownEmitter(self.list_depth)
+        nested.at_line_start = False  # zachovať medzery na okrajoch
+        nested._children(elem)
+        return ''.join(nested.parts)
+
+    def _element(self, elem):
+        tag = elem.tag.lower()
+
+        if tag in SKIP_TAGS:
+            return
+        if tag == 'br':
+            self._emit('  \n')
+        elif tag in BLOCK_TAGS:
+            self._block()
+            self._children(elem)
+            self._block()
+        elif tag in HEADINGS:
+            self._block()
+            title = ' '.join(self._inline(elem).split())
+            if title:
+                self._emit(f"{'#' * HEADINGS[tag]} {title}")
+            self._block()
+        elif tag in EMPHASIS:
+            self._emphasis(elem, EMPHASIS[tag])
+        elif tag == 'a':
+            self._link(elem)
+        elif tag == 'img':
+            self._emit(f"![{elem.get('alt', '')}]({elem.get('src', '')})")
+        elif tag in ('ul', 'ol'):
+            self._list(elem, ordered=(tag == 'ol'))
+        elif tag == 'li':
+            # Položka mimo zoznamu
+            self._list_item(elem, '* ')
+        elif tag == 'blockquote':
+            self._blockquote(elem)
+        elif tag == 'pre':
+            self._pre(elem)
+        elif tag == 'hr':
+            self._block()
+            self._emit('* * *')
+            self._block()
+        elif tag == 'table':
+            self._table(elem)
+        else:
+            # span, font, sup, u a ostatné inline elementy
+            self._children(elem)
+
+    def _emphasis(self, elem, marker: str):
+        inner = self._inline(elem)
+        if not inner.strip():
+            if inner and not (self.parts and self.parts[-1].endswith(' ')):
+                self._emit(' ')
+            return
+        lead = ' ' if inner[0].isspace() and not self.at_line_start else ''
+        trail = ' ' if inner[-1].isspace() else ''
+        self._emit(f"{lead}{marker}{inner.strip()}{marker}{trail}", escape=True)
+
+    def _link(self, elem):
+        href = elem.get('href')
+        inner = self._inline(elem)
+        if not href or href.startswith('javascript:'):
+            if inner:
+                self._text(inner) if '](' not in inner else self._emit(inner)
+            return
+        title = elem.get('title')
+        target = f'{href} "{title}"' if title else href
+        if inner.startswith(' ') and not self.at_line_start and not (self.parts and self.parts[-1].endswith(' ')):
+            self._emit(' ')
+        if inner.strip() == href and not title:
+            # Odkaz s adresou ako textom - html2text píše <url>
+            self._emit(f"<{href}>")
+        else:
+            self._emit(f"[{inner.strip()}]({target})")
+        if inner.endswith(' ') and inner.strip():
+            self._emit(' ')
+
+    def _list(self, elem, ordered: bool):
+        self._block(1 if self.list_depth else 2)
+        number = 1
+        for child in elem:
+            if not isinstance(child.tag, str) or child.tag.lower() != 'li':
+                continue
+            self._list_item(child, f"{number}. " if ordered else "* ")
+            number += 1
+        self._block()
+
+    def _list_item(self, elem, bullet: str):
+        self._block(1)
+        self._emit('  ' * (self.list_depth + 1) + bullet)
+        self.at_line_start = False
+        self.list_depth += 1
+        if elem.text:
+            text = _WS_RE.sub(' ', elem.text).lstrip(' ')
+            if text:
+                self._emit(text)
+        for child in elem:
+            if isinstance(child.tag, str):
+                self._element(child)
+            if child.tail:
+                self._text(child.tail)
+        self.list_depth -= 1
+
+    def _blockquote(self, elem):
+        nested = MarkdownEmitter(self.list_depth)
+        body = nested.convert(elem).strip('\n')
+        if not body:
+            return
+        self._block()
+        self._emit('\n'.join(f"> {line}" if line else ">" for line in body.split('\n')))
+        self._block()
+
+    def _pre(self, elem):
+        text = elem.text_content().strip('\n')
+        self._block()
+        self._emit('\n'.join(f"    {line}" for line in text.split('\n')))
+        self._block()
+
+    def _table(self, elem):
+        rows = []
+        for row in elem.iter('tr'):
+            cells = [' '.join(self._inline(cell).split()) for cell in row if isinstance(cell.tag, str)
+                     and cell.tag.lower() in ('td', 'th')]
+            if cells:
+                rows.append(cells)
+        if not rows:
+            return
+
+        lines = ['| '.join(rows[0]), '|'.join(['---'] * len(rows[0]))]
+        lines.extend('| '.join(cells) for cells in rows[1:])
+        self._block()
+        self._emit('  \n'.join(lines))
+        self._block()
+
+def element_to_markdown(elem) -> str:
+    """Skonvertuje lxml element (jeho obsah) na Markdown"""
+    return MarkdownEmitter().convert(elem)
@@ -0,0 +1,111 @@
+"""
+Spoločné čítanie a zápis MDX frontmatteru
+Zápis aj čítanie cez C implementáciu YAML (libyaml), ak je dostupná.
+Frontmatter je ohraničený riadkami presne '---', takže '---' v texte článku nevadí.
+Telo článku sa môže načítať lenivo - nástroje, ktoré potrebujú len metadáta, ho nečítajú.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import yaml
+
+# C implementácia, ak je PyYAML skompilované s libyaml
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+DELIMITER = '---'
+
+def _is_delimiter(line: str) -> bool:
+    return line.rstrip('\r\n').rstrip(' \t') == DELIMITER
+
+def dump_frontmatter(data: Dict) -> str:
+    return yaml.dump(data, Dumper=Dumper, default_flow_style=False, allow_unicode=True)
+
+def load_frontmatter(text: str) -> Dict:
+    return yaml.load(text, Loader=Loader) or {}
+
+def render_mdx(frontmatter: Dict, content: str) -> str:
+    """Zloží MDX súbor z frontmatteru a Markdown obsahu"""
+    return f"{DELIMITER}\n{dump_frontmatter(frontmatter)}{DELIMITER}\n\n{content}\n"
+
+def split_mdx(text: str) -> Tuple[Optional[str], str]:
+    """
+    Rozdelí MDX na (YAML frontmatter, telo). Frontmatter musí začínať na prvom
+    riadku a končiť prvým riadkom, ktorý je presne '---'. Bez frontmatteru
+    (alebo bez ukončenia) vráti (None, celý text).
+    """
+    text = text.lstrip('\ufeff')
+    end = text.find('\n')
+    if end < 0 or not _is_delimiter(text[:end]):
+        return None, text
+
+    start = pos = end + 1
+    while pos < len(text):
+        end = text.find('\n', pos)
+        if end < 0:
+            end = len(text)
+        if _is_delimiter(text[pos:end]):
+            return text[start:pos], text[end + 1:].lstrip('\r\n')
+        pos = end + 1
+    return None, text
+
+def parse_mdx(text: str) -> Tuple[Dict, str]:
+    """MDX text -> (frontmatter ako dict, telo)"""
+    header, body = split_mdx(text)
+    return (load_frontmatter(header) if header is not None else {}), body
+
+class MdxDocument:
+    """MDX súbor s načítaným frontmatterom; telo sa číta až pri prvom prístupe"""
+
+    def __init__(self, path: Path, frontmatter: Dict, body_offset: int, body: Optional[str] = None):
+        self.path = Path(path)
+        self.frontmatter = frontmatter
+        self.body_offset = body_offset
+        self._body = body
+
+    @property
+    def body(self) -> str:
+        if self._body is None:
+            with open(self.path, 'rb') as f:
+                f.seek(self.body_offset)
+                self._body = f.read().decode('utf-8-sig').lstrip('\r\n')
+        return self._body
+
+    def __getitem__(self, key):
+        return self.frontmatter[key]
+
+    def get(self, key, default=None):
+        return self.frontmatter.get(key, default)
+
+def read_mdx(path, lazy: bool = True) -> MdxDocument:
+    """
+    Načíta MDX súbor. Pri lazy=True sa číta len po koniec frontmatteru,
+    telo sa dočíta z uloženého offsetu až keď je potrebné.
+    """
+    path = Path(path)
+    if not lazy:
+        with open(path, 'r', encoding='utf-8') as f:
+            frontmatter, body = parse_mdx(f.read())
+        return MdxDocument(path, frontmatter, 0, body)
+
+    with open(path, 'rb') as f:
+        first = f.readline()
+        if first.startswith(b'\xef\xbb\xbf'):
+            first = first[3:]
+        if not _is_delimiter(first.decode('utf-8')):
+            return MdxDocument(path, {}, 0)
+
+        header = []
+        for raw in iter(f.readline, b''):
+            line = raw.decode('utf-8')
+            if _is_delimiter(line):
+                return MdxDocument(path, load_frontmatter(''.join(header)), f.tell())
+            header.append(line)
+
+    # Neukončený frontmatter - celý súbor je telo
+    return MdxDocument(path, {}, 0)
+
+def read_frontmatter(path) -> Dict:
+    """Len metadáta článku (telo sa nečíta)"""
+    return read_mdx(path, lazy=True).frontmatter
@@ -0,0 +1,122 @@
+"""
+Súvisiace články pre Next.js
+Každý článok je TF-IDF vektor (rovnaká normalizácia ako vyhľadávací index:
+bez diakritiky, malé písmená, odrezané koncovky) v riedkej matici. Kosínusová
+podobnosť všetkých dvojíc sa počíta maticovým súčinom po blokoch riadkov,
+takže pamäť nerastie kvadraticky s počtom článkov. Výsledok (related.json)
+stránka článku len načíta.
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from scipy import sparse
+
+from mdx_frontmatter import read_mdx
+from search_index import FIELD_WEIGHTS, Normalizer, strip_markdown
+from static_json import write_json_if_changed
+
+TOP_K = 5
+MIN_SCORE = 0.05  # slabšia podobnosť už nie je "súvisiaci článok"
+MAX_DF = 0.5      # termíny vo viac ako polovici článkov nerozlišujú
+BATCH_CELLS = 16 * 1024 * 1024  # podobností naraz v pamäti (float32 = 64 MB)
+
+def tfidf_matrix(documents: List[Dict[str, float]]) -> sparse.csr_matrix:
+    """Riadky = články (termín -> váha), L2-normalizované TF-IDF so sublineárnym TF"""
+    vocabulary: Dict[str, int] = {}
+    indptr, indices, values = [0], [], []
+    for weights in documents:
+        for term, weight in weights.items():
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(weight)
+        indptr.append(len(indices))
+
+    counts = sparse.csr_matrix((np.asarray(values, dtype=np.float32), indices, indptr),
+                               shape=(len(documents), len(vocabulary)))
+    counts.sum_duplicates()
+    counts.data = 1 + np.log(counts.data)
+
+    n_docs = counts.shape[0]
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1 + n_docs) / (1 + df)).astype(np.float32) + 1
+    idf[df > max(1, MAX_DF * n_docs)] = 0
+    matrix = counts @ sparse.diags(idf)
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    matrix = sparse.diags(1 / norms) @ matrix
+    matrix.eliminate_zeros()
+    return matrix.tocsr()
+
+def top_neighbours(matrix: sparse.csr_matrix, top_k: int = TOP_K, min_score: float = MIN_SCORE,
+                   batch_cells: int = BATCH_CELLS) -> List[List[tuple]]:
+    """Pre každý riadok najviac top_k (index, podobnosť) iných riadkov, od najpodobnejších"""
+    transposed = matrix.T.tocsc()
+    batch_rows = max(1, batch_cells // max(1, matrix.shape[0]))
+    neighbours = []
+    for start in range(0, matrix.shape[0], batch_rows):
+        scores = (matrix[start:start + batch_rows] @ transposed).toarray()
+        rows = np.arange(scores.shape[0])
+        scores[rows, rows + start] = 0  # článok nie je súvisiaci sám so sebou
+
+        k = min(top_k, scores.shape[1] - 1)
+        if k <= 0:
+            neighbours.extend([] for _ in rows)
+            continue
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        best = np.take_along_axis(best, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        for ids, values in zip(best.tolist(), best_scores.tolist()):
+            neighbours.append([(i, v) for i, v in zip(ids, values) if v >= min_score])
+    return neighbours
+
+def build_related(articles: List[Dict], content_dir, out_file, transliteration: Dict[str, str],
+                  top_k: int = TOP_K) -> Dict:
+    """
+    Zapíše related.json: slug -> [{'slug', 'title', 'date', 'score'}] pre články
+    z articles.json (bez duplicitných súborov), telá z MDX v content_dir.
+    """
+    content_dir = Path(content_dir)
+    started = time.perf_counter()
+    normalizer = Normalizer(transliteration)
+
+    documents = []
+    for article in articles:
+        mdx_file = content_dir / article['file']
+        body = read_mdx(mdx_file).body if mdx_file.exists() else ''
+        fields = {
+            'title': article['title'],
+            'tags': ' '.join(article.get('categories', []) + article.get('tags', [])),
+            'body': strip_markdown(body),
+        }
+        weights: Dict[str, float] = {}
+        for field, text in fields.items():
+            for term in normalizer.terms(text):
+                weights[term] = weights.get(term, 0) + FIELD_WEIGHTS[field]
+        documents.append(weights)
+
+    matrix = tfidf_matrix(documents)
+    neighbours = top_neighbours(matrix, top_k)
+
+    related = {}
+    for article, found in zip(articles, neighbours):
+        related[article['slug']] = [{
+            'slug': articles[i]['slug'],
+            'title': articles[i]['title'],
+            'date': articles[i].get('date'),
+            'score': round(score, 3),
+        } for i, score in found]
+
+    written = write_json_if_changed(Path(out_file), related)
+    return {
+        'articles': len(articles),
+        'terms': matrix.shape[1],
+        'nnz': matrix.nnz,
+        'linked': sum(1 for found in neighbours if found),
+        'written': written,
+        'seconds': time.perf_counter() - started,
+    }
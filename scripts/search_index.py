@@ -0,0 +1,166 @@
+"""
+Statický vyhľadávací index pre Next.js
+Invertovaný index (termín -> články a váhy) sa postaví pri konverzii a rozdelí
+podľa prvých písmen termínu do malých JSON súborov - klient pri dopyte načíta
+len časti, ktoré potrebuje. Normalizácia: odstránenie diakritiky, malé písmená,
+ľahké odrezanie slovenských koncoviek. Pravidlá sa zapíšu aj do meta.json,
+aby klient normalizoval dopyt rovnako ako indexer.
+"""
+
+import json
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+from mdx_frontmatter import read_mdx
+from static_json import dump_json, sync_json_tree
+
+INDEX_VERSION = 1
+
+PREFIX_LENGTH = 2   # dĺžka prefixu termínu = meno súboru s časťou indexu
+MIN_STEM = 3        # koncovka sa odreže, len ak ostane aspoň toľko znakov
+
+FIELD_WEIGHTS = {'title': 5, 'tags': 3, 'body': 1}
+
+# Koncovky od najdlhších (po odstránení diakritiky)
+SUFFIXES = (
+    'ovia', 'ami', 'ach', 'ich', 'och', 'ych', 'ymi', 'imi', 'eho', 'emu', 'ova', 'ove', 'ovi',
+    'ej', 'om', 'ou', 'ov', 'mi', 'ho', 'ia', 'ie', 'iu', 'ii',
+    'a', 'e', 'i', 'o', 'u', 'y',
+)
+
+STOPWORDS = {
+    'a', 'aj', 'ak', 'ako', 'ale', 'alebo', 'ani', 'az', 'bol', 'bola', 'boli', 'bolo', 'by', 'byt',
+    'ci', 'do', 'for', 'i', 'ich', 'im', 'ja', 'je', 'jej', 'jeho', 'k', 'ked', 'kde', 'ktora',
+    'ktore', 'ktori', 'ktory', 'ku', 'len', 'ma', 'medzi', 'mu', 'na', 'nad', 'nie', 'o', 'od',
+    'pod', 'po', 'pre', 'pred', 'pri', 's', 'sa', 'si', 'sme', 'so', 'su', 'ta', 'tak', 'tam',
+    'the', 'to', 'tu', 'ty', 'uz', 'v', 'vo', 'za', 'ze', 'z', 'zo',
+}
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_MD_IMAGE_RE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+_MD_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_URL_RE = re.compile(r'<?https?://[^\s>)]+>?')
+
+def strip_markdown(text: str) -> str:
+    """Text článku bez obrázkov a adries odkazov"""
+    text = _MD_IMAGE_RE.sub(' ', text)
+    text = _MD_LINK_RE.sub(r'\1', text)
+    return _URL_RE.sub(' ', text)
+
+class Normalizer:
+    def __init__(self, transliteration: Dict[str, str]):
+        self.transliteration = transliteration
+        self.table = str.maketrans(transliteration)
+
+    def fold(self, text: str) -> str:
+        text = text.translate(self.table).lower()
+        if not text.isascii():
+            # Ostatná diakritika (ĺ, ŕ, ö, ü...) cez Unicode rozklad
+            text = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+        return text
+
+    @staticmethod
+    def stem(word: str) -> str:
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+                return word[:-len(suffix)]
+        return word
+
+    def terms(self, text: str) -> List[str]:
+        return [self.stem(word) for word in _TOKEN_RE.findall(self.fold(text))
+                if len(word) > 1 and word not in STOPWORDS]
+
+def build_search_index(articles: List[Dict], content_dir, out_dir, transliteration: Dict[str, str]) -> Dict:
+    """
+    Postaví index z článkov (záznamy z articles.json bez duplicitných súborov,
+    telá z MDX v content_dir) do out_dir: meta.json, docs.json a terms/<prefix>.json.
+    """
+    content_dir = Path(content_dir)
+    normalizer = Normalizer(transliteration)
+
+    docs = []
+    postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+    for doc_id, article in enumerate(articles):
+        mdx_file = content_dir / article['file']
+        body = read_mdx(mdx_file).body if mdx_file.exists() else ''
+
+        weights = Counter()
+        fields = {
+            'title': article['title'],
+            'tags': ' '.join(article.get('categories', []) + article.get('tags', [])),
+            'body': strip_markdown(body),
+        }
+        for field, text in fields.items():
+            for term in normalizer.terms(text):
+                weights[term] += FIELD_WEIGHTS[field]
+        for term, weight in weights.items():
+            postings[term][doc_id] = weight
+        docs.append([article['slug'], article['title'], article.get('date') or ''])
+
+    # Časti indexu: termín -> [článok, váha, článok, váha, ...]
+    shards: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+    for term in sorted(postings):
+        flat = []
+        for doc_id, weight in sorted(postings[term].items()):
+            flat.extend((doc_id, weight))
+        shards[term[:PREFIX_LENGTH]][term] = flat
+
+    files = {f"terms/{key}.json": shard for key, shard in shards.items()}
+    files['docs.json'] = docs
+    files['meta.json'] = {
+        'version': INDEX_VERSION,
+        'docs': len(docs),
+        'prefix_length': PREFIX_LENGTH,
+        'min_stem': MIN_STEM,
+        'suffixes': list(SUFFIXES),
+        'stopwords': sorted(STOPWORDS),
+        'fold': transliteration,
+        'shards': sorted(shards),
+    }
+    written, removed = sync_json_tree(out_dir, files)
+
+    sizes = [len(dump_json(shard).encode('utf-8')) for shard in shards.values()]
+    return {
+        'docs': len(docs),
+        'terms': len(postings),
+        'shards': len(shards),
+        'written': written,
+        'removed': removed,
+        'total_kb': sum(sizes) / 1024,
+        'largest_kb': max(sizes, default=0) / 1024,
+        'median_kb': sorted(sizes)[len(sizes) // 2] / 1024 if sizes else 0,
+    }
+
+def search(index_dir, query: str, transliteration: Dict[str, str], limit: int = 10) -> List[Dict]:
+    """Rovnaké vyhľadávanie ako klient (lib/search.ts) - na kontrolu indexu z príkazového riadku"""
+    index_dir = Path(index_dir)
+    normalizer = Normalizer(transliteration)
+    meta = json.loads((index_dir / "meta.json").read_text(encoding='utf-8'))
+    terms = normalizer.terms(query)
+    if not terms:
+        return []
+
+    matches = []
+    for i, term in enumerate(terms):
+        shard_file = index_dir / "terms" / f"{term[:PREFIX_LENGTH]}.json"
+        shard = json.loads(shard_file.read_text(encoding='utf-8')) if shard_file.exists() else {}
+        # Posledné slovo sa hľadá aj ako prefix (počas písania)
+        keys = [t for t in shard if t.startswith(term)] if i == len(terms) - 1 else [term] * (term in shard)
+        scores = defaultdict(float)
+        for key in keys:
+            flat = shard[key]
+            idf = math.log(1 + meta['docs'] / (len(flat) / 2))
+            for j in range(0, len(flat), 2):
+                scores[flat[j]] += flat[j + 1] * idf
+        matches.append(scores)
+
+    # Všetky slová musia byť v článku
+    common = set(matches[0]).intersection(*matches[1:])
+    docs = json.loads((index_dir / "docs.json").read_text(encoding='utf-8'))
+    ranked = sorted(common, key=lambda d: -sum(m[d] for m in matches))[:limit]
+    return [{'slug': docs[d][0], 'title': docs[d][1], 'date': docs[d][2],
+             'score': round(sum(m[d] for m in matches), 2)} for d in ranked]
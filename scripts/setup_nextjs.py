@@ -37,9 +37,11 @@ class NextJSSetup:
                 "gray-matter": "^4.0.3",
                 "remark": "^15.0.1",
                 "remark-html": "^16.0.1",
-                "date-fns": "^3.0.0"
+                "date-fns": "^3.0.0",
+                "leaflet": "^1.9.4"
             },
             "devDependencies": {
+                "@types/leaflet": "^1.9.8",
                 "@types/node": "^20",
                 "@types/react": "^18",
                 "@types/react-dom": "^18",
@@ -66,6 +68,7 @@ const nextConfig = {
   pageExtensions: ['js', 'jsx', 'mdx', 'ts', 'tsx'],
   images: {
     domains: ['hradiska.sk', 'www.hradiska.sk'],
+    // Zmenšené varianty (AVIF/WebP/JPEG) generuje converter.py do public/images/responsive
     unoptimized: true,
   },
   output: 'standalone',
@@ -174,8 +177,13 @@ module.exports = {
             "app/mytologia",
             "app/mapa",
             "app/kontakt",
+            "app/article/[slug]",
+            "app/hladat",
             "public",
             "public/images",
+            "public/images/responsive",
+            "public/search",
+            "public/geo",
             "styles",
             "lib",
             "content/posts"
@@ -231,7 +239,7 @@ export default function HomePage() {
 
   useEffect(() => {
     // Načítanie posledných článkov
-    fetch('/api/articles?limit=6')
+    fetch('/api/articles?recent=6')
       .then(res => res.json())
       .then(data => setRecentPosts(data))
   }, [])
@@ -361,7 +369,9 @@ export default function Navigation() {
     { title: 'Archeológia', href: '/archeologia' },
     { title: 'Mytológia', href: '/mytologia' },
     { title: 'Mapa', href: '/mapa' },
+    { title: 'Archív', href: '/archiv' },
     { title: 'Kontakt', href: '/kontakt' },
+    { title: 'Hľadať', href: '/hladat' },
   ]
 
   return (
@@ -459,8 +469,44 @@ export default function Navigation() {
         with open(self.project_dir / "app" / "components" / "Footer.tsx", 'w') as f:
             f.write(footer_content)
 
+        # ResponsiveImage.tsx
+        responsive_image_content = """import type { ResponsiveImageData } from '@/lib/images'
+
+interface ResponsiveImageProps {
+  image: ResponsiveImageData
+  alt: string
+  sizes: string
+  className?: string
+}
+
+export default function ResponsiveImage({ image, alt, sizes, className }: ResponsiveImageProps) {
+  return (
+    <picture>
+      {image.sources.map((source) => (
+        <source key={source.type} type={source.type} srcSet={source.srcSet} sizes={sizes} />
+      ))}
+      <img
+        src={image.src}
+        srcSet={image.srcSet}
+        sizes={sizes}
+        width={image.width}
+        height={image.height}
+        alt={alt}
+        loading="lazy"
+        decoding="async"
+        className={className}
+      />
+    </picture>
+  )
+}
+"""
+        with open(self.project_dir / "app" / "components" / "ResponsiveImage.tsx", 'w') as f:
+            f.write(responsive_image_content)
+
         # ArticleCard.tsx
         article_card_content = """import Link from 'next/link'
+import ResponsiveImage from './ResponsiveImage'
+import type { ResponsiveImageData } from '@/lib/images'
 
 interface Article {
   slug: string
@@ -468,27 +514,38 @@ interface Article {
   excerpt?: string
   date?: string
   categories?: string[]
+  cover?: ResponsiveImageData | null
 }
 
 export default function ArticleCard({ article }: { article: Article }) {
   return (
     <Link href={`/article/${article.slug}`}>
-      <div className="bg-white rounded-lg shadow-lg p-6 hover:shadow-xl transition-shadow cursor-pointer h-full">
-        <h3 className="text-xl font-heading font-bold text-primary mb-2">
-          {article.title}
-        </h3>
-        {article.excerpt && (
-          <p className="text-gray-600 mb-4 line-clamp-3">
-            {article.excerpt}
-          </p>
+      <div className="bg-white rounded-lg shadow-lg hover:shadow-xl transition-shadow cursor-pointer h-full overflow-hidden">
+        {article.cover && (
+          <ResponsiveImage
+            image={article.cover}
+            alt={article.title}
+            sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
+            className="w-full h-48 object-cover"
+          />
         )}
-        <div className="flex justify-between items-center text-sm text-gray-500">
-          {article.date && <span>{article.date}</span>}
-          {article.categories && article.categories.length > 0 && (
-            <span className="bg-gray-100 px-2 py-1 rounded">
-              {article.categories[0]}
-            </span>
+        <div className="p-6">
+          <h3 className="text-xl font-heading font-bold text-primary mb-2">
+            {article.title}
+          </h3>
+          {article.excerpt && (
+            <p className="text-gray-600 mb-4 line-clamp-3">
+              {article.excerpt}
+            </p>
           )}
+          <div className="flex justify-between items-center text-sm text-gray-500">
+            {article.date && <span>{article.date}</span>}
+            {article.categories && article.categories.length > 0 && (
+              <span className="bg-gray-100 px-2 py-1 rounded">
+                {article.categories[0]}
+              </span>
+            )}
+          </div>
         </div>
       </div>
     </Link>
@@ -506,29 +563,83 @@ export default function ArticleCard({ article }: { article: Article }) {
         articles_api = """import { NextResponse } from 'next/server'
 import fs from 'fs'
 import path from 'path'
+import { responsiveImage } from '@/lib/images'
+
+// Predpočítané stránky generuje converter.py do content/data/api.
+// Držia sa v pamäti, kým sa súbor nezmení (kontrola mtime), takže požiadavka
+// načíta najviac jednu stránku namiesto celého articles.json.
+const apiDir = path.join(process.cwd(), 'content', 'data', 'api')
+const cache = new Map<string, { mtimeMs: number; data: any }>()
+
+function readJson(rel: string): any {
+  const file = path.join(apiDir, rel)
+  const { mtimeMs } = fs.statSync(file)
+  const cached = cache.get(rel)
+  if (cached && cached.mtimeMs === mtimeMs) return cached.data
+
+  const data = JSON.parse(fs.readFileSync(file, 'utf-8'))
+  cache.set(rel, { mtimeMs, data })
+  return data
+}
+
+// Titulný obrázok ako srcset varianty
+function withCovers(items: any[]) {
+  return items.map((a: any) => ({ ...a, cover: responsiveImage(a.cover) }))
+}
 
 export async function GET(request: Request) {
   const { searchParams } = new URL(request.url)
   const limit = parseInt(searchParams.get('limit') || '10')
   const category = searchParams.get('category')
+  const page = searchParams.get('page')
+  const recent = searchParams.get('recent')
+  const archive = searchParams.get('archive')
 
   try {
-    // Načítanie článkov z JSON súboru
-    const articlesPath = path.join(process.cwd(), 'content', 'data', 'articles.json')
-    const articlesData = fs.readFileSync(articlesPath, 'utf-8')
-    let articles = JSON.parse(articlesData)
+    // Archív: ?archive = prehľad rokov a mesiacov, ?archive=YYYY, YYYY-MM alebo undated = články
+    if (archive !== null) {
+      if (!archive) return NextResponse.json(readJson('archive/index.json'))
+      if (!/^(\\d{4}(-\\d{2})?|undated)$/.test(archive) || !fs.existsSync(path.join(apiDir, 'archive', `${archive}.json`))) {
+        return NextResponse.json({ error: 'Archive not found' }, { status: 404 })
+      }
+      return NextResponse.json(withCovers(readJson(`archive/${archive}.json`)))
+    }
+
+    // Najnovšie články
+    if (recent !== null) {
+      return NextResponse.json(withCovers(readJson('recent.json').slice(0, parseInt(recent) || 10)))
+    }
 
-    // Filtrovanie podľa kategórie
+    // Kategória podľa názvu alebo slugu (len známe kategórie - žiadne cesty z URL)
+    let prefix = 'articles'
     if (category) {
-      articles = articles.filter((a: any) =>
-        a.categories && a.categories.includes(category)
-      )
+      const index = readJson('index.json')
+      const found = index.categories.find((c: any) => c.name === category || c.slug === category)
+      if (!found) {
+        return NextResponse.json(page ? { page: 1, pages: 0, total: 0, items: [] } : [])
+      }
+      prefix = `categories/${found.slug}`
     }
 
-    // Limitovanie počtu
-    articles = articles.slice(0, limit)
+    // Stránkovanie: ?page=N vráti stránku s počtami
+    if (page) {
+      const n = parseInt(page)
+      const first = readJson(`${prefix}/page-1.json`)
+      if (!(n >= 1 && n <= first.pages)) {
+        return NextResponse.json({ error: 'Page not found' }, { status: 404 })
+      }
+      const result = readJson(`${prefix}/page-${n}.json`)
+      return NextResponse.json({ ...result, items: withCovers(result.items) })
+    }
 
-    return NextResponse.json(articles)
+    // Bez stránky: prvých `limit` článkov ako pole (pôvodné správanie)
+    const items: any[] = []
+    for (let n = 1; items.length < limit; n++) {
+      const current = readJson(`${prefix}/page-${n}.json`)
+      items.push(...current.items)
+      if (n >= current.pages) break
+    }
+    return NextResponse.json(withCovers(items.slice(0, limit)))
   } catch (error) {
     return NextResponse.json({ error: 'Failed to load articles' }, { status: 500 })
   }
@@ -541,6 +652,672 @@ export async function GET(request: Request) {
 
         print("API routes vytvorené")
 
+    def create_image_helpers(self):
+        """Vytvorí lib/images.ts - čítanie manifestu responzívnych variantov obrázkov"""
+        images_lib = """import fs from 'fs'
+import path from 'path'
+
+// Manifest generuje converter.py (image_variants.py) do content/data/images.json
+
+interface Variant {
+  width: number
+  height: number
+  file: string
+}
+
+interface ImageEntry {
+  width: number
+  height: number
+  fallback: string | null
+  variants: Record<string, Variant[]>
+}
+
+interface ImageManifest {
+  url_prefix: string
+  formats: string[]
+  images: Record<string, ImageEntry>
+}
+
+export interface ResponsiveImageData {
+  src: string
+  srcSet: string
+  width: number
+  height: number
+  sources: { type: string; srcSet: string }[]
+}
+
+const MIME_TYPES: Record<string, string> = {
+  avif: 'image/avif',
+  webp: 'image/webp',
+}
+
+const manifestPath = path.join(process.cwd(), 'content', 'data', 'images.json')
+let manifestCache: { mtimeMs: number; manifest: ImageManifest } | null = null
+
+function loadManifest(): ImageManifest | null {
+  try {
+    const { mtimeMs } = fs.statSync(manifestPath)
+    if (!manifestCache || manifestCache.mtimeMs !== mtimeMs) {
+      manifestCache = { mtimeMs, manifest: JSON.parse(fs.readFileSync(manifestPath, 'utf-8')) }
+    }
+    return manifestCache.manifest
+  } catch {
+    return null
+  }
+}
+
+// Rovnaké pravidlo ako scraper.py: cesta z URL s '/' nahradenými '_'
+export function assetKey(src: string): string {
+  let pathname = src
+  try {
+    pathname = new URL(src, 'http://localhost').pathname
+  } catch {}
+  return pathname.replace(/^\\/+|\\/+$/g, '').replace(/[\\/\\\\]/g, '_')
+}
+
+export function responsiveImage(src?: string | null): ResponsiveImageData | null {
+  if (!src) return null
+  const manifest = loadManifest()
+  if (!manifest) return null
+
+  const key = assetKey(src)
+  // Lokálne odkazy (/images/meno.jpg) smerujú priamo na súbor v content/images
+  const entry = manifest.images[key] || manifest.images[key.replace(/^images_/, '')]
+  if (!entry || !entry.fallback) return null
+
+  const srcSet = (variants: Variant[]) =>
+    variants.map((v) => `${manifest.url_prefix}/${v.file} ${v.width}w`).join(', ')
+  const fallback = entry.variants[entry.fallback]
+  const largest = fallback[fallback.length - 1]
+
+  return {
+    src: `${manifest.url_prefix}/${largest.file}`,
+    srcSet: srcSet(fallback),
+    width: largest.width,
+    height: largest.height,
+    sources: manifest.formats
+      .filter((format) => entry.variants[format])
+      .map((format) => ({ type: MIME_TYPES[format], srcSet: srcSet(entry.variants[format]) })),
+  }
+}
+
+function escapeAttr(value: string): string {
+  return value.replace(/&/g, '&amp;').replace(/"/g, '&quot;').replace(/</g, '&lt;')
+}
+
+// Nahradí <img> v HTML článku elementom <picture> so srcset (ak má obrázok varianty)
+export function withResponsiveImages(html: string, sizes: string): string {
+  return html.replace(/<img\\s[^>]*>/g, (tag) => {
+    const src = tag.match(/\\ssrc="([^"]*)"/)
+    const image = src && responsiveImage(src[1].replace(/&amp;/g, '&'))
+    if (!image) return tag
+
+    const alt = (tag.match(/\\salt="([^"]*)"/) || [])[1] || ''
+    const sources = image.sources
+      .map((s) => `<source type="${s.type}" srcset="${escapeAttr(s.srcSet)}" sizes="${sizes}">`)
+      .join('')
+    return `<picture>${sources}<img src="${escapeAttr(image.src)}" srcset="${escapeAttr(image.srcSet)}" ` +
+      `sizes="${sizes}" width="${image.width}" height="${image.height}" alt="${alt}" ` +
+      `loading="lazy" decoding="async"></picture>`
+  })
+}
+"""
+        lib_dir = self.project_dir / "lib"
+        lib_dir.mkdir(parents=True, exist_ok=True)
+        with open(lib_dir / "images.ts", 'w') as f:
+            f.write(images_lib)
+
+        print("lib/images.ts vytvorený")
+
+    def create_article_page(self):
+        """Vytvorí stránku článku (app/article/[slug]) s responzívnymi obrázkami a súvisiacimi článkami"""
+        article_page = """import fs from 'fs'
+import path from 'path'
+import Link from 'next/link'
+import matter from 'gray-matter'
+import { remark } from 'remark'
+import html from 'remark-html'
+import { notFound } from 'next/navigation'
+import { withResponsiveImages } from '@/lib/images'
+
+const IMAGE_SIZES = '(min-width: 768px) 768px, 100vw'
+
+interface RelatedArticle {
+  slug: string
+  title: string
+  date: string | null
+  score: number
+}
+
+// Súvisiace články predpočítal converter.py (content/data/related.json)
+let relatedCache: { mtimeMs: number; data: Record<string, RelatedArticle[]> } | null = null
+
+function relatedArticles(slug: string): RelatedArticle[] {
+  const file = path.join(process.cwd(), 'content', 'data', 'related.json')
+  if (!fs.existsSync(file)) return []
+  const { mtimeMs } = fs.statSync(file)
+  if (!relatedCache || relatedCache.mtimeMs !== mtimeMs) {
+    relatedCache = { mtimeMs, data: JSON.parse(fs.readFileSync(file, 'utf-8')) }
+  }
+  return relatedCache.data[slug] || []
+}
+
+export default async function ArticlePage({ params }: { params: { slug: string } }) {
+  const file = path.join(process.cwd(), 'content', 'posts', `${params.slug}.mdx`)
+  if (!fs.existsSync(file)) notFound()
+
+  const { data, content } = matter(fs.readFileSync(file, 'utf-8'))
+  const rendered = await remark().use(html).process(content)
+  const body = withResponsiveImages(String(rendered), IMAGE_SIZES)
+  const related = relatedArticles(params.slug)
+
+  return (
+    <article className="container mx-auto px-4 py-8 max-w-3xl">
+      <h1 className="text-4xl font-heading font-bold text-primary mb-2">{data.title}</h1>
+      {data.date && <p className="text-gray-500 mb-8">{data.date}</p>}
+      <div className="prose max-w-none" dangerouslySetInnerHTML={{ __html: body }} />
+      {related.length > 0 && (
+        <aside className="mt-12 border-t border-gray-200 pt-6">
+          <h2 className="text-2xl font-heading font-bold text-primary mb-4">Súvisiace články</h2>
+          <ul className="space-y-2">
+            {related.map((item) => (
+              <li key={item.slug}>
+                <Link href={`/article/${item.slug}`} className="text-primary hover:underline">
+                  {item.title}
+                </Link>
+                {item.date && <span className="text-sm text-gray-500 ml-2">{item.date}</span>}
+              </li>
+            ))}
+          </ul>
+        </aside>
+      )}
+    </article>
+  )
+}
+"""
+        page_dir = self.project_dir / "app" / "article" / "[slug]"
+        page_dir.mkdir(parents=True, exist_ok=True)
+        with open(page_dir / "page.tsx", 'w') as f:
+            f.write(article_page)
+
+        print("Stránka článku vytvorená")
+
+    def create_search(self):
+        """Vytvorí klientské vyhľadávanie nad statickým indexom (public/search) a stránku /hladat"""
+        search_lib = """// Vyhľadávanie v statickom indexe public/search (generuje converter.py, search_index.py).
+// Normalizačné pravidlá sú v meta.json, aby sa dopyt spracoval rovnako ako pri indexovaní.
+
+interface SearchMeta {
+  version: number
+  docs: number
+  prefix_length: number
+  min_stem: number
+  suffixes: string[]
+  stopwords: string[]
+  fold: Record<string, string>
+  shards: string[]
+}
+
+type Shard = Record<string, number[]>  // termín -> [článok, váha, článok, váha, ...]
+
+export interface SearchResult {
+  slug: string
+  title: string
+  date: string
+  score: number
+}
+
+const BASE_URL = '/search'
+
+let metaPromise: Promise<SearchMeta> | null = null
+let docsPromise: Promise<[string, string, string][]> | null = null
+const shardCache = new Map<string, Promise<Shard>>()
+
+function getJson<T>(url: string): Promise<T> {
+  return fetch(url).then((res) => {
+    if (!res.ok) throw new Error(`${url}: ${res.status}`)
+    return res.json()
+  })
+}
+
+function loadMeta(): Promise<SearchMeta> {
+  if (!metaPromise) metaPromise = getJson<SearchMeta>(`${BASE_URL}/meta.json`)
+  return metaPromise
+}
+
+function loadDocs(): Promise<[string, string, string][]> {
+  if (!docsPromise) docsPromise = getJson(`${BASE_URL}/docs.json`)
+  return docsPromise
+}
+
+function loadShard(key: string): Promise<Shard> {
+  let shard = shardCache.get(key)
+  if (!shard) {
+    shard = getJson<Shard>(`${BASE_URL}/terms/${key}.json`)
+    shardCache.set(key, shard)
+  }
+  return shard
+}
+
+function stem(word: string, meta: SearchMeta): string {
+  for (const suffix of meta.suffixes) {
+    if (word.endsWith(suffix) && word.length - suffix.length >= meta.min_stem) {
+      return word.slice(0, -suffix.length)
+    }
+  }
+  return word
+}
+
+export function normalize(text: string, meta: SearchMeta): string[] {
+  let folded = ''
+  for (const ch of text) folded += meta.fold[ch] ?? ch
+  folded = folded.toLowerCase().normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '')
+  const stopwords = new Set(meta.stopwords)
+  return (folded.match(/[a-z0-9]+/g) || [])
+    .filter((word) => word.length > 1 && !stopwords.has(word))
+    .map((word) => stem(word, meta))
+}
+
+export async function search(query: string, limit = 20): Promise<SearchResult[]> {
+  const meta = await loadMeta()
+  const terms = normalize(query, meta)
+  if (terms.length === 0) return []
+
+  const available = new Set(meta.shards)
+  const matches = await Promise.all(terms.map(async (term, i) => {
+    const scores = new Map<number, number>()
+    const key = term.slice(0, meta.prefix_length)
+    if (!available.has(key)) return scores
+
+    const shard = await loadShard(key)
+    // Posledné slovo sa hľadá aj ako prefix (počas písania)
+    const keys = i === terms.length - 1
+      ? Object.keys(shard).filter((t) => t.startsWith(term))
+      : (shard[term] ? [term] : [])
+    for (const t of keys) {
+      const postings = shard[t]
+      const idf = Math.log(1 + meta.docs / (postings.length / 2))
+      for (let j = 0; j < postings.length; j += 2) {
+        scores.set(postings[j], (scores.get(postings[j]) || 0) + postings[j + 1] * idf)
+      }
+    }
+    return scores
+  }))
+
+  // Všetky slová musia byť v článku
+  const docs = await loadDocs()
+  const results: SearchResult[] = []
+  matches[0].forEach((score, docId) => {
+    let total = score
+    for (const other of matches.slice(1)) {
+      const s = other.get(docId)
+      if (s === undefined) return
+      total += s
+    }
+    const [slug, title, date] = docs[docId]
+    results.push({ slug, title, date, score: total })
+  })
+  return results.sort((a, b) => b.score - a.score).slice(0, limit)
+}
+"""
+        lib_dir = self.project_dir / "lib"
+        lib_dir.mkdir(parents=True, exist_ok=True)
+        with open(lib_dir / "search.ts", 'w') as f:
+            f.write(search_lib)
+
+        search_page = """'use client'
+
+import { useEffect, useState } from 'react'
+import Link from 'next/link'
+import { search, SearchResult } from '@/lib/search'
+
+export default function SearchPage() {
+  const [query, setQuery] = useState('')
+  const [results, setResults] = useState<SearchResult[]>([])
+
+  useEffect(() => {
+    let cancelled = false
+    const timer = setTimeout(() => {
+      search(query)
+        .then((found) => { if (!cancelled) setResults(found) })
+        .catch(() => { if (!cancelled) setResults([]) })
+    }, 150)
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
+  }, [query])
+
+  return (
+    <div className="container mx-auto px-4 py-8 max-w-3xl">
+      <h1 className="text-4xl font-heading font-bold text-primary mb-6">Hľadať</h1>
+      <input
+        type="search"
+        value={query}
+        onChange={(e) => setQuery(e.target.value)}
+        placeholder="napr. hradisko, Veľká Morava, Perún..."
+        className="w-full border border-gray-300 rounded-lg px-4 py-3 mb-6"
+        autoFocus
+      />
+      {query && results.length === 0 && <p className="text-gray-500">Nič sa nenašlo.</p>}
+      <ul className="space-y-4">
+        {results.map((result) => (
+          <li key={result.slug}>
+            <Link href={`/article/${result.slug}`} className="text-xl text-primary hover:underline">
+              {result.title}
+            </Link>
+            {result.date && <p className="text-sm text-gray-500">{result.date}</p>}
+          </li>
+        ))}
+      </ul>
+    </div>
+  )
+}
+"""
+        page_dir = self.project_dir / "app" / "hladat"
+        page_dir.mkdir(parents=True, exist_ok=True)
+        with open(page_dir / "page.tsx", 'w') as f:
+            f.write(search_page)
+
+        print("Vyhľadávanie vytvorené")
+
+    def create_archive(self):
+        """Vytvorí archív /archiv (roky a mesiace) a /archiv/[obdobie] zo súborov content/data/api/archive"""
+        archive_lib = """import fs from 'fs'
+import path from 'path'
+
+// Archív generuje converter.py (už zoradený od najnovších) - stránky len čítajú JSON
+const archiveDir = path.join(process.cwd(), 'content', 'data', 'api', 'archive')
+
+export const MONTHS = [
+  'január', 'február', 'marec', 'apríl', 'máj', 'jún',
+  'júl', 'august', 'september', 'október', 'november', 'december',
+]
+
+export interface ArchiveIndex {
+  total: number
+  undated: number
+  years: { year: string; count: number; months: { month: string; count: number }[] }[]
+}
+
+export interface ArchiveArticle {
+  title: string
+  slug: string
+  date: string | null
+  categories: string[]
+}
+
+export function archiveIndex(): ArchiveIndex {
+  const file = path.join(archiveDir, 'index.json')
+  if (!fs.existsSync(file)) return { total: 0, undated: 0, years: [] }
+  return JSON.parse(fs.readFileSync(file, 'utf-8'))
+}
+
+// Obdobie 'YYYY', 'YYYY-MM' alebo 'undated'; null ak taký súbor nie je
+export function archiveArticles(period: string): ArchiveArticle[] | null {
+  if (!/^(\\d{4}(-\\d{2})?|undated)$/.test(period)) return null
+  const file = path.join(archiveDir, `${period}.json`)
+  if (!fs.existsSync(file)) return null
+  return JSON.parse(fs.readFileSync(file, 'utf-8'))
+}
+
+export function periodTitle(period: string): string {
+  if (period === 'undated') return 'Bez dátumu'
+  const [year, month] = period.split('-')
+  return month ? `${MONTHS[parseInt(month) - 1]} ${year}` : year
+}
+"""
+        archive_page = """import Link from 'next/link'
+import { archiveIndex, MONTHS } from '@/lib/archive'
+
+export default function ArchivePage() {
+  const index = archiveIndex()
+
+  return (
+    <div className="container mx-auto px-4 py-8 max-w-3xl">
+      <h1 className="text-4xl font-heading font-bold text-primary mb-6">Archív</h1>
+      {index.years.map((year) => (
+        <section key={year.year} className="mb-6">
+          <h2 className="text-2xl font-heading mb-2">
+            <Link href={`/archiv/${year.year}`} className="text-primary hover:underline">
+              {year.year}
+            </Link>
+            <span className="text-gray-500 text-base ml-2">({year.count})</span>
+          </h2>
+          <ul className="flex flex-wrap gap-x-4 gap-y-1">
+            {year.months.map((m) => (
+              <li key={m.month}>
+                <Link href={`/archiv/${m.month}`} className="hover:underline">
+                  {MONTHS[parseInt(m.month.slice(5)) - 1]}
+                </Link>
+                <span className="text-gray-500 ml-1">({m.count})</span>
+              </li>
+            ))}
+          </ul>
+        </section>
+      ))}
+      {index.undated > 0 && (
+        <Link href="/archiv/undated" className="text-gray-500 hover:underline">
+          Bez dátumu ({index.undated})
+        </Link>
+      )}
+    </div>
+  )
+}
+"""
+        period_page = """import Link from 'next/link'
+import { notFound } from 'next/navigation'
+import { archiveArticles, periodTitle } from '@/lib/archive'
+
+export default function ArchivePeriodPage({ params }: { params: { period: string } }) {
+  const articles = archiveArticles(params.period)
+  if (!articles) notFound()
+
+  return (
+    <div className="container mx-auto px-4 py-8 max-w-3xl">
+      <Link href="/archiv" className="text-gray-500 hover:underline">&larr; Archív</Link>
+      <h1 className="text-4xl font-heading font-bold text-primary mt-2 mb-6">
+        {periodTitle(params.period)}
+      </h1>
+      <ul className="space-y-4">
+        {articles.map((article) => (
+          <li key={article.slug}>
+            <Link href={`/article/${article.slug}`} className="text-xl text-primary hover:underline">
+              {article.title}
+            </Link>
+            {article.date && <p className="text-sm text-gray-500">{article.date}</p>}
+          </li>
+        ))}
+      </ul>
+    </div>
+  )
+}
+"""
+        lib_dir = self.project_dir / "lib"
+        lib_dir.mkdir(parents=True, exist_ok=True)
+        with open(lib_dir / "archive.ts", 'w') as f:
+            f.write(archive_lib)
+
+        page_dir = self.project_dir / "app" / "archiv"
+        (page_dir / "[period]").mkdir(parents=True, exist_ok=True)
+        with open(page_dir / "page.tsx", 'w') as f:
+            f.write(archive_page)
+        with open(page_dir / "[period]" / "page.tsx", 'w') as f:
+            f.write(period_page)
+
+        print("Archív vytvorený")
+
+    def create_map(self):
+        """Vytvorí mapu hradísk (/mapa) nad dlaždicami public/geo - načítavajú sa len dlaždice vo výreze"""
+        geo_lib = """// Dlaždice mapy generuje converter.py (geo_index.py) do public/geo/<z>/<x>/<y>.json.
+// index.json vymenúva existujúce dlaždice, takže sa nepýtame na prázdne.
+
+export interface GeoIndex {
+  tile_size: number
+  minzoom: number
+  maxzoom: number
+  bounds: [number, number, number, number] | null
+  points: number
+  tiles: Record<string, string[]>
+}
+
+export interface GeoFeature {
+  type: 'Feature'
+  geometry: { type: 'Point'; coordinates: [number, number] }
+  bbox?: [number, number, number, number]
+  properties: {
+    cluster?: boolean
+    count?: number
+    articles?: { slug: string; title: string }[]
+  }
+}
+
+let indexPromise: Promise<GeoIndex> | null = null
+const tileCache = new Map<string, Promise<GeoFeature[]>>()
+
+export function loadGeoIndex(): Promise<GeoIndex> {
+  if (!indexPromise) {
+    indexPromise = fetch('/geo/index.json').then((r) => r.json())
+  }
+  return indexPromise
+}
+
+export function loadTile(key: string): Promise<GeoFeature[]> {
+  let tile = tileCache.get(key)
+  if (!tile) {
+    tile = fetch(`/geo/${key}.json`)
+      .then((r) => (r.ok ? r.json() : { features: [] }))
+      .then((data) => data.features)
+    tileCache.set(key, tile)
+  }
+  return tile
+}
+
+// Web Mercator - rovnaký výpočet ako world_pixel v geo_index.py
+export function tileXY(lat: number, lon: number, zoom: number): [number, number] {
+  const scale = 2 ** zoom
+  const sinLat = Math.sin((Math.max(-85, Math.min(85, lat)) * Math.PI) / 180)
+  const x = ((lon + 180) / 360) * scale
+  const y = (0.5 - Math.log((1 + sinLat) / (1 - sinLat)) / (4 * Math.PI)) * scale
+  return [Math.floor(x), Math.floor(y)]
+}
+
+// Existujúce dlaždice úrovne zoom, ktoré pretína výrez (juh, západ, sever, východ)
+export function visibleTiles(index: GeoIndex, zoom: number,
+                             south: number, west: number, north: number, east: number): string[] {
+  const existing = new Set(index.tiles[String(zoom)] || [])
+  const [x0, y0] = tileXY(north, Math.max(-180, west), zoom)
+  const [x1, y1] = tileXY(south, Math.min(179.9999, east), zoom)
+  const keys: string[] = []
+  for (let x = x0; x <= x1; x++) {
+    for (let y = y0; y <= y1; y++) {
+      if (existing.has(`${x}/${y}`)) keys.push(`${zoom}/${x}/${y}`)
+    }
+  }
+  return keys
+}
+"""
+        map_page = """'use client'
+
+import { useEffect, useRef } from 'react'
+import 'leaflet/dist/leaflet.css'
+import { loadGeoIndex, loadTile, visibleTiles } from '@/lib/geo'
+
+function escapeHtml(text: string): string {
+  return text.replace(/[&<>"']/g, (c) => `&#${c.charCodeAt(0)};`)
+}
+
+export default function MapPage() {
+  const container = useRef<HTMLDivElement>(null)
+
+  useEffect(() => {
+    let cancelled = false
+    let map: any = null
+
+    async function init() {
+      const L = (await import('leaflet')).default
+      const index = await loadGeoIndex()
+      if (cancelled || !container.current) return
+
+      map = L.map(container.current)
+      L.tileLayer('https://tile.openstreetmap.org/{z}/{x}/{y}.png', {
+        attribution: '&copy; OpenStreetMap',
+        maxZoom: 18,
+      }).addTo(map)
+      if (index.bounds) {
+        const [west, south, east, north] = index.bounds
+        map.fitBounds([[south, west], [north, east]], { padding: [20, 20] })
+      } else {
+        map.setView([48.7, 19.5], 7)
+      }
+
+      const layer = L.layerGroup().addTo(map)
+      let request = 0
+
+      async function refresh() {
+        const current = ++request
+        const zoom = Math.min(Math.max(Math.floor(map.getZoom()), index.minzoom), index.maxzoom)
+        const view = map.getBounds()
+        const keys = visibleTiles(index, zoom, view.getSouth(), view.getWest(), view.getNorth(), view.getEast())
+        const tiles = await Promise.all(keys.map(loadTile))
+        if (cancelled || current !== request) return
+
+        layer.clearLayers()
+        for (const feature of tiles.flat()) {
+          const [lon, lat] = feature.geometry.coordinates
+          if (feature.properties.cluster && feature.bbox) {
+            const [west, south, east, north] = feature.bbox
+            L.marker([lat, lon], {
+              icon: L.divIcon({
+                className: '',
+                html: `<div class="bg-primary text-white rounded-full w-9 h-9 flex items-center justify-center font-bold shadow">${feature.properties.count}</div>`,
+                iconSize: [36, 36],
+              }),
+            })
+              .on('click', () => map.fitBounds([[south, west], [north, east]], { padding: [40, 40] }))
+              .addTo(layer)
+          } else {
+            const links = (feature.properties.articles || [])
+              .map((a) => `<a href="/article/${encodeURIComponent(a.slug)}">${escapeHtml(a.title)}</a>`)
+              .join('<br>')
+            L.circleMarker([lat, lon], { radius: 7, weight: 2, color: '#8B4513', fillOpacity: 0.7 })
+              .bindPopup(links)
+              .addTo(layer)
+          }
+        }
+      }
+
+      map.on('moveend', refresh)
+      refresh()
+    }
+
+    init()
+    return () => {
+      cancelled = true
+      if (map) map.remove()
+    }
+  }, [])
+
+  return (
+    <div className="container mx-auto px-4 py-8">
+      <h1 className="text-4xl font-heading font-bold text-primary mb-6">Mapa hradísk</h1>
+      <div ref={container} className="w-full h-[70vh] rounded-lg shadow" />
+    </div>
+  )
+}
+"""
+        lib_dir = self.project_dir / "lib"
+        lib_dir.mkdir(parents=True, exist_ok=True)
+        with open(lib_dir / "geo.ts", 'w') as f:
+            f.write(geo_lib)
+
+        page_dir = self.project_dir / "app" / "mapa"
+        page_dir.mkdir(parents=True, exist_ok=True)
+        with open(page_dir / "page.tsx", 'w') as f:
+            f.write(map_page)
+
+        print("Mapa vytvorená")
+
     def install_dependencies(self):
         """Nainštaluje npm dependencies"""
         print("Inštalujem npm packages...")
@@ -573,6 +1350,11 @@ def main():
     # Vytvorenie štruktúry aplikácie
     setup.create_app_structure()
     setup.create_components()
+    setup.create_image_helpers()
+    setup.create_article_page()
+    setup.create_search()
+    setup.create_archive()
+    setup.create_map()
     setup.create_api_routes()
 
     # Inštalácia dependencies
@@ -0,0 +1,42 @@
+"""
+Zápis statických JSON súborov pre Next.js
+Súbor sa prepíše len pri zmene obsahu (nezmenené si nechajú čas aj cache),
+súbory, ktoré už nevznikajú, sa zmažú.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+
+def dump_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def write_json_if_changed(path: Path, data) -> bool:
+    text = dump_json(data)
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+    return True
+
+def sync_json_tree(out_dir, files: Dict[str, object]) -> Tuple[int, int]:
+    """
+    Zapíše {relatívna cesta: dáta} pod out_dir a zmaže ostatné .json súbory
+    (aj prázdne priečinky). Vráti (zapísaných, zmazaných).
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = sum(write_json_if_changed(out_dir / rel, data) for rel, data in files.items())
+
+    removed = 0
+    for stale in out_dir.rglob("*.json"):
+        if stale.relative_to(out_dir).as_posix() not in files:
+            stale.unlink()
+            removed += 1
+    for dirpath, _, _ in sorted(os.walk(out_dir), key=lambda x: -len(x[0])):
+        if Path(dirpath) != out_dir and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return written, removed
@@ -21,6 +21,8 @@ import re
 import markdown
 from bs4 import BeautifulSoup
 
+from mdx_frontmatter import read_mdx
+
 class WordExporter:
     def __init__(self, content_dir: str = "../nextjs-app/content", output_dir: str = "../word-export"):
         self.content_dir = Path(content_dir)
@@ -242,7 +244,7 @@ class WordExporter:
 
         # Metadáta
         metadata = doc.add_paragraph()
-        metadata.add_run(f"Dátum: {article_data.get('date', 'Neznámy')}\n")
+        metadata.add_run(f"Dátum: {article_data.get('date') or 'Neznámy'}\n")
         metadata.add_run(f"Autor: {article_data.get('author', 'hradiska.sk')}\n")
         if article_data.get('categories'):
             metadata.add_run(f"Kategórie: {', '.join(article_data['categories'])}\n")
@@ -290,23 +292,13 @@ class WordExporter:
                 print(f"Súbor {mdx_file} neexistuje!")
                 continue
 
-            with open(mdx_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Rozdelenie na frontmatter a obsah
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    article_content = parts[2]
-                else:
-                    article_content = content
-            else:
-                article_content = content
+            # Obsah bez frontmatteru
+            article_content = read_mdx(mdx_file).body
 
             # Príprava dát článku
             article_data = {
                 'title': article_info['title'],
-                'date': article_info.get('date', ''),
+                'date': article_info.get('date') or '',
                 'categories': article_info.get('categories', []),
                 'tags': article_info.get('tags', []),
                 'content': article_content
@@ -363,21 +355,8 @@ class WordExporter:
                 # Načítanie obsahu
                 mdx_file = self.content_dir / "posts" / article_info['file']
                 if mdx_file.exists():
-                    with open(mdx_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Rozdelenie na frontmatter a obsah
-                    if content.startswith('---'):
-                        parts = content.split('---', 2)
-                        if len(parts) >= 3:
-                            article_content = parts[2]
-                        else:
-                            article_content = content
-                    else:
-                        article_content = content
-
-                    # Pridanie obsahu
-                    self.markdown_to_word(article_content, doc)
+                    # Pridanie obsahu (bez frontmatteru)
+                    self.markdown_to_word(read_mdx(mdx_file).body, doc)
 
                 doc.add_page_break()
 
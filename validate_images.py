@@ -0,0 +1,280 @@
+"""
+Validácia obrázkov v mirrore
+Kontroluje magic bytes, ukončenie súboru (EOI pri JPEG, IEND pri PNG, trailer pri GIF)
+a Pillow verify v paralelných procesoch. Výsledky sa cachujú podľa hashu obsahu,
+poškodené súbory sa vypíšu aj so zdrojovými URL na opätovné stiahnutie.
+"""
+
+import io
+import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from PIL import Image
+
+from mirror_manifest import hash_files, iter_files
+
+# Pri zmene kontrol zvýš verziu - staré výsledky v cache sa ignorujú
+CHECK_VERSION = 1
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.jfif', '.png', '.gif', '.webp',
+                    '.tif', '.tiff', '.bmp', '.ico', '.svg')
+
+# Formát -> možné začiatky súboru
+SIGNATURES = {
+    'jpeg': (b'\xff\xd8\xff',),
+    'png': (b'\x89PNG\r\n\x1a\n',),
+    'gif': (b'GIF87a', b'GIF89a'),
+    'tiff': (b'II*\x00', b'MM\x00*'),
+    'bmp': (b'BM',),
+    'ico': (b'\x00\x00\x01\x00',),
+}
+
+_URL_RE = re.compile(r'''(?:src|href)\s*=\s*["']([^"']+)["']''', re.IGNORECASE)
+
+def sniff_format(head: bytes) -> Optional[str]:
+    """Určí formát obrázka podľa prvých bajtov"""
+    for fmt, prefixes in SIGNATURES.items():
+        if head.startswith(prefixes):
+            return fmt
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    text = head.lstrip(b'\xef\xbb\xbf \t\r\n').lower()
+    if text.startswith((b'<svg', b'<?xml')) and b'<svg' in head.lower():
+        return 'svg'
+    return None
+
+def _has_end_marker(fmt: str, data: bytes) -> bool:
+    """Overí, že súbor nie je useknutý (toleruje výplň nulami za koncom)"""
+    tail = data.rstrip(b'\x00')[-1024:]
+    if fmt == 'jpeg':
+        return b'\xff\xd9' in tail
+    if fmt == 'png':
+        return b'IEND' in tail[-12:]
+    if fmt == 'gif':
+        return tail.endswith(b'\x3b')
+    return True
+
+def check_image(path: Union[str, Path]) -> Tuple[str, str]:
+    """
+    Skontroluje jeden obrázok. Vráti (stav, detail), stav je
+    'ok', 'empty', 'bad-magic', 'truncated' alebo 'decode-error'.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        return 'decode-error', str(e)[:80]
+
+    if not data:
+        return 'empty', "prázdny súbor"
+
+    fmt = sniff_format(data[:512])
+    if fmt is None:
+        # Typicky HTML chybová stránka uložená pod menom obrázka
+        return 'bad-magic', repr(data[:16])
+    if fmt == 'svg':
+        return ('ok', fmt) if b'</svg' in data[-1024:].lower() else ('truncated', "chýba </svg>")
+
+    if not _has_end_marker(fmt, data):
+        return 'truncated', f"{fmt}: chýba koncová značka"
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            img.verify()
+    except Exception as e:
+        return 'decode-error', f"{fmt}: {str(e)[:70]}"
+
+    return 'ok', fmt
+
+def _check_worker(path: str) -> Tuple[str, str, str]:
+    return (path,) + check_image(path)
+
+class ImageCheckCache:
+    """Výsledky kontrol podľa hashu obsahu (rovnaký obrázok na viacerých miestach sa kontroluje raz)"""
+
+    def __init__(self, cache_file: Union[str, Path]):
+        self.cache_file = Path(cache_file)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.cache_file))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS checks (
+                digest TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                detail TEXT NOT NULL
+            )
+        """)
+
+    def get_many(self, digests: List[str]) -> Dict[str, Tuple[str, str]]:
+        found = {}
+        for digest in set(digests):
+            row = self.conn.execute(
+                "SELECT status, detail FROM checks WHERE digest = ? AND version = ?",
+                (digest, CHECK_VERSION)
+            ).fetchone()
+            if row:
+                found[digest] = (row[0], row[1])
+        return found
+
+    def put(self, digest: str, status: str, detail: str):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO checks VALUES (?, ?, ?, ?)",
+            (digest, CHECK_VERSION, status, detail)
+        )
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def default_cache_file(mirror_dir: Union[str, Path]) -> Path:
+    return Path(mirror_dir).parent / ".cache" / "image_checks.sqlite"
+
+def validate_images(mirror_dir: Union[str, Path], workers: Optional[int] = None,
+                    use_cache: bool = True) -> Dict:
+    """
+    Skontroluje všetky obrázky mirroru. Vráti {'results': {cesta: (stav, detail)},
+    'checked': počet dekódovaných, 'cached': počet z cache}.
+    """
+    mirror_dir = Path(mirror_dir)
+    images = sorted(
+        rel for rel, _, _ in iter_files(mirror_dir)
+        if os.path.splitext(rel)[1].lower() in IMAGE_EXTENSIONS
+    )
+
+    digests = hash_files(mirror_dir, images)
+    results: Dict[str, Tuple[str, str]] = {}
+
+    cache = ImageCheckCache(default_cache_file(mirror_dir)) if use_cache else None
+    try:
+        cached = cache.get_many([d for d in digests.values() if d]) if cache else {}
+
+        pending = []
+        for rel in images:
+            digest = digests.get(rel)
+            if digest in cached:
+                results[rel] = cached[digest]
+            else:
+                pending.append(rel)
+
+        # Obsah sa dekóduje len raz pre každý hash
+        unique: Dict[Optional[str], str] = {}
+        for rel in pending:
+            unique.setdefault(digests.get(rel) or rel, rel)
+
+        jobs = [str(mirror_dir / rel) for rel in unique.values()]
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            checked = {
+                path: (status, detail)
+                for path, status, detail in pool.map(_check_worker, jobs,
+                                                     chunksize=max(1, len(jobs) // (workers * 4)))
+            }
+
+        for key, rel in unique.items():
+            outcome = checked[str(mirror_dir / rel)]
+            if cache and digests.get(rel):
+                cache.put(key, *outcome)
+        for rel in pending:
+            results[rel] = checked[str(mirror_dir / unique[digests.get(rel) or rel])]
+    finally:
+        if cache:
+            cache.close()
+
+    return {'results': results, 'checked': len(jobs), 'cached': len(images) - len(pending)}
+
+def find_source_urls(mirror_dir: Union[str, Path], targets: List[str]) -> Dict[str, List[str]]:
+    """
+    Nájde pôvodné URL obrázkov: prejde odkazy v HTML stránkach mirroru
+    a zmapuje ich na lokálne cesty rovnako ako downloader.
+    """
+    from urllib.parse import urljoin
+    from download_mirror import BASE_URL, url_to_local_path
+
+    mirror_dir = Path(mirror_dir)
+    wanted = set(targets)
+    sources: Dict[str, List[str]] = {rel: [] for rel in targets}
+
+    for rel, _, _ in iter_files(mirror_dir):
+        if not rel.endswith('.html'):
+            continue
+        try:
+            text = (mirror_dir / rel).read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            continue
+        page_url = urljoin(BASE_URL, rel)
+        for raw in set(_URL_RE.findall(text)):
+            # Rýchly filter na reťazci - väčšina odkazov nie sú obrázky
+            path = raw.split('#', 1)[0].split('?', 1)[0]
+            if os.path.splitext(path)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            url = urljoin(page_url, raw.replace('&amp;', '&'))
+            if not url.startswith('http'):
+                continue
+            local = url_to_local_path(url, mirror_dir).relative_to(mirror_dir).as_posix()
+            if local in wanted and url not in sources[local]:
+                sources[local].append(url)
+
+    return sources
+
+def main():
+    import argparse
+    import sys
+    import time
+
+    # UTF-8 encoding pre Windows
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+    parser = argparse.ArgumentParser(description="Validácia obrázkov v mirrore")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="počet procesov")
+    parser.add_argument('--bez-cache', action='store_true', help="skontrolovať všetko nanovo")
+    parser.add_argument('--zoznam', metavar='SUBOR', help="zapísať URL poškodených obrázkov (na opätovné stiahnutie)")
+    args = parser.parse_args()
+
+    started = time.time()
+    print(f"🖼️  Kontrolujem obrázky v {args.mirror}...")
+    report = validate_images(args.mirror, args.workers, use_cache=not args.bez_cache)
+    results = report['results']
+
+    broken = {rel: outcome for rel, outcome in results.items() if outcome[0] != 'ok'}
+    print(f"✅ Obrázkov: {len(results)} (dekódovaných: {report['checked']}, z cache: {report['cached']}) "
+          f"za {time.time() - started:.1f}s")
+
+    if not broken:
+        print("✅ Všetky obrázky sú v poriadku")
+        return 0
+
+    print(f"❌ Poškodené obrázky: {len(broken)}")
+    print("-" * 60)
+    sources = find_source_urls(args.mirror, sorted(broken))
+    refetch = []
+    for rel in sorted(broken):
+        status, detail = broken[rel]
+        print(f"  • {rel}")
+        print(f"    {status}: {detail}")
+        for url in sources[rel]:
+            print(f"    🔗 {url}")
+            refetch.append(url)
+        if not sources[rel]:
+            print(f"    ⚠️  Zdrojová URL sa nenašla")
+
+    if args.zoznam:
+        Path(args.zoznam).write_text("".join(f"{url}\n" for url in refetch), encoding='utf-8')
+        print(f"\n💾 Zoznam URL na stiahnutie: {args.zoznam} ({len(refetch)})")
+
+    return 1
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
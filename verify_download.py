@@ -3,13 +3,119 @@ Verifikačný skript pre kontrolu stiahnutého mirror hradiska.sk
 """
 
 import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from collections import defaultdict
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlunparse
+
+from check_links import collect_references
+from download_mirror import BASE_URL, url_to_local_path
+from html_rewriter import atomic_write_text
+
+# Typy súborov podľa prípony
+FILE_TYPES = {
+    '.html': 'HTML', '.htm': 'HTML',
+    '.jpg': 'Obrázky', '.jpeg': 'Obrázky', '.png': 'Obrázky', '.gif': 'Obrázky',
+    '.webp': 'Obrázky', '.svg': 'Obrázky', '.ico': 'Obrázky',
+    '.css': 'CSS',
+    '.js': 'JavaScript',
+    '.xml': 'XML',
+    '.txt': 'Text',
+}
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg')
+
+def scan_mirror(mirror_path: Path) -> dict:
+    """
+    Jeden prechod stromom mirroru cez os.scandir.
+    Zozbiera štatistiky typov, veľkosti, roky, HTML súbory, obrázky
+    a počty súborov v prvých dvoch úrovniach priečinkov.
+    """
+    scan = {
+        'stats': defaultdict(int),
+        'total_size': 0,
+        'years': set(),
+        'html_files': [],    # (cesta, veľkosť)
+        'image_files': [],   # (cesta, veľkosť)
+        'dirs_structure': {},
+    }
+
+    # Priečinky v rovnakom poradí ako os.walk (zhora nadol), na tom závisí
+    # poradie priečinkov s rovnakým počtom súborov vo výpise štruktúry
+    stack = [(str(mirror_path), (), 0)]
+    while stack:
+        dir_path, parts, level = stack.pop()
+        file_count = 0
+        subdirs = []
 
-def analyze_local_mirror(mirror_dir: str = "backup/hradiska_mirror"):
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Odkazy na priečinky sa nezapočítajú ani neprechádzajú (ako os.walk)
+                    if not entry.is_symlink():
+                        subdirs.append((entry.path, parts + (entry.name,), level + 1))
+                    continue
+                file_count += 1
+
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                scan['total_size'] += size
+
+                # Zoznamy HTML a obrázkov rozlišujú veľkosť písmen prípony (ako glob)
+                suffix = os.path.splitext(entry.name)[1]
+                ext = suffix.lower()
+                file_type = FILE_TYPES.get(ext, 'Ostatné')
+                scan['stats'][file_type] += 1
+
+                if file_type == 'HTML':
+                    # Extrakcia roku z cesty
+                    for part in parts:
+                        if part.isdigit() and len(part) == 4 and 2000 <= int(part) <= 2030:
+                            scan['years'].add(part)
+                    if suffix == '.html':
+                        scan['html_files'].append((entry.path, size))
+                elif suffix in IMAGE_EXTENSIONS:
+                    scan['image_files'].append((entry.path, size))
+
+        if 1 <= level <= 2:
+            scan['dirs_structure'][os.path.join(*parts)] = file_count
+        stack.extend(reversed(subdirs))
+
+    return scan
+
+def check_html_file(path: str) -> bool:
+    """Overí, či súbor vyzerá ako HTML - číta po blokoch, kým nenájde <html alebo <body"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            tail = ''
+            while True:
+                chunk = f.read(64 * 1024)
+                if not chunk:
+                    return False
+                text = tail + chunk.lower()
+                if '<html' in text or '<body' in text:
+                    return True
+                tail = text[-5:]
+    except Exception:
+        return False
+
+def analyze_local_mirror(mirror_dir: str = "backup/hradiska_mirror", workers: int = None):
     """Analyzuje lokálny mirror a vytvorí report"""
 
     mirror_path = Path(mirror_dir)
@@ -23,47 +129,16 @@ def analyze_local_mirror(mirror_dir: str = "backup/hradiska_mirror"):
     print("=" * 60)
     print()
 
+    # Jeden prechod stromom - všetky ďalšie kontroly pracujú s jeho výsledkom
+    scan = scan_mirror(mirror_path)
+    stats = scan['stats']
+    total_size = scan['total_size']
+    years = scan['years']
+
     # 1. Základné štatistiky súborov
     print("📊 ANALÝZA SÚBOROV:")
     print("-" * 60)
 
-    stats = defaultdict(int)
-    total_size = 0
-    years = set()
-
-    for root, dirs, files in os.walk(mirror_path):
-        for file in files:
-            filepath = Path(root) / file
-
-            # Veľkosť
-            try:
-                size = filepath.stat().st_size
-                total_size += size
-            except:
-                continue
-
-            # Typ súboru
-            ext = filepath.suffix.lower()
-            if ext in ['.html', '.htm']:
-                stats['HTML'] += 1
-                # Extrakcia roku z cesty
-                parts = filepath.parts
-                for part in parts:
-                    if part.isdigit() and len(part) == 4 and 2000 <= int(part) <= 2030:
-                        years.add(part)
-            elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico']:
-                stats['Obrázky'] += 1
-            elif ext in ['.css']:
-                stats['CSS'] += 1
-            elif ext in ['.js']:
-                stats['JavaScript'] += 1
-            elif ext in ['.xml']:
-                stats['XML'] += 1
-            elif ext in ['.txt']:
-                stats['Text'] += 1
-            else:
-                stats['Ostatné'] += 1
-
     # Výpis štatistík
     total_files = sum(stats.values())
     print(f"✅ Celkový počet súborov: {total_files}")
@@ -108,26 +183,14 @@ def analyze_local_mirror(mirror_dir: str = "backup/hradiska_mirror"):
     print("🔗 KONTROLA HTML INTEGRITY:")
     print("-" * 60)
 
-    html_files = list(mirror_path.glob("**/*.html"))
-    empty_files = 0
-    small_files = 0
-    broken_files = 0
+    html_files = scan['html_files']
+    empty_files = sum(1 for _, size in html_files if size == 0)
+    small_files = sum(1 for _, size in html_files if 0 < size < 500)  # Podozrivo malé HTML súbory
 
-    for html_file in html_files:
-        try:
-            size = html_file.stat().st_size
-            if size == 0:
-                empty_files += 1
-            elif size < 500:  # Podozrivo malé HTML súbory
-                small_files += 1
-
-            # Skús načítať ako HTML
-            with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                if '<html' not in content.lower() and '<body' not in content.lower():
-                    broken_files += 1
-        except:
-            broken_files += 1
+    # Obsah sa kontroluje paralelne (čítanie súborov je I/O)
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        results = pool.map(check_html_file, [path for path, _ in html_files], chunksize=16)
+        broken_files = sum(1 for ok in results if not ok)
 
     print(f"✅ Skontrolovaných HTML súborov: {len(html_files)}")
     if empty_files > 0:
@@ -144,20 +207,9 @@ def analyze_local_mirror(mirror_dir: str = "backup/hradiska_mirror"):
     print("🖼️  KONTROLA OBRÁZKOV:")
     print("-" * 60)
 
-    image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg']
-    image_files = []
-    for ext in image_extensions:
-        image_files.extend(list(mirror_path.glob(f"**/*{ext}")))
-
-    empty_images = 0
-    small_images = 0
-
-    for img_file in image_files:
-        size = img_file.stat().st_size
-        if size == 0:
-            empty_images += 1
-        elif size < 100:  # Podozrivo malé obrázky
-            small_images += 1
+    image_files = scan['image_files']
+    empty_images = sum(1 for _, size in image_files if size == 0)
+    small_images = sum(1 for _, size in image_files if 0 < size < 100)  # Podozrivo malé obrázky
 
     print(f"✅ Celkový počet obrázkov: {len(image_files)}")
     if empty_images > 0:
@@ -166,19 +218,14 @@ def analyze_local_mirror(mirror_dir: str = "backup/hradiska_mirror"):
         print(f"⚠️  Podozrivo malé obrázky (<100B): {small_images}")
     else:
         print(f"✅ Všetky obrázky majú validnú veľkosť")
+    print("💡 Useknuté a poškodené obrázky odhalí: python validate_images.py")
     print()
 
     # 6. Kontrola štruktúry priečinkov
     print("📁 ŠTRUKTÚRA PRIEČINKOV:")
     print("-" * 60)
 
-    dirs_structure = defaultdict(int)
-    for root, dirs, files in os.walk(mirror_path):
-        level = root.replace(str(mirror_path), '').count(os.sep)
-        if level <= 2:  # Len prvé 2 úrovne
-            rel_path = os.path.relpath(root, mirror_path)
-            if rel_path != '.':
-                dirs_structure[rel_path] = len(files)
+    dirs_structure = scan['dirs_structure']
 
     # Zoraď podľa počtu súborov
     for dir_path, file_count in sorted(dirs_structure.items(), key=lambda x: x[1], reverse=True)[:15]:
@@ -254,6 +301,190 @@ def check_against_live_site():
 
     print("-" * 60)
 
+def build_url_inventory(mirror_dir: str = "backup/hradiska_mirror", base_url: str = BASE_URL,
+                        workers: int = None) -> dict:
+    """
+    Inventár URL stránok mirroru: url -> lokálna cesta (None, ak stránka lokálne chýba).
+    URL sa berú z odkazov v stránkach (mapované ako v downloaderi), stránky
+    bez odkazu na ne sa doplnia podľa cesty v mirrore.
+    """
+    mirror_path = Path(mirror_dir)
+    domain = urlparse(base_url).netloc
+    collected = collect_references(mirror_dir, base_url, workers)
+    index = collected['index']
+
+    inventory = {}
+    covered = set()
+    for url in collected['references']:
+        parsed = urlparse(url)
+        if parsed.netloc != domain:
+            continue
+        # Query sa pri ukladaní ignoruje - rovnaký súbor, jedna URL
+        url = urlunparse(parsed._replace(query='', fragment=''))
+        local = url_to_local_path(url, mirror_path).relative_to(mirror_path).as_posix()
+        if not local.endswith('.html') or url in inventory:
+            continue
+        inventory[url] = local if local in index else None
+        covered.add(local)
+
+    for rel in collected['pages']:
+        if rel not in covered and not rel.startswith(('feeds/', 'pages/')):
+            inventory[urljoin(base_url, rel)] = rel
+
+    return inventory
+
+class OriginChecker:
+    """
+    Paralelné podmienené požiadavky na originál (alebo lokálnu náhradu cez origin).
+    Validátory (ETag, Last-Modified) z minulého behu sa ukladajú do state_file,
+    takže ďalšie porovnanie stojí len odpovede 304. Uložia sa len vtedy, keď
+    popisujú lokálnu kópiu (spolu s jej veľkosťou a mtime) - po zmene lokálneho
+    súboru sa ignorujú a zmenená stránka sa nehlási ako nezmenená.
+    """
+
+    def __init__(self, base_url: str, origin: str = None, state_file: Path = None, timeout: int = 15):
+        self.base_url = base_url
+        self.origin = origin or base_url
+        self.state_file = state_file
+        self.timeout = timeout
+        self.local = threading.local()
+        self.validators = {}
+        if state_file and state_file.exists():
+            self.validators = json.loads(state_file.read_text(encoding='utf-8'))
+
+    def session(self) -> requests.Session:
+        # requests.Session nie je bezpečné zdieľať medzi vláknami
+        if not hasattr(self.local, 'session'):
+            self.local.session = requests.Session()
+            self.local.session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+        return self.local.session
+
+    def request_url(self, url: str) -> str:
+        if url.startswith(self.base_url):
+            return self.origin + url[len(self.base_url):]
+        return url
+
+    @staticmethod
+    def local_signature(local_file: Path) -> dict:
+        st = local_file.stat()
+        return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+    def check_present(self, url: str, local_file: Path):
+        """Podmienený GET pre stránku, ktorú mirror má; telo sa nesťahuje"""
+        signature = self.local_signature(local_file)
+        known = self.validators.get(url, {})
+        if known.get('local') != signature:
+            known = {}  # validátory patria k inej verzii lokálneho súboru
+        mtime = signature['mtime_ns'] / 1e9
+        headers = {'If-Modified-Since': known.get('last_modified') or formatdate(mtime, usegmt=True)}
+        if known.get('etag'):
+            headers['If-None-Match'] = known['etag']
+
+        with self.session().get(self.request_url(url), headers=headers, timeout=self.timeout,
+                                stream=True, verify=False) as response:
+            if response.status_code == 304:
+                self.remember(url, response, signature, known)
+                return 'unchanged'
+            if response.status_code in (404, 410):
+                return 'gone'
+            if response.status_code != 200:
+                return f"HTTP {response.status_code}"
+            if known:
+                return 'changed'
+
+            # Validátory zo zmenenej (alebo neoverenej) odpovede nepatria k lokálnej kópii
+            last_modified = response.headers.get('Last-Modified')
+            if last_modified:
+                upstream = parsedate_to_datetime(last_modified).timestamp()
+                if upstream > mtime:
+                    return 'changed'
+                self.remember(url, response, signature, known)
+                return 'unchanged'
+            return 'unknown'
+
+    def check_missing(self, url: str):
+        """HEAD pre stránku, na ktorú mirror odkazuje, ale nemá ju"""
+        response = self.session().head(self.request_url(url), timeout=self.timeout,
+                                       allow_redirects=True, verify=False)
+        if response.status_code == 200:
+            return 'missing'
+        if response.status_code in (404, 410):
+            return 'dead'
+        return f"HTTP {response.status_code}"
+
+    def remember(self, url: str, response, signature: dict, known: dict):
+        """Uloží validátory odpovede, ktorá zodpovedá lokálnemu súboru so signature"""
+        entry = dict(known, local=signature)
+        for header, key in (('ETag', 'etag'), ('Last-Modified', 'last_modified')):
+            if response.headers.get(header):
+                entry[key] = response.headers[header]
+        self.validators[url] = entry
+
+    def save(self):
+        if self.state_file:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.state_file, json.dumps(self.validators, ensure_ascii=False, indent=1))
+
+def compare_with_origin(mirror_dir: str = "backup/hradiska_mirror", base_url: str = BASE_URL,
+                        origin: str = None, workers: int = 16) -> dict:
+    """
+    Porovná mirror s originálom bez nového crawlu.
+    Vráti {stav: [url, ...]}, stavy: unchanged, changed (zmenené na origináli),
+    gone (zmiznuté z originálu), missing (chýba lokálne), dead, unknown, errors.
+    """
+    mirror_path = Path(mirror_dir)
+    inventory = build_url_inventory(mirror_dir, base_url)
+    checker = OriginChecker(base_url, origin, mirror_path.parent / ".cache" / "origin_validators.json")
+
+    def work(item):
+        url, local = item
+        try:
+            if local is None:
+                return url, checker.check_missing(url)
+            return url, checker.check_present(url, mirror_path / local)
+        except requests.RequestException as e:
+            return url, f"chyba: {str(e)[:50]}"
+
+    report = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for url, status in pool.map(work, sorted(inventory.items())):
+            if status.startswith(('HTTP', 'chyba')):
+                report['errors'].append(f"{url} ({status})")
+            else:
+                report[status].append(url)
+
+    checker.save()
+    return dict(report)
+
+def print_origin_report(report: dict, limit: int = 15):
+    print()
+    print("🌐 POROVNANIE MIRRORU S ORIGINÁLOM:")
+    print("-" * 60)
+
+    labels = [
+        ('unchanged', "✅ Nezmenené"),
+        ('unknown', "❔ Nedá sa určiť (originál neposiela Last-Modified)"),
+        ('changed', "✏️  Zmenené na origináli"),
+        ('gone', "❌ Zmiznuté z originálu"),
+        ('missing', "⬇️  Chýbajú lokálne (na origináli existujú)"),
+        ('dead', "💀 Odkazované, ale neexistujú ani na origináli"),
+        ('errors', "⚠️  Chyby"),
+    ]
+    for key, label in labels:
+        urls = report.get(key, [])
+        if not urls:
+            continue
+        print(f"{label}: {len(urls)}")
+        if key in ('unchanged', 'dead'):
+            continue
+        for url in urls[:limit]:
+            print(f"  • {url}")
+        if len(urls) > limit:
+            print(f"  ... a ďalších {len(urls) - limit}")
+    print("-" * 60)
+
 if __name__ == "__main__":
     import sys
     import io
@@ -263,11 +494,24 @@ if __name__ == "__main__":
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verifikácia stiahnutého mirroru")
+    parser.add_argument('--mirror', default="backup/hradiska_mirror", help="priečinok mirroru")
+    parser.add_argument('--porovnaj', action='store_true',
+                        help="porovnať všetky stránky mirroru s originálom (podmienené požiadavky)")
+    parser.add_argument('--origin', help="iný server namiesto originálu (napr. http://localhost:8000/)")
+    parser.add_argument('--workers', type=int, default=16, help="počet súbežných požiadaviek")
+    args = parser.parse_args()
+
     # Vypnutie SSL varovaní
     import urllib3
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     print()
-    analyze_local_mirror()
-    check_against_live_site()
+    if args.porovnaj:
+        print_origin_report(compare_with_origin(args.mirror, origin=args.origin, workers=args.workers))
+    else:
+        analyze_local_mirror(args.mirror)
+        check_against_live_site()
     print()